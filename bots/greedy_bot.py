@@ -21,16 +21,27 @@ def score_move(board: chess.Board, move: chess.Move) -> int:
     return 0
 
 
-def main() -> None:
-    """Read a FEN and output a greedy capture move."""
-    fen = sys.stdin.readline().strip()
+def choose_move(fen: str) -> str:
+    """Return the highest-value capture (or first legal move) for the given FEN."""
     board = chess.Board(fen)
     moves = list(board.legal_moves)
     if not moves:
-        print("0000")
-        return
+        return "0000"
     moves.sort(key=lambda mv: score_move(board, mv), reverse=True)
-    print(moves[0].uci())
+    return moves[0].uci()
+
+
+def main() -> None:
+    """Answer each FEN line on stdin with a greedy capture move.
+
+    One-shot runs send a single line; session runs keep stdin open. Clocked
+    matches send bots registered with ``send_clock`` a ``clock ...`` line after
+    each FEN, which this bot ignores.
+    """
+    for line in sys.stdin:
+        fen = line.strip()
+        if fen and not fen.startswith("clock"):
+            print(choose_move(fen), flush=True)
 
 
 if __name__ == "__main__":
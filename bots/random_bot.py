@@ -5,15 +5,26 @@ import sys
 import chess
 
 
-def main() -> None:
-    """Read a FEN and output a random legal move."""
-    fen = sys.stdin.readline().strip()
+def choose_move(fen: str) -> str:
+    """Return a random legal move for the given FEN."""
     board = chess.Board(fen)
     moves = list(board.legal_moves)
     if not moves:
-        print("0000")
-        return
-    print(random.choice(moves).uci())
+        return "0000"
+    return random.choice(moves).uci()
+
+
+def main() -> None:
+    """Answer each FEN line on stdin with a random legal move.
+
+    One-shot runs send a single line; session runs keep stdin open. Clocked
+    matches send bots registered with ``send_clock`` a ``clock ...`` line after
+    each FEN, which this bot ignores.
+    """
+    for line in sys.stdin:
+        fen = line.strip()
+        if fen and not fen.startswith("clock"):
+            print(choose_move(fen), flush=True)
 
 
 if __name__ == "__main__":
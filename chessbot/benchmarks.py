@@ -0,0 +1,350 @@
+"""Benchmark suite for the match pipeline, sandbox, standings and API.
+
+Run ``python -m chessbot.benchmarks --output bench.json`` to write results as JSON;
+pass ``--baseline old.json`` to fail when a benchmark got slower than the baseline
+by more than ``--tolerance``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+from unittest import mock
+from uuid import UUID, uuid4
+
+from chessbot.models import MatchRecord
+from chessbot.services.match_runner import BotConfig, MatchConfig, run_match
+from chessbot.services.ratings import recompute_ratings
+from chessbot.services.sandbox import fork_server, run_sandboxed
+from chessbot.services.scheduler import round_robin
+from chessbot.services.scoring import standings_from_totals, totals_for, white_score
+from chessbot.services.storage import Storage
+
+SCHEMA_VERSION = 1
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+QUICK_SIZES = (1_000, 10_000)
+RANDOM_BOT = ["python", "bots/random_bot.py"]
+GREEDY_BOT = ["python", "bots/greedy_bot.py"]
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1\n"
+SYNTHETIC_RESULTS = ("white", "black", "draw", "draw", "forfeit")
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing summary for one benchmark case."""
+
+    name: str
+    unit: str
+    samples: List[float]
+    params: Dict[str, object] = field(default_factory=dict)
+    throughput: Optional[float] = None
+    throughput_unit: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        """Serialize with summary statistics; raw samples are kept for re-analysis."""
+        ordered = sorted(self.samples)
+        payload = asdict(self)
+        payload.update(
+            key=self.key,
+            mean=statistics.fmean(ordered),
+            median=statistics.median(ordered),
+            p95=ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+            min=ordered[0],
+            max=ordered[-1],
+        )
+        return payload
+
+    @property
+    def key(self) -> str:
+        """Stable identifier used to match results against a baseline."""
+        params = ",".join(f"{name}={value}" for name, value in sorted(self.params.items()))
+        return f"{self.name}[{params}]" if params else self.name
+
+
+def _time(function: Callable[[], object], repeat: int) -> List[float]:
+    """Run ``function`` ``repeat`` times and return each wall time in seconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_sandbox_spawn(repeat: int) -> List[BenchmarkResult]:
+    """Latency of one one-shot move, from a fresh process and from a warm fork server."""
+    samples = _time(lambda: run_sandboxed(RANDOM_BOT, START_FEN, timeout_s=5.0), repeat)
+    server = fork_server(RANDOM_BOT)
+    server.run(START_FEN, timeout_s=5.0)
+    forked = _time(lambda: server.run(START_FEN, timeout_s=5.0), repeat)
+    return [
+        BenchmarkResult("sandbox_spawn", "s", samples),
+        BenchmarkResult("sandbox_spawn", "s", forked, params={"mode": "forkserver"}),
+    ]
+
+
+def bench_match(repeat: int, max_moves: int = 40) -> List[BenchmarkResult]:
+    """Plies per second of ``run_match`` with the bundled bots, per protocol."""
+    results = []
+    for protocol in ("oneshot", "session"):
+        white = BotConfig(uuid4(), "Random", RANDOM_BOT, protocol)
+        black = BotConfig(uuid4(), "Greedy", GREEDY_BOT, protocol)
+        config = MatchConfig(move_timeout_s=5.0, max_moves=max_moves)
+        samples, plies = [], 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            record = run_match(white, black, config).record
+            samples.append(time.perf_counter() - start)
+            plies += len(record.moves)
+        results.append(
+            BenchmarkResult(
+                "run_match",
+                "s",
+                samples,
+                params={"protocol": protocol, "max_moves": max_moves},
+                throughput=plies / sum(samples),
+                throughput_unit="plies/s",
+            )
+        )
+    return results
+
+
+def bench_round_robin(
+    sizes: Sequence[int], repeat: int, bots: int = 100
+) -> List[BenchmarkResult]:
+    """Time to schedule ``size`` pairings: enough rounds of ``bots // 2`` games each."""
+    bot_ids = [str(uuid4()) for _ in range(bots)]
+    results = []
+    for size in sizes:
+        rounds = max(1, size // (bots // 2))
+        samples = _time(lambda: round_robin(bot_ids, rounds=rounds), repeat)
+        results.append(
+            BenchmarkResult(
+                "round_robin",
+                "s",
+                samples,
+                params={"matches": size, "bots": bots},
+                throughput=rounds * (bots // 2) / statistics.fmean(samples),
+                throughput_unit="pairings/s",
+            )
+        )
+    return results
+
+
+def synthetic_matches(count: int, bot_ids: Sequence[UUID]) -> Iterator[MatchRecord]:
+    """Yield ``count`` finished matches between ``bot_ids`` without validation overhead."""
+    created_at = datetime.now(timezone.utc)
+    bots = len(bot_ids)
+    for index in range(count):
+        white = bot_ids[index % bots]
+        black = bot_ids[(index + 1 + (index // bots) % (bots - 1)) % bots]
+        result = SYNTHETIC_RESULTS[index % len(SYNTHETIC_RESULTS)]
+        yield MatchRecord.model_construct(
+            id=uuid4(),
+            white_bot_id=white,
+            black_bot_id=black,
+            result=result,
+            winner=None,
+            winner_id=black if result == "forfeit" else None,
+            moves=[],
+            duration_s=0.0,
+            created_at=created_at,
+            tournament_id=None,
+        )
+
+
+def bench_standings(
+    sizes: Sequence[int], repeat: int, bots: int = 100
+) -> List[BenchmarkResult]:
+    """Tally of ``size`` matches into sorted standings, the work behind ``compute_standings``.
+
+    Storage lookups are left out. Matches are generated lazily so a million records
+    never sit in memory; the samples therefore include record construction, as a
+    storage scan would.
+    """
+    bot_ids = [uuid4() for _ in range(bots)]
+    names = {bot_id: f"Bot{index}" for index, bot_id in enumerate(bot_ids)}
+
+    results = []
+    for size in sizes:
+        samples = _time(
+            lambda: standings_from_totals(
+                totals_for(synthetic_matches(size, bot_ids), names.__getitem__),
+                names.__getitem__,
+            ),
+            repeat,
+        )
+        results.append(
+            BenchmarkResult(
+                "standings_tally",
+                "s",
+                samples,
+                params={"matches": size, "bots": bots},
+                throughput=size / statistics.fmean(samples),
+                throughput_unit="matches/s",
+            )
+        )
+    return results
+
+
+def bench_ratings(
+    sizes: Sequence[int], repeat: int, bots: int = 100
+) -> List[BenchmarkResult]:
+    """Full Elo/Glicko-2 recompute over ``size`` games (vectorized when NumPy is present)."""
+    bot_ids = [uuid4() for _ in range(bots)]
+    results = []
+    for size in sizes:
+        games = [
+            (match.white_bot_id, match.black_bot_id, white_score(match))
+            for match in synthetic_matches(size, bot_ids)
+        ]
+        samples = _time(lambda: recompute_ratings(games), repeat)
+        results.append(
+            BenchmarkResult(
+                "recompute_ratings",
+                "s",
+                samples,
+                params={"matches": size, "bots": bots},
+                throughput=size / statistics.fmean(samples),
+                throughput_unit="games/s",
+            )
+        )
+    return results
+
+
+def bench_api(repeat: int) -> List[BenchmarkResult]:
+    """Latency of read endpoints through the ASGI stack (needs ``httpx``).
+
+    The app runs against a throwaway in-memory store, so the benchmark bots and
+    match never reach the configured database, leaderboard or ratings.
+    """
+    from fastapi.testclient import TestClient
+
+    from chessbot.web import app as web_app
+
+    with mock.patch.object(web_app, "STORE", Storage()):
+        client = TestClient(web_app.APP)
+        bots = [
+            client.post("/api/bots", json={"name": f"Bench{index}", "command": RANDOM_BOT}).json()
+            for index in range(2)
+        ]
+        match = client.post(
+            "/api/matches",
+            json={"white_bot_id": bots[0]["id"], "black_bot_id": bots[1]["id"], "max_moves": 20},
+            params={"wait": True},
+        ).json()
+
+        endpoints = [
+            "/api/health",
+            "/api/bots",
+            "/api/leaderboard",
+            "/api/matches?limit=100",
+            "/api/matches?limit=100&view=summary",
+            "/api/matches/{match_id}",
+            "/api/metrics",
+        ]
+        results = []
+        for endpoint in endpoints:
+            url = endpoint.format(match_id=match["id"])
+            client.get(url)
+            samples = _time(lambda: client.get(url).raise_for_status(), repeat)
+            results.append(BenchmarkResult("api", "s", samples, params={"endpoint": endpoint}))
+    return results
+
+
+BENCHMARKS = ("sandbox", "match", "round_robin", "standings", "ratings", "api")
+
+
+def run_benchmarks(
+    names: Sequence[str] = BENCHMARKS,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    repeat: int = 5,
+) -> dict:
+    """Run the selected benchmarks and return the JSON report."""
+    runners: Dict[str, Callable[[], List[BenchmarkResult]]] = {
+        "sandbox": lambda: bench_sandbox_spawn(repeat * 4),
+        "match": lambda: bench_match(max(1, repeat // 2)),
+        "round_robin": lambda: bench_round_robin(sizes, repeat),
+        "standings": lambda: bench_standings(sizes, max(1, repeat // 2)),
+        "ratings": lambda: bench_ratings(sizes, max(1, repeat // 2)),
+        "api": lambda: bench_api(repeat * 20),
+    }
+    results: List[BenchmarkResult] = []
+    for name in names:
+        results.extend(runners[name]())
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> List[str]:
+    """Describe every benchmark whose median is slower than baseline by > ``tolerance``."""
+    previous = {result["key"]: result for result in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        old = previous.get(result["key"])
+        if old is None or old["median"] <= 0:
+            continue
+        ratio = result["median"] / old["median"]
+        if ratio > 1.0 + tolerance:
+            regressions.append(
+                f"{result['key']}: median {result['median']:.6f}s vs "
+                f"{old['median']:.6f}s ({ratio:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "benchmarks", nargs="*", choices=BENCHMARKS, default=list(BENCHMARKS),
+        help="benchmarks to run (default: all)",
+    )
+    parser.add_argument("--output", "-o", help="write the JSON report here (default: stdout)")
+    parser.add_argument("--repeat", type=int, default=5, help="base repetition count")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", help="synthetic match counts for scale benchmarks"
+    )
+    parser.add_argument("--quick", action="store_true", help="small sizes for a fast run")
+    parser.add_argument("--baseline", help="earlier JSON report to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25,
+        help="allowed median slowdown versus the baseline (default: 0.25 = 25%%)",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    report = run_benchmarks(args.benchmarks, sizes=sizes, repeat=args.repeat)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            regressions = compare(report, json.load(handle), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,37 @@
 """Pydantic models for API payloads and responses."""
 from __future__ import annotations
 
+import math
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+import chess
+from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
+
+from chessbot.replay import replay
+
+BotProtocol = Literal["oneshot", "session"]
+TournamentFormat = Literal["round_robin", "swiss", "sprt"]
+JobStatus = Literal["queued", "running", "completed", "failed"]
+MAX_BATCH_GAMES = 1000
+MAX_ROUNDS = 10
+ADJUDICATED_TERMINATIONS = frozenset(
+    {"threefold_repetition", "fifty_moves", "draw_adjudication", "resign_adjudication"}
+)
+
+
+def _validate_fen(value: Optional[str]) -> Optional[str]:
+    """Normalize a FEN, rejecting malformed or illegal positions."""
+    if value is None:
+        return None
+    try:
+        board = chess.Board(value)
+    except ValueError as exc:
+        raise ValueError(f"invalid FEN: {exc}") from exc
+    if not board.is_valid():
+        raise ValueError("FEN is not a legal position")
+    return board.fen()
 
 
 class BotCreate(BaseModel):
@@ -13,6 +39,8 @@ class BotCreate(BaseModel):
 
     name: str = Field(..., min_length=1)
     command: List[str] = Field(..., min_length=1)
+    protocol: BotProtocol = "oneshot"
+    send_clock: bool = False
 
 
 class BotRecord(BaseModel):
@@ -21,9 +49,27 @@ class BotRecord(BaseModel):
     id: UUID
     name: str
     command: List[str]
+    protocol: BotProtocol = "oneshot"
+    send_clock: bool = False
     created_at: datetime
 
 
+class AdjudicationSettings(BaseModel):
+    """Rules that end a game early; material is counted in pawns (N/B 3, R 5, Q 9).
+
+    The draw rule needs ``draw_after_plies`` and the resign rule ``resign_material``;
+    both are off when those are unset.
+    """
+
+    threefold_repetition: bool = True
+    fifty_moves: bool = True
+    draw_after_plies: Optional[int] = Field(None, ge=1, le=500)
+    draw_material: int = Field(0, ge=0, le=39)
+    draw_plies: int = Field(8, ge=1, le=500)
+    resign_material: Optional[int] = Field(None, ge=1, le=39)
+    resign_plies: int = Field(8, ge=1, le=500)
+
+
 class MatchCreate(BaseModel):
     """Request payload for running a match."""
 
@@ -31,21 +77,308 @@ class MatchCreate(BaseModel):
     black_bot_id: UUID
     move_timeout_s: float = Field(2.0, gt=0.0, le=30.0)
     max_moves: int = Field(200, gt=1, le=500)
+    clock_initial_s: Optional[float] = Field(None, gt=0.0, le=3600.0)
+    clock_increment_s: float = Field(0.0, ge=0.0, le=60.0)
+    start_fen: Optional[str] = None
+    opening_suite: Optional[str] = None
+    adjudication: Optional[AdjudicationSettings] = None
+
+    @field_validator("start_fen")
+    @classmethod
+    def _valid_fen(cls, value: Optional[str]) -> Optional[str]:
+        """Normalize ``start_fen`` and reject illegal positions."""
+        return _validate_fen(value)
+
+    @model_validator(mode="after")
+    def _one_start(self) -> "MatchCreate":
+        """A match starts from ``start_fen`` or a suite position, not both."""
+        if self.start_fen and self.opening_suite:
+            raise ValueError("give start_fen or opening_suite, not both")
+        return self
+
+
+class BotMatchPerf(BaseModel):
+    """One side's move times and resource use in a match.
+
+    ``cpu_s`` and ``max_rss_bytes`` come from the bot process's rusage (or
+    ``/proc`` for session bots) and are None when the platform did not report them.
+    """
+
+    moves: int
+    think_p50_s: float
+    think_p95_s: float
+    think_max_s: float
+    cpu_s: Optional[float] = None
+    cpu_max_s: Optional[float] = None
+    max_rss_bytes: Optional[int] = None
+
+
+class BotPerfReport(BaseModel):
+    """A bot's performance profile over its recent matches.
+
+    ``think_p50_s`` is the median of the per-match medians and ``think_p95_s`` the
+    95th percentile of the per-match p95s; ``memory_limit_fraction`` compares the
+    peak RSS with the sandbox memory limit.
+    """
+
+    bot_id: UUID
+    name: str
+    matches: int
+    moves: int
+    think_p50_s: Optional[float] = None
+    think_p95_s: Optional[float] = None
+    think_max_s: Optional[float] = None
+    cpu_per_move_s: Optional[float] = None
+    cpu_max_s: Optional[float] = None
+    max_rss_bytes: Optional[int] = None
+    memory_limit_fraction: Optional[float] = None
 
 
 class MatchRecord(BaseModel):
-    """Stored match data."""
+    """Stored match data.
+
+    ``fen_history`` and ``pgn`` are derived from ``moves`` on demand; exclude them
+    from dumps that do not need them, since each one replays the game.
+    """
 
     id: UUID
     white_bot_id: UUID
     black_bot_id: UUID
     result: str
     winner: Optional[str]
+    winner_id: Optional[UUID] = None
     moves: List[str]
-    fen_history: List[str]
-    pgn: str
     duration_s: float
     created_at: datetime
+    tournament_id: Optional[UUID] = None
+    white_clock_s: Optional[float] = None
+    black_clock_s: Optional[float] = None
+    start_fen: Optional[str] = None
+    termination: Optional[str] = None
+    white_perf: Optional[BotMatchPerf] = None
+    black_perf: Optional[BotMatchPerf] = None
+
+    @computed_field
+    @property
+    def adjudicated(self) -> bool:
+        """Whether an adjudication rule ended the game rather than the bots."""
+        return self.termination in ADJUDICATED_TERMINATIONS
+
+    @computed_field
+    @property
+    def fen_history(self) -> List[str]:
+        """FEN after every ply, starting with the initial position."""
+        return list(replay(tuple(self.moves), self.start_fen).fen_history)
+
+    @computed_field
+    @property
+    def pgn(self) -> str:
+        """PGN text of the game."""
+        return replay(tuple(self.moves), self.start_fen).pgn
+
+
+class MatchJob(BaseModel):
+    """A queued single match; ``match_id`` is set once the game has been stored.
+
+    ``runner`` names the server boot that accepted the job and will play it.
+    """
+
+    id: UUID
+    status: JobStatus = "queued"
+    request: MatchCreate
+    match_id: Optional[UUID] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    runner: Optional[str] = None
+
+
+class BatchPairing(BaseModel):
+    """One game of a batch."""
+
+    white_bot_id: UUID
+    black_bot_id: UUID
+
+
+class GauntletSpec(BaseModel):
+    """A challenger against each opponent, colors alternating game by game."""
+
+    challenger_id: UUID
+    opponent_ids: List[UUID] = Field(..., min_length=1, max_length=100)
+    games_per_opponent: int = Field(2, ge=1, le=100)
+
+
+class BatchCreate(BaseModel):
+    """Request payload for many matches run as one job: a pairing list or a gauntlet."""
+
+    pairings: Optional[List[BatchPairing]] = Field(None, min_length=1)
+    gauntlet: Optional[GauntletSpec] = None
+    move_timeout_s: float = Field(2.0, gt=0.0, le=30.0)
+    max_moves: int = Field(200, gt=1, le=500)
+    clock_initial_s: Optional[float] = Field(None, gt=0.0, le=3600.0)
+    clock_increment_s: float = Field(0.0, ge=0.0, le=60.0)
+    opening_suite: Optional[str] = None
+    adjudication: Optional[AdjudicationSettings] = None
+    priority: int = Field(0, ge=0, le=9)
+
+    @model_validator(mode="after")
+    def _one_source(self) -> "BatchCreate":
+        """Exactly one of ``pairings`` and ``gauntlet``, within the game limit."""
+        if (self.pairings is None) == (self.gauntlet is None):
+            raise ValueError("give exactly one of pairings or gauntlet")
+        if self.game_count > MAX_BATCH_GAMES:
+            raise ValueError(f"a batch may hold at most {MAX_BATCH_GAMES} games")
+        return self
+
+    @property
+    def game_count(self) -> int:
+        """Number of games the batch plays."""
+        if self.gauntlet is not None:
+            return len(self.gauntlet.opponent_ids) * self.gauntlet.games_per_opponent
+        return len(self.pairings or [])
+
+
+class GauntletScore(BaseModel):
+    """A gauntlet challenger's results against one opponent.
+
+    ``elo`` is the rating difference implied by the score; None after a clean sweep
+    either way.
+    """
+
+    opponent_id: UUID
+    name: str
+    games: int
+    wins: int
+    losses: int
+    draws: int
+    points: float
+    elo: Optional[float] = None
+
+
+class BatchRecord(BaseModel):
+    """A batch of matches and its aggregated results.
+
+    ``matches`` lists finished games in pairing order; ``standings`` covers every
+    bot in the batch and ``opponents`` the challenger's score per opponent.
+    """
+
+    id: UUID
+    status: JobStatus = "queued"
+    request: BatchCreate
+    total_matches: int
+    completed_matches: int = 0
+    matches: List[UUID] = Field(default_factory=list)
+    standings: List[Standing] = Field(default_factory=list)
+    opponents: List[GauntletScore] = Field(default_factory=list)
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+
+class LeaseRequest(BaseModel):
+    """A remote worker asking for a match to play."""
+
+    worker_id: str = Field(..., min_length=1, max_length=200)
+    lease_s: float = Field(60.0, gt=0.0, le=3600.0)
+
+
+class LeaseFailure(BaseModel):
+    """A remote worker reporting that it could not play a leased match."""
+
+    error: str = Field(..., min_length=1, max_length=2000)
+
+
+class MatchAssignment(BaseModel):
+    """A match leased to a remote worker, with everything needed to play it."""
+
+    lease_id: UUID
+    job_id: UUID
+    white: BotRecord
+    black: BotRecord
+    move_timeout_s: float
+    max_moves: int
+    clock_initial_s: Optional[float] = None
+    clock_increment_s: float = 0.0
+    start_fen: Optional[str] = None
+    adjudication: Optional[AdjudicationSettings] = None
+    expires_at: datetime
+
+
+class MatchSummary(BaseModel):
+    """Match fields needed by list views, without moves, FEN history or PGN."""
+
+    id: UUID
+    white_bot_id: UUID
+    black_bot_id: UUID
+    result: str
+    winner: Optional[str]
+    winner_id: Optional[UUID] = None
+    move_count: int
+    duration_s: float
+    created_at: datetime
+    tournament_id: Optional[UUID] = None
+    termination: Optional[str] = None
+    white_perf: Optional[BotMatchPerf] = None
+    black_perf: Optional[BotMatchPerf] = None
+
+    @classmethod
+    def from_record(cls, record: MatchRecord) -> "MatchSummary":
+        """Summarize a full match record."""
+        return cls(
+            id=record.id,
+            white_bot_id=record.white_bot_id,
+            black_bot_id=record.black_bot_id,
+            result=record.result,
+            winner=record.winner,
+            winner_id=record.winner_id,
+            move_count=len(record.moves),
+            duration_s=record.duration_s,
+            created_at=record.created_at,
+            tournament_id=record.tournament_id,
+            termination=record.termination,
+            white_perf=record.white_perf,
+            black_perf=record.black_perf,
+        )
+
+
+class SprtSettings(BaseModel):
+    """Hypotheses and error rates for a sequential probability ratio test.
+
+    H0: the first bot is ``elo0`` stronger than the second; H1: it is ``elo1``
+    stronger.
+    """
+
+    elo0: float = Field(0.0, ge=-1000.0, le=1000.0)
+    elo1: float = Field(5.0, ge=-1000.0, le=1000.0)
+    alpha: float = Field(0.05, gt=0.0, lt=0.5)
+    beta: float = Field(0.05, gt=0.0, lt=0.5)
+    max_pairs: int = Field(1000, ge=1, le=100_000)
+
+    @model_validator(mode="after")
+    def _ordered_bounds(self) -> "SprtSettings":
+        """H1 must claim a larger Elo difference than H0."""
+        if self.elo1 <= self.elo0:
+            raise ValueError("elo1 must be greater than elo0")
+        return self
+
+
+class SprtStatus(SprtSettings):
+    """Running state of an SPRT head-to-head."""
+
+    pairs: int = 0
+    pentanomial: List[int] = Field(default_factory=lambda: [0] * 5)
+    llr: float = 0.0
+    lower_bound: float = 0.0
+    upper_bound: float = 0.0
+    elo: Optional[float] = None
+    decision: Optional[Literal["H0", "H1"]] = None
+
+
+def swiss_rounds(bot_count: int) -> int:
+    """Rounds needed for a Swiss event to separate ``bot_count`` bots: ceil(log2 n)."""
+    return max(1, math.ceil(math.log2(max(bot_count, 2))))
 
 
 class TournamentCreate(BaseModel):
@@ -53,9 +386,33 @@ class TournamentCreate(BaseModel):
 
     name: str = Field(..., min_length=1)
     bot_ids: List[UUID] = Field(..., min_length=2)
-    rounds: int = Field(1, ge=1, le=10)
+    format: TournamentFormat = "round_robin"
+    rounds: Optional[int] = Field(None, ge=1, le=MAX_ROUNDS)
     move_timeout_s: float = Field(2.0, gt=0.0, le=30.0)
     max_moves: int = Field(200, gt=1, le=500)
+    clock_initial_s: Optional[float] = Field(None, gt=0.0, le=3600.0)
+    clock_increment_s: float = Field(0.0, ge=0.0, le=60.0)
+    sprt: Optional[SprtSettings] = None
+    opening_suite: Optional[str] = None
+    adjudication: Optional[AdjudicationSettings] = None
+    priority: int = Field(0, ge=0, le=9)
+
+    @model_validator(mode="after")
+    def _default_rounds(self) -> "TournamentCreate":
+        """Default to one round robin, or ceil(log2 n) Swiss rounds."""
+        if self.rounds is None:
+            self.rounds = swiss_rounds(len(self.bot_ids)) if self.format == "swiss" else 1
+        if self.rounds > MAX_ROUNDS:
+            raise ValueError(
+                f"at most {MAX_ROUNDS} rounds; give rounds explicitly for this many bots"
+            )
+        if self.format == "swiss" and self.rounds >= len(self.bot_ids):
+            raise ValueError("a Swiss tournament needs fewer rounds than bots")
+        if self.format == "sprt":
+            if len(self.bot_ids) != 2:
+                raise ValueError("an SPRT head-to-head needs exactly two bots")
+            self.sprt = self.sprt or SprtSettings()
+        return self
 
 
 class Standing(BaseModel):
@@ -69,15 +426,54 @@ class Standing(BaseModel):
     points: float
 
 
+class Rating(BaseModel):
+    """Elo and Glicko-2 ratings for one bot."""
+
+    bot_id: UUID
+    name: str
+    elo: float
+    rating: float
+    rd: float
+    volatility: float
+    games: int
+
+
+class ScheduledGame(BaseModel):
+    """One game of a tournament's schedule and, once it is played, its match."""
+
+    white_id: UUID
+    black_id: UUID
+    start_fen: Optional[str] = None
+    match_id: Optional[UUID] = None
+
+
 class TournamentRecord(BaseModel):
-    """Stored tournament data."""
+    """Stored tournament data.
+
+    ``schedule`` checkpoints every game issued so far in pairing order, so a
+    tournament interrupted by a restart resumes from its first unplayed game;
+    ``runner`` names the server instance playing it.
+    """
 
     id: UUID
     name: str
     bot_ids: List[UUID]
+    format: TournamentFormat = "round_robin"
     rounds: int
     move_timeout_s: float
     max_moves: int
+    clock_initial_s: Optional[float] = None
+    clock_increment_s: float = 0.0
     matches: List[UUID]
     standings: List[Standing]
     created_at: datetime
+    status: Literal["pending", "running", "completed", "failed"] = "pending"
+    error: Optional[str] = None
+    total_matches: int = 0
+    completed_matches: int = 0
+    sprt: Optional[SprtStatus] = None
+    opening_suite: Optional[str] = None
+    adjudication: Optional[AdjudicationSettings] = None
+    priority: int = 0
+    schedule: List[ScheduledGame] = Field(default_factory=list)
+    runner: Optional[str] = None
@@ -0,0 +1,60 @@
+"""Compact move encoding and on-demand replay of stored games."""
+from __future__ import annotations
+
+import sys
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+import chess
+import chess.pgn
+
+REPLAY_CACHE_SIZE = 256
+
+
+def encode_move(move: chess.Move) -> int:
+    """Pack a move into 16 bits: from (6) | to (6) | promotion piece type (4)."""
+    return move.from_square | (move.to_square << 6) | ((move.promotion or 0) << 12)
+
+
+def decode_move(code: int) -> chess.Move:
+    """Inverse of ``encode_move``."""
+    promotion = code >> 12
+    return chess.Move(code & 0x3F, (code >> 6) & 0x3F, promotion=promotion or None)
+
+
+def encode_moves(moves: Iterable[str]) -> bytes:
+    """Pack UCI moves into a little-endian array of 16-bit codes."""
+    codes = array("H", (encode_move(chess.Move.from_uci(move)) for move in moves))
+    if sys.byteorder == "big":
+        codes.byteswap()
+    return codes.tobytes()
+
+
+def decode_moves(data: bytes) -> List[str]:
+    """Unpack ``encode_moves`` output back into UCI strings."""
+    codes = array("H")
+    codes.frombytes(data)
+    if sys.byteorder == "big":
+        codes.byteswap()
+    return [decode_move(code).uci() for code in codes]
+
+
+@dataclass(frozen=True)
+class Replay:
+    """Positions and PGN rebuilt from a move list."""
+
+    fen_history: Tuple[str, ...]
+    pgn: str
+
+
+@lru_cache(maxsize=REPLAY_CACHE_SIZE)
+def replay(moves: Tuple[str, ...], start_fen: Optional[str] = None) -> Replay:
+    """Replay ``moves`` from ``start_fen`` (default: the initial position); LRU-cached."""
+    board = chess.Board(start_fen) if start_fen else chess.Board()
+    fen_history = [board.fen()]
+    for move in moves:
+        board.push_uci(move)
+        fen_history.append(board.fen())
+    return Replay(fen_history=tuple(fen_history), pgn=str(chess.pgn.Game.from_board(board)))
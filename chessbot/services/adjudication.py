@@ -0,0 +1,77 @@
+"""Early adjudication of drawn or lost games."""
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import chess
+
+from chessbot.models import AdjudicationSettings
+
+PIECE_VALUES = {
+    chess.PAWN: 1,
+    chess.KNIGHT: 3,
+    chess.BISHOP: 3,
+    chess.ROOK: 5,
+    chess.QUEEN: 9,
+}
+
+Verdict = Tuple[str, Optional[chess.Color]]
+
+
+def material_balance(board: chess.Board) -> int:
+    """White's material minus Black's, in pawns."""
+    balance = 0
+    for piece_type, value in PIECE_VALUES.items():
+        balance += value * (
+            chess.popcount(board.pieces_mask(piece_type, chess.WHITE))
+            - chess.popcount(board.pieces_mask(piece_type, chess.BLACK))
+        )
+    return balance
+
+
+class Adjudicator:
+    """Tracks a game ply by ply and says when a rule ends it.
+
+    ``check`` is called after every move and returns ``(termination, winner)``,
+    where ``winner`` is None for a draw, or None while play should go on. The
+    material rules count consecutive plies, so a trade in progress does not trip
+    them.
+    """
+
+    def __init__(self, settings: AdjudicationSettings) -> None:
+        self.settings = settings
+        self._plies = 0
+        self._draw_streak = 0
+        self._resign_streak = 0
+        self._resign_sign = 0
+
+    def check(self, board: chess.Board) -> Optional[Verdict]:
+        """Update the streaks for the position after a move and return any verdict."""
+        settings = self.settings
+        self._plies += 1
+        if settings.fifty_moves and board.is_fifty_moves():
+            return "fifty_moves", None
+        if settings.threefold_repetition and board.is_repetition(3):
+            return "threefold_repetition", None
+        if settings.draw_after_plies is None and settings.resign_material is None:
+            return None
+
+        balance = material_balance(board)
+        if settings.draw_after_plies is not None and self._plies >= settings.draw_after_plies:
+            level = abs(balance) <= settings.draw_material
+            self._draw_streak = self._draw_streak + 1 if level else 0
+            if self._draw_streak >= settings.draw_plies:
+                return "draw_adjudication", None
+
+        if settings.resign_material is not None:
+            sign = (balance > 0) - (balance < 0)
+            if abs(balance) >= settings.resign_material:
+                same_side = sign == self._resign_sign
+                self._resign_streak = self._resign_streak + 1 if same_side else 1
+                self._resign_sign = sign
+            else:
+                self._resign_streak = 0
+                self._resign_sign = 0
+            if self._resign_streak >= settings.resign_plies:
+                return "resign_adjudication", chess.WHITE if sign > 0 else chess.BLACK
+        return None
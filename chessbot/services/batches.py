@@ -0,0 +1,96 @@
+"""Pairings and aggregate results for match batches and gauntlets."""
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterable, List, Sequence
+from uuid import UUID
+
+from chessbot.models import BatchCreate, GauntletScore, MatchRecord
+from chessbot.services.scheduler import Pairing
+from chessbot.services.scoring import white_score
+from chessbot.services.sprt import elo_from_score
+
+
+def gauntlet_pairings(
+    challenger_id: str,
+    opponent_ids: Sequence[str],
+    games_per_opponent: int,
+    positions: Sequence[str] = (),
+) -> List[Pairing]:
+    """Games of a gauntlet, opponent by opponent, the challenger white first.
+
+    With ``positions``, each color-swapped pair of games starts from the next
+    position in suite order, wrapping around when the suite runs out.
+    """
+    pairings: List[Pairing] = []
+    pair_index = 0
+    for opponent_id in opponent_ids:
+        for game in range(games_per_opponent):
+            start_fen = positions[(pair_index + game // 2) % len(positions)] if positions else None
+            if game % 2 == 0:
+                pairings.append(Pairing(challenger_id, opponent_id, start_fen))
+            else:
+                pairings.append(Pairing(opponent_id, challenger_id, start_fen))
+        pair_index += (games_per_opponent + 1) // 2
+    return pairings
+
+
+def batch_pairings(request: BatchCreate, positions: Sequence[str] = ()) -> List[Pairing]:
+    """Expand a batch request into its games.
+
+    Listed pairings take suite positions one game each, in order.
+    """
+    if request.gauntlet is not None:
+        gauntlet = request.gauntlet
+        return gauntlet_pairings(
+            str(gauntlet.challenger_id),
+            [str(opponent_id) for opponent_id in gauntlet.opponent_ids],
+            gauntlet.games_per_opponent,
+            positions,
+        )
+    return [
+        Pairing(
+            str(pairing.white_bot_id),
+            str(pairing.black_bot_id),
+            positions[index % len(positions)] if positions else None,
+        )
+        for index, pairing in enumerate(request.pairings or [])
+    ]
+
+
+def gauntlet_scores(
+    challenger_id: UUID,
+    records: Iterable[MatchRecord],
+    bot_name: Callable[[UUID], str],
+) -> List[GauntletScore]:
+    """The challenger's results per opponent, in the order opponents were first met."""
+    scores: Dict[UUID, GauntletScore] = {}
+    for record in records:
+        if record.white_bot_id == challenger_id:
+            opponent_id, points = record.black_bot_id, white_score(record)
+        elif record.black_bot_id == challenger_id:
+            opponent_id, points = record.white_bot_id, 1.0 - white_score(record)
+        else:
+            continue
+        score = scores.get(opponent_id)
+        if score is None:
+            score = scores[opponent_id] = GauntletScore(
+                opponent_id=opponent_id,
+                name=bot_name(opponent_id),
+                games=0,
+                wins=0,
+                losses=0,
+                draws=0,
+                points=0.0,
+            )
+        score.games += 1
+        score.points += points
+        if points == 1.0:
+            score.wins += 1
+        elif points == 0.0:
+            score.losses += 1
+        else:
+            score.draws += 1
+    for score in scores.values():
+        if 0.0 < score.points < score.games:
+            score.elo = round(elo_from_score(score.points / score.games), 1)
+    return list(scores.values())
@@ -0,0 +1,67 @@
+"""Expected match durations from past games, for longest-first dispatch."""
+from __future__ import annotations
+
+from typing import Dict, FrozenSet, Iterable, Tuple
+
+from chessbot.models import MatchSummary
+from chessbot.services.scheduler import Pairing
+from chessbot.services.storage import STORE
+
+HISTORY_LIMIT = 5000
+
+_Stats = Tuple[float, int]
+
+
+class DurationEstimator:
+    """Estimates a pairing's duration from the ``duration_s`` of earlier games.
+
+    The mean of the two bots' own games against each other is used when there
+    are any; otherwise the average of each bot's mean duration, then the one bot
+    with history, then the mean over all games. Pairings with no history at all
+    estimate to 0.
+    """
+
+    def __init__(self, summaries: Iterable[MatchSummary]) -> None:
+        self._pairs: Dict[FrozenSet[str], _Stats] = {}
+        self._bots: Dict[str, _Stats] = {}
+        total, count = 0.0, 0
+        for summary in summaries:
+            white, black = str(summary.white_bot_id), str(summary.black_bot_id)
+            _add(self._pairs, frozenset((white, black)), summary.duration_s)
+            _add(self._bots, white, summary.duration_s)
+            if black != white:
+                _add(self._bots, black, summary.duration_s)
+            total += summary.duration_s
+            count += 1
+        self._overall = total / count if count else 0.0
+
+    def __call__(self, pairing: Pairing) -> float:
+        """Expected duration of ``pairing`` in seconds."""
+        pair = self._pairs.get(frozenset((pairing.white_id, pairing.black_id)))
+        if pair is not None:
+            return _mean(pair)
+        means = [
+            _mean(self._bots[bot])
+            for bot in (pairing.white_id, pairing.black_id)
+            if bot in self._bots
+        ]
+        if means:
+            return sum(means) / len(means)
+        return self._overall
+
+
+def history_estimator() -> DurationEstimator:
+    """Estimator over the most recent ``HISTORY_LIMIT`` stored matches."""
+    return DurationEstimator(STORE.list_match_summaries(limit=HISTORY_LIMIT))
+
+
+def _add(stats: Dict, key: object, duration_s: float) -> None:
+    """Fold one game's duration into the running ``(total, count)`` under ``key``."""
+    total, count = stats.get(key, (0.0, 0))
+    stats[key] = (total + duration_s, count + 1)
+
+
+def _mean(stats: _Stats) -> float:
+    """Mean duration of a ``(total, count)`` pair with at least one game."""
+    total, count = stats
+    return total / count
@@ -0,0 +1,173 @@
+"""Live event fan-out for in-progress matches and tournaments."""
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from chessbot.models import MatchRecord
+
+ACTIVITY_CHANNEL = "activity"
+SUBSCRIBER_QUEUE_SIZE = 1024
+
+
+@dataclass
+class Event:
+    """A single published event."""
+
+    channel: str
+    name: str
+    data: dict
+
+
+def match_channel(match_id: object) -> str:
+    """Channel carrying one match's moves."""
+    return f"match:{match_id}"
+
+
+def tournament_channel(tournament_id: object) -> str:
+    """Channel carrying one tournament's progress."""
+    return f"tournament:{tournament_id}"
+
+
+@dataclass
+class LiveMatch:
+    """Snapshot of a match that is still being played."""
+
+    start: dict
+    moves: List[str] = field(default_factory=list)
+    fen_history: List[str] = field(default_factory=list)
+    last_move: Optional[dict] = None
+
+    def to_dict(self) -> dict:
+        """Serialize the snapshot for late joiners."""
+        return {
+            **self.start,
+            "moves": list(self.moves),
+            "fen_history": list(self.fen_history),
+            "clock": (self.last_move or {}).get("clock"),
+        }
+
+
+class EventBus:
+    """Thread-safe publish/subscribe hub feeding asyncio subscribers.
+
+    Publishers may run on any thread (tournament workers) or on the event loop
+    (async matches); each subscriber gets its own bounded queue and events for a
+    subscriber that falls behind are dropped rather than blocking the game.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._live: Dict[str, LiveMatch] = {}
+
+    def publish(self, channel: str, name: str, data: dict) -> None:
+        """Deliver an event to every subscriber of ``channel``."""
+        event = Event(channel=channel, name=name, data=data)
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:
+                continue
+
+    def subscribe(self, channel: str) -> "Subscription":
+        """Register a subscriber on ``channel``; must be called on the event loop."""
+        subscription = Subscription(self, channel)
+        with self._lock:
+            self._subscribers.setdefault(channel, []).append(subscription.entry)
+        return subscription
+
+    def unsubscribe(self, subscription: "Subscription") -> None:
+        """Remove a subscriber registered with ``subscribe``."""
+        with self._lock:
+            entries = self._subscribers.get(subscription.channel, [])
+            if subscription.entry in entries:
+                entries.remove(subscription.entry)
+            if not entries:
+                self._subscribers.pop(subscription.channel, None)
+
+    def observe_match(self, name: str, data: dict) -> None:
+        """Match-runner observer: track live state and publish each event.
+
+        A match stays live after its last move until ``finish_match`` is called
+        for the stored record; ``abort`` drops a match that ended in an error.
+        """
+        match_id = str(data["match_id"])
+        with self._lock:
+            if name == "start":
+                self._live[match_id] = LiveMatch(start=data, fen_history=[data["fen"]])
+            elif name == "move" and match_id in self._live:
+                live = self._live[match_id]
+                live.moves.append(data["move"])
+                live.fen_history.append(data["fen"])
+                live.last_move = data
+            elif name == "abort":
+                self._live.pop(match_id, None)
+        self.publish(match_channel(match_id), name, data)
+        if name != "move":
+            self.publish(ACTIVITY_CHANNEL, f"match_{name}", data)
+
+    def finish_match(self, record: MatchRecord) -> None:
+        """Publish ``end`` for a match once its record has been stored."""
+        match_id = str(record.id)
+        with self._lock:
+            self._live.pop(match_id, None)
+        data = {
+            "match_id": match_id,
+            "result": record.result,
+            "termination": record.termination,
+            "winner": record.winner,
+            "winner_id": str(record.winner_id) if record.winner_id else None,
+            "duration_s": record.duration_s,
+        }
+        self.publish(match_channel(match_id), "end", data)
+        self.publish(ACTIVITY_CHANNEL, "match_end", data)
+
+    def live_matches(self) -> List[dict]:
+        """Return snapshots of every match currently in progress."""
+        with self._lock:
+            return [live.to_dict() for live in self._live.values()]
+
+    def live_match(self, match_id: object) -> Optional[dict]:
+        """Return the snapshot of one in-progress match, if any."""
+        with self._lock:
+            live = self._live.get(str(match_id))
+            return live.to_dict() if live else None
+
+
+class Subscription:
+    """Queue of events for one subscriber; use as a context manager."""
+
+    def __init__(self, bus: EventBus, channel: str) -> None:
+        self.bus = bus
+        self.channel = channel
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.entry = (asyncio.get_running_loop(), self.queue)
+
+    def __enter__(self) -> "Subscription":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.bus.unsubscribe(self)
+
+    async def get(self, timeout_s: Optional[float] = None) -> Optional[Event]:
+        """Wait for the next event; return None if ``timeout_s`` passes first."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout_s)
+        except asyncio.TimeoutError:
+            return None
+
+
+def _offer(queue: asyncio.Queue, event: Event) -> None:
+    """Enqueue without blocking; drop the event when the subscriber is behind."""
+    try:
+        queue.put_nowait(event)
+    except asyncio.QueueFull:
+        pass
+
+
+EVENTS = EventBus()
@@ -0,0 +1,163 @@
+"""Warm template process that forks one-shot Python bots on request.
+
+Run as a standalone script by the bot's own interpreter, so it imports only the
+standard library: ``python fork_template.py <listen-fd> <script> [args...]``.
+
+The template loads ``script`` once without running its ``__main__`` block, which
+pulls the bot's imports (``chess`` and friends) into memory; loading is cut off
+after ``PRELOAD_TIMEOUT_S`` for scripts that do their work at import time. Each
+connection on the listening socket then carries a JSON limits message plus the
+child's stdin, stdout and stderr descriptors; the template forks, the child applies
+the rlimits, takes over the descriptors and runs the script as ``__main__``. The template
+answers ``pid <n>`` straight away and ``exit <code> <cpu-seconds> <maxrss>`` once
+it has reaped the child, ``maxrss`` in the platform's ``ru_maxrss`` unit. It
+exits when its own stdin is closed by the platform. The platform also gives the
+template a soft CPU limit, so a script that ignores the preload alarm and spins
+is killed by ``SIGXCPU`` instead of holding the template forever.
+"""
+import json
+import os
+import random
+import resource
+import runpy
+import selectors
+import signal
+import socket
+import sys
+import traceback
+
+PRELOAD_TIMEOUT_S = 2.0
+
+
+class _PreloadTimeout(Exception):
+    """Raised when loading the script takes too long, e.g. it plays at import time."""
+
+
+def _preload_timeout(*_):
+    """SIGALRM handler that aborts loading the script."""
+    raise _PreloadTimeout()
+
+
+def _run_child(script, argv, limits, fds):
+    """Body of a forked child; never returns."""
+    code = 1
+    try:
+        cpu_seconds, memory_bytes = limits["cpu_seconds"], limits["memory_bytes"]
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+        for target, fd in enumerate(fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        random.seed()
+        sys.argv = [script, *argv]
+        try:
+            runpy.run_path(script, run_name="__main__")
+            code = 0
+        except SystemExit as exc:
+            if exc.code is None or isinstance(exc.code, int):
+                code = exc.code or 0
+            else:
+                print(exc.code, file=sys.stderr)
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(code)
+
+
+def main():
+    """Serve fork requests until stdin closes."""
+    listen_fd, script, argv = int(sys.argv[1]), sys.argv[2], sys.argv[3:]
+    listener = socket.socket(fileno=listen_fd)
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+    signal.signal(signal.SIGALRM, _preload_timeout)
+    signal.setitimer(signal.ITIMER_REAL, PRELOAD_TIMEOUT_S)
+    try:
+        runpy.run_path(script, run_name="__chessbot_template__")
+    except BaseException:  # the child reports the error when it runs the script
+        pass
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+    sys.stdout.flush()
+
+    wake_r, wake_w = os.pipe()
+    os.set_blocking(wake_w, False)
+    signal.set_wakeup_fd(wake_w, warn_on_full_buffer=False)
+    signal.signal(signal.SIGCHLD, lambda *_: None)
+
+    selector = selectors.DefaultSelector()
+    selector.register(listener, selectors.EVENT_READ, "accept")
+    selector.register(sys.stdin.fileno(), selectors.EVENT_READ, "stdin")
+    selector.register(wake_r, selectors.EVENT_READ, "child")
+    children = {}
+
+    while True:
+        for key, _mask in selector.select():
+            if key.data == "stdin":
+                if not os.read(key.fd, 4096):
+                    return
+            elif key.data == "child":
+                os.read(wake_r, 4096)
+                _reap(children)
+            else:
+                conn, _addr = listener.accept()
+                try:
+                    message, fds, _flags, _addr = socket.recv_fds(conn, 4096, 3)
+                except OSError:
+                    conn.close()
+                    continue
+                try:
+                    limits = json.loads(message)
+                except ValueError:
+                    limits = None
+                if len(fds) != 3 or not isinstance(limits, dict):
+                    for fd in fds:
+                        os.close(fd)
+                    conn.close()
+                    continue
+                pid = os.fork()
+                if pid == 0:
+                    signal.set_wakeup_fd(-1)
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    selector.close()
+                    for fd in (listener.fileno(), conn.fileno(), wake_r, wake_w):
+                        os.close(fd)
+                    _run_child(script, argv, limits, fds)
+                for fd in fds:
+                    os.close(fd)
+                children[pid] = conn
+                _send(conn, f"pid {pid}\n")
+        _reap(children)
+
+
+def _reap(children):
+    """Collect finished children and report their exit codes."""
+    while children:
+        try:
+            pid, status, usage = os.wait4(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+        conn = children.pop(pid, None)
+        if conn is not None:
+            code = os.waitstatus_to_exitcode(status)
+            cpu_seconds = usage.ru_utime + usage.ru_stime
+            _send(conn, f"exit {code} {cpu_seconds:.6f} {usage.ru_maxrss}\n")
+            conn.close()
+
+
+def _send(conn, text):
+    """Write to a client that may already have given up on the request."""
+    try:
+        conn.sendall(text.encode())
+    except OSError:
+        pass
+
+
+if __name__ == "__main__":
+    main()
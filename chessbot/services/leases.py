@@ -0,0 +1,267 @@
+"""Match queue leased to remote workers over HTTP.
+
+Tournament threads ``submit`` a match and wait on the returned future; workers
+``lease`` the oldest pending match for a limited time, ``renew`` the lease while
+they play, and ``complete`` it with the finished record or ``fail`` it when the
+game could not be played. A lease that runs out, because its worker died or lost
+the network, or that fails, puts the match back at the front of the queue, and
+any late result for it is refused so each match is stored once. A match leased
+``MAX_LEASE_ATTEMPTS`` times without a result fails its future with
+``RemoteMatchError`` instead of going round forever.
+Results are replayed from the leased position before they are accepted, so a
+worker cannot report moves, a result or a game length the lease does not allow.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Deque, Dict, Optional, Tuple
+from uuid import UUID, uuid4
+
+import chess
+
+from chessbot.models import BotRecord, MatchAssignment, MatchRecord
+from chessbot.services.adjudication import Adjudicator
+from chessbot.services.match_runner import MatchConfig
+from chessbot.services.monitoring import QUEUE_DEPTH, REGISTRY
+
+MAX_LEASE_ATTEMPTS = 3
+
+LEASES_EXPIRED_TOTAL = REGISTRY.counter(
+    "chessbot_leases_expired_total", "Remote match leases that ran out and were re-queued."
+)
+
+
+class RemoteMatchError(Exception):
+    """Raised from a submitted match's future when no worker could play it."""
+
+
+@dataclass
+class _RemoteMatch:
+    """A submitted match and its current lease, if any."""
+
+    id: UUID
+    white: BotRecord
+    black: BotRecord
+    config: MatchConfig
+    future: Future
+    tournament_id: Optional[UUID] = None
+    lease_id: Optional[UUID] = None
+    worker_id: Optional[str] = None
+    deadline: float = 0.0
+    attempts: int = 0
+
+
+class LeaseQueue:
+    """Thread-safe queue of matches waiting for, or leased to, remote workers."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pending: Deque[_RemoteMatch] = deque()
+        self._leased: Dict[UUID, _RemoteMatch] = {}
+        self._queued = QUEUE_DEPTH.labels(queue="remote")
+
+    def submit(
+        self,
+        white: BotRecord,
+        black: BotRecord,
+        config: MatchConfig,
+        tournament_id: Optional[UUID] = None,
+    ) -> Future:
+        """Queue a match; the future resolves to its ``MatchRecord``."""
+        match = _RemoteMatch(uuid4(), white, black, config, Future(), tournament_id)
+        with self._lock:
+            self._pending.append(match)
+            self._queued.inc()
+        return match.future
+
+    def lease(self, worker_id: str, lease_s: float) -> Optional[MatchAssignment]:
+        """Hand the oldest pending match to ``worker_id`` for ``lease_s`` seconds."""
+        with self._lock:
+            self._expire()
+            if not self._pending:
+                return None
+            match = self._pending.popleft()
+            self._queued.dec()
+            match.lease_id = uuid4()
+            match.worker_id = worker_id
+            match.attempts += 1
+            match.deadline = time.monotonic() + lease_s
+            self._leased[match.lease_id] = match
+            config = match.config
+            return MatchAssignment(
+                lease_id=match.lease_id,
+                job_id=match.id,
+                white=match.white,
+                black=match.black,
+                move_timeout_s=config.move_timeout_s,
+                max_moves=config.max_moves,
+                clock_initial_s=config.clock_initial_s,
+                clock_increment_s=config.clock_increment_s,
+                start_fen=config.start_fen,
+                adjudication=config.adjudication,
+                expires_at=_wall_time(match.deadline),
+            )
+
+    def renew(self, lease_id: UUID, lease_s: float) -> Optional[datetime]:
+        """Extend a live lease; None if it has already expired."""
+        with self._lock:
+            self._expire()
+            match = self._leased.get(lease_id)
+            if match is None:
+                return None
+            match.deadline = time.monotonic() + lease_s
+            return _wall_time(match.deadline)
+
+    def complete(self, lease_id: UUID, record: MatchRecord) -> bool:
+        """Accept the record for a live lease; False if the lease was lost.
+
+        Raises ValueError, keeping the lease, when the record does not replay to
+        the reported result under the leased match's settings.
+        """
+        with self._lock:
+            self._expire()
+            match = self._leased.get(lease_id)
+            if match is None:
+                return False
+            record = _verified(match, record)
+            del self._leased[lease_id]
+        match.future.set_result(record)
+        return True
+
+    def fail(self, lease_id: UUID, error: str) -> Optional[bool]:
+        """Give back a lease whose match could not be played.
+
+        Returns whether the match was re-queued (False once it has used up its
+        attempts and its future failed), or None if the lease was already lost.
+        """
+        with self._lock:
+            self._expire()
+            match = self._leased.pop(lease_id, None)
+            if match is None:
+                return None
+            return self._retry(match, error)
+
+    def snapshot(self) -> dict:
+        """Pending count and the live leases per worker."""
+        with self._lock:
+            self._expire()
+            workers: Dict[str, int] = {}
+            for match in self._leased.values():
+                workers[match.worker_id] = workers.get(match.worker_id, 0) + 1
+            return {"pending": len(self._pending), "leased": len(self._leased), "workers": workers}
+
+    def _expire(self) -> None:
+        """Re-queue matches whose lease ran out, ahead of newer ones, or fail them."""
+        now = time.monotonic()
+        expired = [match for match in self._leased.values() if match.deadline <= now]
+        for match in sorted(expired, key=lambda match: match.deadline, reverse=True):
+            del self._leased[match.lease_id]
+            LEASES_EXPIRED_TOTAL.labels().inc()
+            self._retry(match, f"lease expired on worker {match.worker_id}")
+
+    def _retry(self, match: _RemoteMatch, error: str) -> bool:
+        """Re-queue a match at the front, or fail it once it has used up its attempts."""
+        match.lease_id = match.worker_id = None
+        if match.attempts >= MAX_LEASE_ATTEMPTS:
+            match.future.set_exception(
+                RemoteMatchError(f"match failed on {match.attempts} leases; last: {error}")
+            )
+            return False
+        self._pending.appendleft(match)
+        self._queued.inc()
+        return True
+
+
+def _verified(match: _RemoteMatch, record: MatchRecord) -> MatchRecord:
+    """Replay a worker's record from the leased position; raise ValueError if it is off.
+
+    The start position and tournament always come from the lease, never the record.
+    """
+    config = match.config
+    if (record.white_bot_id, record.black_bot_id) != (match.white.id, match.black.id):
+        raise ValueError("record players do not match the leased pairing")
+    if len(record.moves) > config.max_moves:
+        raise ValueError(
+            f"record has {len(record.moves)} moves; the lease allows {config.max_moves}"
+        )
+
+    board = chess.Board(config.start_fen) if config.start_fen else chess.Board()
+    adjudicator = Adjudicator(config.adjudication) if config.adjudication else None
+    ending: Optional[Tuple[str, Optional[chess.Color]]] = None
+    for ply, text in enumerate(record.moves, start=1):
+        if ending is not None:
+            raise ValueError(f"record continues after the game ended at ply {ply - 1}")
+        try:
+            move = chess.Move.from_uci(text)
+        except ValueError:
+            move = None
+        if move is None or move not in board.legal_moves:
+            raise ValueError(f"illegal move {text!r} at ply {ply}")
+        board.push(move)
+        ending = _ending(board, adjudicator)
+
+    clocks = {chess.WHITE: record.white_clock_s, chess.BLACK: record.black_clock_s}
+    if ending is not None:
+        termination, winner = ending
+    elif len(record.moves) == config.max_moves:
+        termination, winner = "max_moves", None
+    elif record.termination == "flag":
+        # The side to move ran out of time before answering.
+        if not config.clocked or clocks[board.turn] != 0:
+            raise ValueError("record flags a side whose clock has not run out")
+        termination = "flag"
+        winner = None if board.has_insufficient_material(not board.turn) else not board.turn
+    else:
+        # The side to move failed to answer with a legal move.
+        if config.clocked and not clocks[board.turn]:
+            raise ValueError("record forfeits a side whose clock ran out; that is a flag")
+        termination, winner = "forfeit", not board.turn
+
+    if termination in ("forfeit", "flag") and winner is not None:
+        result = termination
+    else:
+        result = "draw" if winner is None else ("white" if winner == chess.WHITE else "black")
+    winner_bot = None if winner is None else (match.white if winner == chess.WHITE else match.black)
+    winner_id = winner_bot.id if winner_bot else None
+    if (record.result, record.termination, record.winner_id) != (result, termination, winner_id):
+        raise ValueError(
+            f"record reports {record.result} by {record.termination}; "
+            f"the moves give {result} by {termination}"
+        )
+    return record.model_copy(
+        update={
+            "winner": winner_bot.name if winner_bot else None,
+            "start_fen": config.start_fen,
+            "tournament_id": match.tournament_id,
+        }
+    )
+
+
+def _ending(
+    board: chess.Board, adjudicator: Optional[Adjudicator]
+) -> Optional[Tuple[str, Optional[chess.Color]]]:
+    """Termination and winning color once the game is over, checked as the match runner does."""
+    if board.is_checkmate():
+        return "checkmate", not board.turn
+    if board.is_stalemate():
+        return "stalemate", None
+    if board.is_insufficient_material():
+        return "insufficient_material", None
+    if board.is_fivefold_repetition():
+        return "fivefold_repetition", None
+    if adjudicator is not None:
+        return adjudicator.check(board)
+    return None
+
+
+def _wall_time(deadline: float) -> datetime:
+    """Convert a monotonic deadline into a UTC timestamp for clients."""
+    return datetime.now(timezone.utc) + timedelta(seconds=deadline - time.monotonic())
+
+
+LEASES = LeaseQueue()
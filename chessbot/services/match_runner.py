@@ -1,22 +1,47 @@
 """Match execution with chess rules enforcement."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
 import time
+from contextlib import AsyncExitStack, ExitStack
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
 from uuid import UUID, uuid4
 
 import chess
-import chess.pgn
 
-from chessbot.models import MatchRecord
-from chessbot.services.monitoring import record_timing
-from chessbot.services.sandbox import run_sandboxed
+from chessbot.models import AdjudicationSettings, MatchRecord
+from chessbot.services.adjudication import Adjudicator
+from chessbot.services.monitoring import (
+    BOT_MOVE_CPU_SECONDS,
+    BOT_MOVE_SECONDS,
+    MATCH_DURATION_SECONDS,
+    MATCH_TERMINATIONS_TOTAL,
+    MATCHES_ACTIVE,
+    MATCHES_TOTAL,
+)
+from chessbot.services.perf import PerfTracker
+from chessbot.services.sandbox import (
+    AsyncSandboxSession,
+    SandboxResult,
+    SandboxSession,
+    run_forked,
+    run_sandboxed,
+    run_sandboxed_async,
+)
 
 LOGGER = logging.getLogger(__name__)
 
+PROTOCOL_ONESHOT = "oneshot"
+PROTOCOL_SESSION = "session"
+
+MoveRequester = Callable[[str, float], SandboxResult]
+AsyncMoveRequester = Callable[[str, float], Awaitable[SandboxResult]]
+MatchObserver = Callable[[str, dict], None]
+
 
 @dataclass
 class MatchConfig:
@@ -24,15 +49,31 @@ class MatchConfig:
 
     move_timeout_s: float
     max_moves: int
+    clock_initial_s: Optional[float] = None
+    clock_increment_s: float = 0.0
+    start_fen: Optional[str] = None
+    adjudication: Optional[AdjudicationSettings] = None
+
+    @property
+    def clocked(self) -> bool:
+        """Whether the match uses total-time clocks instead of a per-move limit."""
+        return self.clock_initial_s is not None
 
 
 @dataclass
 class BotConfig:
-    """Bot configuration for a match."""
+    """Bot configuration for a match.
+
+    ``send_clock`` opts the bot into a ``clock ...`` line after each FEN in clocked
+    matches; other bots keep getting exactly one FEN line per move.
+    """
 
     bot_id: UUID
     name: str
     command: List[str]
+    protocol: str = PROTOCOL_ONESHOT
+    fork_server: bool = False
+    send_clock: bool = False
 
 
 @dataclass
@@ -47,80 +88,352 @@ def _select_bot(turn: chess.Color, white: BotConfig, black: BotConfig) -> BotCon
     return white if turn == chess.WHITE else black
 
 
-def run_match(white: BotConfig, black: BotConfig, config: MatchConfig) -> MatchResult:
-    """Run a single match and return a stored match record."""
-    board = chess.Board()
-    move_history: List[str] = []
-    fen_history: List[str] = [board.fen()]
-    match_id = uuid4()
-    start_time = time.time()
+def _session_cpu_seconds(config: MatchConfig) -> int:
+    """CPU budget for a session bot: its whole clock, or one second per move, plus startup."""
+    moves = (config.max_moves + 1) // 2
+    if config.clocked:
+        return math.ceil(config.clock_initial_s + config.clock_increment_s * moves) + 1
+    return moves + 1
 
-    winner: Optional[str] = None
-    result = "draw"
 
-    for _ply in range(config.max_moves):
-        bot = _select_bot(board.turn, white, black)
-        fen = board.fen()
-        LOGGER.info("Requesting move", extra={"bot": bot.name, "fen": fen})
+def _oneshot_cpu_seconds(config: MatchConfig, timeout_s: float) -> int:
+    """CPU limit for one one-shot move: one second, or the time left on the clock."""
+    if config.clocked:
+        return max(1, math.ceil(timeout_s))
+    return 1
+
 
-        move_start = time.monotonic()
-        sandbox_result = run_sandboxed(
+def _open_requester(bot: BotConfig, config: MatchConfig, stack: ExitStack) -> MoveRequester:
+    """Return a callable that asks ``bot`` for a move using its configured protocol."""
+    if bot.protocol == PROTOCOL_SESSION:
+        session = stack.enter_context(
+            SandboxSession(
+                bot.command, cpu_seconds=_session_cpu_seconds(config), bot=bot.name
+            )
+        )
+        return session.request
+    spawn = run_forked if bot.fork_server else run_sandboxed
+
+    def request(input_text: str, timeout_s: float) -> SandboxResult:
+        return spawn(
             bot.command,
-            input_text=f"{fen}\n",
-            timeout_s=config.move_timeout_s,
+            input_text=input_text,
+            timeout_s=timeout_s,
+            cpu_seconds=_oneshot_cpu_seconds(config, timeout_s),
+            bot=bot.name,
         )
-        record_timing("bot_move", time.monotonic() - move_start, bot=bot.name)
 
-        if sandbox_result.timed_out:
-            winner = black.name if board.turn == chess.WHITE else white.name
-            result = "forfeit"
-            break
+    return request
+
+
+async def _open_async_requester(
+    bot: BotConfig, config: MatchConfig, stack: AsyncExitStack
+) -> AsyncMoveRequester:
+    """Async counterpart of ``_open_requester``."""
+    if bot.protocol == PROTOCOL_SESSION:
+        session = await AsyncSandboxSession.start(
+            bot.command, cpu_seconds=_session_cpu_seconds(config), bot=bot.name
+        )
+        stack.push_async_callback(session.close)
+        return session.request
+
+    async def request(input_text: str, timeout_s: float) -> SandboxResult:
+        cpu_seconds = _oneshot_cpu_seconds(config, timeout_s)
+        if bot.fork_server:
+            # The fork server protocol is blocking; forked moves run in a thread.
+            return await asyncio.to_thread(
+                run_forked,
+                bot.command,
+                input_text=input_text,
+                timeout_s=timeout_s,
+                cpu_seconds=cpu_seconds,
+                bot=bot.name,
+            )
+        return await run_sandboxed_async(
+            bot.command,
+            input_text=input_text,
+            timeout_s=timeout_s,
+            cpu_seconds=cpu_seconds,
+            bot=bot.name,
+        )
+
+    return request
+
+
+class _Game:
+    """Board state and rule enforcement shared by the sync and async drivers."""
+
+    def __init__(
+        self,
+        white: BotConfig,
+        black: BotConfig,
+        config: MatchConfig,
+        observer: Optional[MatchObserver] = None,
+    ) -> None:
+        self.white = white
+        self.black = black
+        self.config = config
+        self.board = chess.Board(config.start_fen) if config.start_fen else chess.Board()
+        self.move_history: List[str] = []
+        self.match_id = uuid4()
+        self.start_time = time.time()
+        self.winner: Optional[str] = None
+        self.winner_id: Optional[UUID] = None
+        self.result = "draw"
+        self.termination = "max_moves"
+        self._plies = 0
+        self._finished = False
+        self._observer = observer
+        self._adjudicator = Adjudicator(config.adjudication) if config.adjudication else None
+        self._think_s = {chess.WHITE: 0.0, chess.BLACK: 0.0}
+        self._remaining_s = {
+            chess.WHITE: config.clock_initial_s or 0.0,
+            chess.BLACK: config.clock_initial_s or 0.0,
+        }
+        self._move_seconds = {
+            chess.WHITE: BOT_MOVE_SECONDS.labels(bot=white.name),
+            chess.BLACK: BOT_MOVE_SECONDS.labels(bot=black.name),
+        }
+        self._move_cpu_seconds = {
+            chess.WHITE: BOT_MOVE_CPU_SECONDS.labels(bot=white.name),
+            chess.BLACK: BOT_MOVE_CPU_SECONDS.labels(bot=black.name),
+        }
+        self._perf = {chess.WHITE: PerfTracker(), chess.BLACK: PerfTracker()}
+        self._emit(
+            "start",
+            white_bot_id=str(white.bot_id),
+            black_bot_id=str(black.bot_id),
+            white=white.name,
+            black=black.name,
+            fen=self.board.fen(),
+        )
+
+    def next_request(self) -> Optional[str]:
+        """Return the input for the side to move, or None once the game is over."""
+        if self._finished or self._plies >= self.config.max_moves:
+            return None
+        fen = self.board.fen()
+        bot = _select_bot(self.board.turn, self.white, self.black)
+        LOGGER.info("Requesting move", extra={"bot": bot.name, "fen": fen})
+        if not (self.config.clocked and bot.send_clock):
+            return f"{fen}\n"
+        remaining_ms = {color: round(t * 1000) for color, t in self._remaining_s.items()}
+        increment_ms = round(self.config.clock_increment_s * 1000)
+        return (
+            f"{fen}\n"
+            f"clock {remaining_ms[chess.WHITE]} {remaining_ms[chess.BLACK]} "
+            f"{increment_ms} {increment_ms}\n"
+        )
+
+    def move_timeout_s(self) -> float:
+        """Deadline for the side to move: its remaining clock, or the per-move limit."""
+        if self.config.clocked:
+            return max(self._remaining_s[self.board.turn], 0.0)
+        return self.config.move_timeout_s
 
+    def apply(self, sandbox_result: SandboxResult, elapsed_s: float) -> None:
+        """Validate the side to move's reply and advance the game."""
+        self._move_seconds[self.board.turn].observe(elapsed_s)
+        if sandbox_result.cpu_s is not None:
+            self._move_cpu_seconds[self.board.turn].observe(sandbox_result.cpu_s)
+        self._perf[self.board.turn].add(sandbox_result, elapsed_s)
+        self._plies += 1
+        self._think_s[self.board.turn] += elapsed_s
+
+        if self.config.clocked:
+            self._remaining_s[self.board.turn] -= elapsed_s
+            if sandbox_result.timed_out or self._remaining_s[self.board.turn] <= 0:
+                self._remaining_s[self.board.turn] = 0.0
+                self._flag()
+                return
+            self._remaining_s[self.board.turn] += self.config.clock_increment_s
+
+        move = self._parse_move(sandbox_result)
+        if move is None:
+            self._forfeit()
+            return
+
+        board = self.board
+        board.push(move)
+        self.move_history.append(move.uci())
+        self._emit(
+            "move",
+            ply=self._plies,
+            move=move.uci(),
+            fen=board.fen(),
+            think_s=elapsed_s,
+            clock=self._clock_state(),
+        )
+
+        if board.is_checkmate():
+            self._win(not board.turn, "checkmate")
+        elif board.is_stalemate():
+            self._draw("stalemate")
+        elif board.is_insufficient_material():
+            self._draw("insufficient_material")
+        elif board.is_fivefold_repetition():
+            self._draw("fivefold_repetition")
+        elif self._adjudicator is not None:
+            verdict = self._adjudicator.check(board)
+            if verdict is not None:
+                termination, winner = verdict
+                if winner is None:
+                    self._draw(termination)
+                else:
+                    self._win(winner, termination)
+
+    def record(self) -> MatchRecord:
+        """Build the stored record for the finished game."""
+        duration_s = time.time() - self.start_time
+        MATCHES_TOTAL.labels(result=self.result).inc()
+        MATCH_DURATION_SECONDS.labels(result=self.result).observe(duration_s)
+        MATCH_TERMINATIONS_TOTAL.labels(termination=self.termination).inc()
+        return MatchRecord(
+            id=self.match_id,
+            white_bot_id=self.white.bot_id,
+            black_bot_id=self.black.bot_id,
+            result=self.result,
+            winner=self.winner,
+            winner_id=self.winner_id,
+            moves=self.move_history,
+            white_clock_s=self._remaining_s[chess.WHITE] if self.config.clocked else None,
+            black_clock_s=self._remaining_s[chess.BLACK] if self.config.clocked else None,
+            duration_s=duration_s,
+            created_at=datetime.fromtimestamp(self.start_time, tz=timezone.utc),
+            start_fen=self.config.start_fen,
+            termination=self.termination,
+            white_perf=self._perf[chess.WHITE].summary(),
+            black_perf=self._perf[chess.BLACK].summary(),
+        )
+
+    def abort(self, error: BaseException) -> None:
+        """Tell the observer the game stopped on an error and will not be stored."""
+        self._emit("abort", error=str(error) or type(error).__name__)
+
+    def _parse_move(self, sandbox_result: SandboxResult) -> Optional[chess.Move]:
+        """Return the bot's move if it is a timely, well-formed legal move."""
+        if sandbox_result.timed_out:
+            return None
         move_text = sandbox_result.stdout.strip()
         if not move_text:
-            winner = black.name if board.turn == chess.WHITE else white.name
-            result = "forfeit"
-            break
-
+            return None
         try:
             move = chess.Move.from_uci(move_text)
         except ValueError:
-            winner = black.name if board.turn == chess.WHITE else white.name
-            result = "forfeit"
-            break
+            return None
+        if move not in self.board.legal_moves:
+            return None
+        return move
 
-        if move not in board.legal_moves:
-            winner = black.name if board.turn == chess.WHITE else white.name
-            result = "forfeit"
-            break
+    def _clock_state(self) -> dict:
+        """Time used so far by each side, plus remaining clock time in clocked games."""
+        state = {
+            "white_used_s": self._think_s[chess.WHITE],
+            "black_used_s": self._think_s[chess.BLACK],
+        }
+        if self.config.clocked:
+            state["white_remaining_s"] = self._remaining_s[chess.WHITE]
+            state["black_remaining_s"] = self._remaining_s[chess.BLACK]
+        return state
 
-        board.push(move)
-        move_history.append(move.uci())
-        fen_history.append(board.fen())
+    def _emit(self, name: str, **data: object) -> None:
+        """Send a live event to the observer; observer errors never stop the game."""
+        if self._observer is None:
+            return
+        try:
+            self._observer(name, {"match_id": str(self.match_id), **data})
+        except Exception:  # live viewers must never break a match
+            LOGGER.exception("Match observer failed", extra={"event": name})
 
-        if board.is_checkmate():
-            winner = bot.name
-            result = "white" if board.turn == chess.BLACK else "black"
-            break
-        if board.is_stalemate() or board.is_insufficient_material() or board.is_fivefold_repetition():
-            result = "draw"
-            break
-
-    duration_s = time.time() - start_time
-
-    pgn_game = chess.pgn.Game.from_board(board)
-    pgn_text = str(pgn_game)
-
-    record = MatchRecord(
-        id=match_id,
-        white_bot_id=white.bot_id,
-        black_bot_id=black.bot_id,
-        result=result,
-        winner=winner,
-        moves=move_history,
-        fen_history=fen_history,
-        pgn=pgn_text,
-        duration_s=duration_s,
-        created_at=datetime.fromtimestamp(start_time, tz=timezone.utc),
-    )
-    return MatchResult(record=record)
+    def _win(self, color: chess.Color, termination: str) -> None:
+        """End the game as a win for the ``color`` side."""
+        bot = _select_bot(color, self.white, self.black)
+        self.winner = bot.name
+        self.winner_id = bot.bot_id
+        self.result = "white" if color == chess.WHITE else "black"
+        self.termination = termination
+        self._finished = True
+
+    def _draw(self, termination: str) -> None:
+        """End the game as a draw."""
+        self.result = "draw"
+        self.termination = termination
+        self._finished = True
+
+    def _flag(self) -> None:
+        """End the game on time; a draw if the opponent cannot possibly mate."""
+        self._finished = True
+        self.termination = "flag"
+        opponent_color = not self.board.turn
+        if self.board.has_insufficient_material(opponent_color):
+            self.result = "draw"
+            return
+        opponent = _select_bot(opponent_color, self.white, self.black)
+        self.winner = opponent.name
+        self.winner_id = opponent.bot_id
+        self.result = "flag"
+
+    def _forfeit(self) -> None:
+        """End the game as a forfeit by the side to move."""
+        opponent = self.black if self.board.turn == chess.WHITE else self.white
+        self.winner = opponent.name
+        self.winner_id = opponent.bot_id
+        self.result = "forfeit"
+        self.termination = "forfeit"
+        self._finished = True
+
+
+def run_match(
+    white: BotConfig,
+    black: BotConfig,
+    config: MatchConfig,
+    observer: Optional[MatchObserver] = None,
+) -> MatchResult:
+    """Run a single match and return a stored match record.
+
+    ``observer`` receives ``start`` and ``move`` events as they happen, or
+    ``abort`` if the game raises. The caller announces the end once the record
+    is stored (see ``EventBus.finish_match``).
+    """
+    game = _Game(white, black, config, observer)
+    try:
+        with MATCHES_ACTIVE.labels().track(), ExitStack() as stack:
+            requesters = {
+                chess.WHITE: _open_requester(white, config, stack),
+                chess.BLACK: _open_requester(black, config, stack),
+            }
+            while (input_text := game.next_request()) is not None:
+                move_start = time.monotonic()
+                sandbox_result = requesters[game.board.turn](input_text, game.move_timeout_s())
+                game.apply(sandbox_result, time.monotonic() - move_start)
+    except BaseException as exc:
+        game.abort(exc)
+        raise
+    return MatchResult(record=game.record())
+
+
+async def run_match_async(
+    white: BotConfig,
+    black: BotConfig,
+    config: MatchConfig,
+    observer: Optional[MatchObserver] = None,
+) -> MatchResult:
+    """Run a single match on the event loop without blocking a thread per game."""
+    game = _Game(white, black, config, observer)
+    try:
+        with MATCHES_ACTIVE.labels().track():
+            async with AsyncExitStack() as stack:
+                requesters: Dict[chess.Color, AsyncMoveRequester] = {
+                    chess.WHITE: await _open_async_requester(white, config, stack),
+                    chess.BLACK: await _open_async_requester(black, config, stack),
+                }
+                while (input_text := game.next_request()) is not None:
+                    move_start = time.monotonic()
+                    sandbox_result = await requesters[game.board.turn](
+                        input_text, game.move_timeout_s()
+                    )
+                    game.apply(sandbox_result, time.monotonic() - move_start)
+    except BaseException as exc:
+        game.abort(exc)
+        raise
+    return MatchResult(record=game.record())
@@ -1,22 +1,243 @@
-"""Monitoring hooks for metrics and logging."""
+"""In-process metrics rendered in the Prometheus text format."""
 from __future__ import annotations
 
-import logging
-from dataclasses import dataclass
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
 
-LOGGER = logging.getLogger("chessbot.monitoring")
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DURATION_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
 
 
-@dataclass
-class TimingMetric:
-    """Timing metric for a named operation."""
+def _escape(value: str) -> str:
+    """Escape a label value for the Prometheus text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
 
-    name: str
-    duration_s: float
-    metadata: dict
 
+def _format_labels(pairs: Iterable[Tuple[str, str]]) -> str:
+    """Render ``{a="x",b="y"}``, or nothing when there are no labels."""
+    body = ",".join(f'{name}="{_escape(value)}"' for name, value in pairs)
+    return f"{{{body}}}" if body else ""
 
-def record_timing(name: str, duration_s: float, **metadata: object) -> None:
-    """Emit a timing metric via logging."""
-    metric = TimingMetric(name=name, duration_s=duration_s, metadata=metadata)
-    LOGGER.info("metric", extra={"metric": metric})
+
+def _format_value(value: float) -> str:
+    """Render a sample value, using Prometheus spellings for infinities."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric(ABC):
+    """Shared label handling; children are created once per label set and cached."""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labels: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(labels)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **values: object):
+        """Return the child for one label set; keep it to skip lookups on hot paths."""
+        key = tuple(str(values[name]) for name in self.label_names)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> object:
+        """Create the time series for a label set seen for the first time."""
+
+    def render(self) -> List[str]:
+        """Return the metric's Prometheus text lines."""
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in sorted(self._children.items()):
+            lines.extend(child.render(self.name, list(zip(self.label_names, key))))
+        return lines
+
+
+class _CounterValue:
+    """One counter time series."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Add ``amount`` to the value."""
+        with self._lock:
+            self.value += amount
+
+    def render(self, name: str, labels: List[Tuple[str, str]]) -> List[str]:
+        """Return the sample line for this series."""
+        return [f"{name}{_format_labels(labels)} {_format_value(self.value)}"]
+
+
+class _GaugeValue(_CounterValue):
+    """One gauge time series."""
+
+    def set(self, value: float) -> None:
+        """Replace the value."""
+        with self._lock:
+            self.value = value
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Subtract ``amount`` from the value."""
+        self.inc(-amount)
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count the enclosed block as in progress for as long as it runs."""
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+
+class _HistogramValue:
+    """One histogram time series with fixed bucket bounds."""
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self._lock = threading.Lock()
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Count ``value`` in its bucket and add it to the sum."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def render(self, name: str, labels: List[Tuple[str, str]]) -> List[str]:
+        """Return cumulative bucket, sum and count lines for this series."""
+        with self._lock:
+            counts, total = list(self.counts), self.sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            bucket_labels = labels + [("le", _format_value(float(bound)))]
+            lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class Counter(_Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterValue:
+        """Create a counter series starting at zero."""
+        return _CounterValue()
+
+
+class Gauge(_Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeValue:
+        """Create a gauge series starting at zero."""
+        return _GaugeValue()
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramValue:
+        """Create an empty series with this histogram's buckets."""
+        return _HistogramValue(self.buckets)
+
+
+class MetricsRegistry:
+    """In-memory collection of metrics rendered in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """Add a metric; registering the same name twice returns the first one."""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        """Register (or look up) a counter."""
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        """Register (or look up) a gauge."""
+        return self.register(Gauge(name, help_text, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Register (or look up) a histogram with the given bucket bounds."""
+        return self.register(Histogram(name, help_text, labels, buckets))
+
+    def render(self) -> str:
+        """Return every metric in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+BOT_MOVE_SECONDS = REGISTRY.histogram(
+    "chessbot_bot_move_seconds", "Wall time a bot took to answer one move.", ("bot",)
+)
+BOT_MOVE_CPU_SECONDS = REGISTRY.histogram(
+    "chessbot_bot_move_cpu_seconds", "CPU time a bot process used for one move.", ("bot",)
+)
+SANDBOX_SPAWN_SECONDS = REGISTRY.histogram(
+    "chessbot_sandbox_spawn_seconds",
+    "Time to start one sandboxed bot process.",
+    ("bot", "mode"),
+)
+MATCH_DURATION_SECONDS = REGISTRY.histogram(
+    "chessbot_match_duration_seconds",
+    "Wall time of finished matches.",
+    ("result",),
+    buckets=DURATION_BUCKETS,
+)
+MATCHES_TOTAL = REGISTRY.counter("chessbot_matches_total", "Finished matches.", ("result",))
+MATCH_TERMINATIONS_TOTAL = REGISTRY.counter(
+    "chessbot_match_terminations_total",
+    "Finished matches by how they ended, including adjudications.",
+    ("termination",),
+)
+MATCHES_ACTIVE = REGISTRY.gauge("chessbot_matches_active", "Matches currently being played.")
+QUEUE_DEPTH = REGISTRY.gauge(
+    "chessbot_queue_depth", "Games waiting to be played, per queue.", ("queue",)
+)
@@ -0,0 +1,100 @@
+"""Opening suites: starting positions read from EPD or FEN files."""
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+import chess
+
+from chessbot.services.scheduler import Pairing
+
+SUITE_SUFFIXES = (".epd", ".fen", ".txt")
+
+
+class OpeningSuiteError(ValueError):
+    """Raised when an opening suite cannot be used."""
+
+
+class OpeningSuiteNotFound(OpeningSuiteError):
+    """Raised when no suite file has the requested name."""
+
+
+def parse_position(line: str) -> str:
+    """Return the full FEN for one EPD or FEN line; raise ValueError if invalid."""
+    fields = line.split()
+    if len(fields) >= 6 and fields[4].isdigit() and fields[5].isdigit():
+        board = chess.Board(" ".join(fields[:6]))
+    else:
+        board, _operations = chess.Board.from_epd(line)
+    if not board.is_valid():
+        raise ValueError(f"illegal position: {line}")
+    return board.fen()
+
+
+def parse_suite(text: str) -> List[str]:
+    """Parse suite text: one position per line; blank lines and ``#`` comments skipped."""
+    positions = []
+    for number, raw in enumerate(text.splitlines(), start=1):
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            positions.append(parse_position(line))
+        except ValueError as exc:
+            raise OpeningSuiteError(f"line {number}: {exc}") from exc
+    if not positions:
+        raise OpeningSuiteError("suite has no positions")
+    return positions
+
+
+def suite_path(directory: str, name: str) -> Path:
+    """Resolve suite ``name`` inside ``directory``; names may not contain paths."""
+    if not name or Path(name).name != name or name.startswith("."):
+        raise OpeningSuiteError(f"invalid suite name: {name!r}")
+    path = Path(directory) / name
+    if not path.is_file():
+        raise OpeningSuiteNotFound(f"opening suite not found: {name}")
+    return path
+
+
+def load_suite(directory: str, name: str) -> List[str]:
+    """Load suite ``name`` from ``directory``; cached until the file changes."""
+    path = suite_path(directory, name)
+    stat = path.stat()
+    return list(_load_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def list_suites(directory: str) -> List[str]:
+    """Names of the suite files in ``directory``."""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        entry.name
+        for entry in Path(directory).iterdir()
+        if entry.is_file() and entry.suffix in SUITE_SUFFIXES
+    )
+
+
+def paired_openings(
+    pairings: Sequence[Pairing], positions: Sequence[str], offset: int = 0
+) -> List[Pairing]:
+    """Turn each pairing into two games on one opening with colors reversed.
+
+    Openings are handed out in suite order starting at ``offset``, wrapping around
+    when there are more pairings than positions.
+    """
+    games = []
+    for index, pairing in enumerate(pairings, start=offset):
+        start_fen = positions[index % len(positions)]
+        games.append(Pairing(pairing.white_id, pairing.black_id, start_fen))
+        games.append(Pairing(pairing.black_id, pairing.white_id, start_fen))
+    return games
+
+
+@lru_cache(maxsize=32)
+def _load_cached(path: str, _mtime_ns: int, _size: int) -> Tuple[str, ...]:
+    """Parse a suite file; the stat fields only invalidate the cache."""
+    with open(path, encoding="utf-8") as handle:
+        return tuple(parse_suite(handle.read()))
@@ -0,0 +1,95 @@
+"""Per-move latency and resource aggregates for matches and bots."""
+from __future__ import annotations
+
+import math
+from typing import Iterable, List, Optional, Sequence
+from uuid import UUID
+
+from chessbot.models import BotMatchPerf, BotPerfReport, MatchSummary
+from chessbot.services.sandbox import DEFAULT_MEMORY_BYTES, SandboxResult
+
+# Newest matches of a bot read for a report; ones without perf data are skipped.
+PERF_HISTORY_LIMIT = 5000
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank ``q``-th percentile of a non-empty sequence."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100.0 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class PerfTracker:
+    """Collects one side's per-move wall time, CPU time and peak RSS in a match."""
+
+    def __init__(self) -> None:
+        self.think_s: List[float] = []
+        self.cpu_s: List[float] = []
+        self.max_rss_bytes: Optional[int] = None
+
+    def add(self, sandbox_result: SandboxResult, elapsed_s: float) -> None:
+        """Record one move."""
+        self.think_s.append(elapsed_s)
+        if sandbox_result.cpu_s is not None:
+            self.cpu_s.append(sandbox_result.cpu_s)
+        if sandbox_result.max_rss_bytes is not None:
+            self.max_rss_bytes = max(self.max_rss_bytes or 0, sandbox_result.max_rss_bytes)
+
+    def summary(self) -> Optional[BotMatchPerf]:
+        """Aggregates for the match; None if the side never moved."""
+        if not self.think_s:
+            return None
+        return BotMatchPerf(
+            moves=len(self.think_s),
+            think_p50_s=round(percentile(self.think_s, 50), 6),
+            think_p95_s=round(percentile(self.think_s, 95), 6),
+            think_max_s=round(max(self.think_s), 6),
+            cpu_s=round(sum(self.cpu_s), 6) if self.cpu_s else None,
+            cpu_max_s=round(max(self.cpu_s), 6) if self.cpu_s else None,
+            max_rss_bytes=self.max_rss_bytes,
+        )
+
+
+def bot_perf_report(
+    bot_id: UUID, name: str, summaries: Iterable[MatchSummary], limit: int
+) -> BotPerfReport:
+    """Profile ``bot_id`` from the newest ``limit`` of its matches in ``summaries``.
+
+    Only matches with perf data count; a self-play match counts once but
+    contributes both sides' moves.
+    """
+    perfs: List[BotMatchPerf] = []
+    matches = 0
+    for summary in summaries:
+        if matches >= limit:
+            break
+        sides = [
+            perf
+            for player, perf in (
+                (summary.white_bot_id, summary.white_perf),
+                (summary.black_bot_id, summary.black_perf),
+            )
+            if player == bot_id and perf is not None
+        ]
+        if sides:
+            matches += 1
+            perfs.extend(sides)
+    report = BotPerfReport(
+        bot_id=bot_id, name=name, matches=matches, moves=sum(p.moves for p in perfs)
+    )
+    if not perfs:
+        return report
+    report.think_p50_s = percentile([p.think_p50_s for p in perfs], 50)
+    report.think_p95_s = percentile([p.think_p95_s for p in perfs], 95)
+    report.think_max_s = max(p.think_max_s for p in perfs)
+    measured = [p for p in perfs if p.cpu_s is not None]
+    if measured:
+        report.cpu_per_move_s = round(
+            sum(p.cpu_s for p in measured) / sum(p.moves for p in measured), 6
+        )
+        report.cpu_max_s = max(p.cpu_max_s for p in measured)
+    peaks = [p.max_rss_bytes for p in perfs if p.max_rss_bytes is not None]
+    if peaks:
+        report.max_rss_bytes = max(peaks)
+        report.memory_limit_fraction = round(report.max_rss_bytes / DEFAULT_MEMORY_BYTES, 4)
+    return report
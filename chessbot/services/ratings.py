@@ -0,0 +1,294 @@
+"""Elo and Glicko-2 ratings, updated per match or recomputed in bulk.
+
+Every game is rated on its own: Glicko-2 runs with one game per rating period.
+Incremental updates rate a match when it is first stored; a full recompute rates
+matches by start time (``created_at``, then ID), so the two agree unless games
+that ran concurrently were stored out of start order.
+The bulk recompute uses NumPy when it is installed: games are grouped into levels in
+which no bot plays twice and which only depend on earlier levels, and each level is
+rated as one vectorized step, which gives the same ratings as playing the games one
+by one.
+"""
+from __future__ import annotations
+
+import math
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+from uuid import UUID
+
+from chessbot.models import MatchRecord, Rating
+from chessbot.services.scoring import legacy_white_name, white_score
+
+try:  # optional: speeds up full recomputes
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+ELO_INITIAL = 1500.0
+ELO_K = 32.0
+GLICKO_INITIAL_RATING = 1500.0
+GLICKO_INITIAL_RD = 350.0
+GLICKO_INITIAL_VOLATILITY = 0.06
+GLICKO_TAU = 0.5
+GLICKO_SCALE = 173.7178
+GLICKO_EPSILON = 1e-6
+
+Game = Tuple[UUID, UUID, float]
+
+
+@dataclass(slots=True)
+class PlayerRating:
+    """One bot's current ratings."""
+
+    elo: float = ELO_INITIAL
+    rating: float = GLICKO_INITIAL_RATING
+    rd: float = GLICKO_INITIAL_RD
+    volatility: float = GLICKO_INITIAL_VOLATILITY
+    games: int = 0
+
+
+Ratings = Dict[UUID, PlayerRating]
+
+
+def new_ratings() -> Ratings:
+    """Return an empty ratings table; unknown bots start at the initial ratings."""
+    return defaultdict(PlayerRating)
+
+
+def game_for(match: MatchRecord, bot_name: Callable[[UUID], str]) -> Game:
+    """Reduce a stored match to ``(white, black, white's score)``."""
+    return (
+        match.white_bot_id,
+        match.black_bot_id,
+        white_score(match, legacy_white_name(match, bot_name)),
+    )
+
+
+def rate_game(ratings: Ratings, white_id: UUID, black_id: UUID, score: float) -> None:
+    """Update both players' ratings for one game; ``score`` is white's."""
+    white, black = ratings[white_id], ratings[black_id]
+    white_elo, black_elo = white.elo, black.elo
+    white_glicko = (white.rating, white.rd, white.volatility)
+    black_glicko = (black.rating, black.rd, black.volatility)
+
+    white.elo = _elo(white_elo, black_elo, score)
+    black.elo = _elo(black_elo, white_elo, 1.0 - score)
+    white.rating, white.rd, white.volatility = _glicko2(*white_glicko, *black_glicko[:2], score)
+    black.rating, black.rd, black.volatility = _glicko2(
+        *black_glicko, *white_glicko[:2], 1.0 - score
+    )
+    white.games += 1
+    black.games += 1
+
+
+def rate_stored_match(
+    ratings: Ratings, match: MatchRecord, bot_name: Callable[[UUID], str]
+) -> None:
+    """Apply one stored match to ``ratings``."""
+    rate_game(ratings, *game_for(match, bot_name))
+
+
+def ratings_for(matches: Iterable[MatchRecord], bot_name: Callable[[UUID], str]) -> Ratings:
+    """Rate every match in ``matches`` from scratch, in iteration order."""
+    return recompute_ratings([game_for(match, bot_name) for match in matches])
+
+
+def recompute_ratings(games: Sequence[Game]) -> Ratings:
+    """Rate ``games`` in order; vectorized when NumPy is available."""
+    if np is None or not games:
+        ratings = new_ratings()
+        for white_id, black_id, score in games:
+            rate_game(ratings, white_id, black_id, score)
+        return ratings
+    return _recompute_vectorized(games)
+
+
+def ratings_from_state(
+    ratings: Mapping[UUID, PlayerRating], bot_name: Callable[[UUID], str]
+) -> List[Rating]:
+    """Build rating entries sorted by Glicko-2 rating, best first."""
+    entries = [
+        Rating(
+            bot_id=bot_id,
+            name=bot_name(bot_id),
+            elo=state.elo,
+            rating=state.rating,
+            rd=state.rd,
+            volatility=state.volatility,
+            games=state.games,
+        )
+        for bot_id, state in ratings.items()
+    ]
+    entries.sort(key=lambda entry: (-entry.rating, entry.name))
+    return entries
+
+
+def _elo(rating: float, opponent: float, score: float) -> float:
+    """Elo rating after one game."""
+    expected = 1.0 / (1.0 + 10.0 ** ((opponent - rating) / 400.0))
+    return rating + ELO_K * (score - expected)
+
+
+def _glicko2(
+    rating: float,
+    rd: float,
+    volatility: float,
+    opponent_rating: float,
+    opponent_rd: float,
+    score: float,
+) -> Tuple[float, float, float]:
+    """Glicko-2 rating, deviation and volatility after a one-game rating period."""
+    mu = (rating - GLICKO_INITIAL_RATING) / GLICKO_SCALE
+    phi = rd / GLICKO_SCALE
+    opponent_mu = (opponent_rating - GLICKO_INITIAL_RATING) / GLICKO_SCALE
+    opponent_phi = opponent_rd / GLICKO_SCALE
+
+    g = 1.0 / math.sqrt(1.0 + 3.0 * opponent_phi**2 / math.pi**2)
+    expected = 1.0 / (1.0 + math.exp(-g * (mu - opponent_mu)))
+    v = 1.0 / (g**2 * expected * (1.0 - expected))
+    delta = v * g * (score - expected)
+
+    new_volatility = _volatility(phi, volatility, v, delta)
+    phi_star = math.sqrt(phi**2 + new_volatility**2)
+    new_phi = 1.0 / math.sqrt(1.0 / phi_star**2 + 1.0 / v)
+    new_mu = mu + new_phi**2 * g * (score - expected)
+    return (
+        GLICKO_SCALE * new_mu + GLICKO_INITIAL_RATING,
+        GLICKO_SCALE * new_phi,
+        new_volatility,
+    )
+
+
+def _volatility(phi: float, volatility: float, v: float, delta: float) -> float:
+    """New volatility via the Illinois iteration from Glickman's Glicko-2 paper."""
+    a = math.log(volatility**2)
+    spread = phi**2 + v
+    excess = delta**2 - spread
+
+    def f(x: float) -> float:
+        ex = math.exp(x)
+        return ex * (excess - ex) / (2.0 * (spread + ex) ** 2) - (x - a) / GLICKO_TAU**2
+
+    low = a
+    if excess > 0:
+        high = math.log(excess)
+    else:
+        high = a - GLICKO_TAU
+        while f(high) < 0:
+            high -= GLICKO_TAU
+
+    f_low, f_high = f(low), f(high)
+    while abs(high - low) > GLICKO_EPSILON:
+        mid = low + (low - high) * f_low / (f_high - f_low)
+        f_mid = f(mid)
+        if f_mid * f_high <= 0:
+            low, f_low = high, f_high
+        else:
+            f_low /= 2.0
+        high, f_high = mid, f_mid
+    return math.exp(low / 2.0)
+
+
+def _levels(white: Sequence[int], black: Sequence[int]) -> List[int]:
+    """Assign each game the earliest step at which both players' previous games are done.
+
+    Games on the same level share no bot, and every game comes after both players'
+    earlier games, so rating level by level matches rating game by game.
+    """
+    last: Dict[int, int] = {}
+    levels = []
+    for white_player, black_player in zip(white, black):
+        level = max(last.get(white_player, -1), last.get(black_player, -1)) + 1
+        last[white_player] = last[black_player] = level
+        levels.append(level)
+    return levels
+
+
+def _recompute_vectorized(games: Sequence[Game]) -> Ratings:
+    """NumPy implementation of ``recompute_ratings``."""
+    index: Dict[UUID, int] = {}
+    white = [index.setdefault(white_id, len(index)) for white_id, _black, _score in games]
+    black = [index.setdefault(black_id, len(index)) for _white, black_id, _score in games]
+    white_idx = np.asarray(white, dtype=np.int64)
+    black_idx = np.asarray(black, dtype=np.int64)
+    scores = np.asarray([score for _white, _black, score in games], dtype=np.float64)
+    levels = np.asarray(_levels(white, black), dtype=np.int64)
+    order = np.argsort(levels, kind="stable")
+    bounds = np.flatnonzero(np.diff(levels[order])) + 1
+    steps = np.split(order, bounds)
+
+    players = len(index)
+    elo = np.full(players, ELO_INITIAL)
+    mu = np.zeros(players)
+    phi = np.full(players, GLICKO_INITIAL_RD / GLICKO_SCALE)
+    volatility = np.full(players, GLICKO_INITIAL_VOLATILITY)
+    played = np.zeros(players, dtype=np.int64)
+
+    with np.errstate(all="ignore"):
+        for step in steps:
+            side = np.concatenate((white_idx[step], black_idx[step]))
+            other = np.concatenate((black_idx[step], white_idx[step]))
+            score = np.concatenate((scores[step], 1.0 - scores[step]))
+
+            expected_elo = 1.0 / (1.0 + 10.0 ** ((elo[other] - elo[side]) / 400.0))
+            new_elo = elo[side] + ELO_K * (score - expected_elo)
+
+            g = 1.0 / np.sqrt(1.0 + 3.0 * phi[other] ** 2 / math.pi**2)
+            expected = 1.0 / (1.0 + np.exp(-g * (mu[side] - mu[other])))
+            v = 1.0 / (g**2 * expected * (1.0 - expected))
+            delta = v * g * (score - expected)
+            new_volatility = _volatility_vectorized(phi[side], volatility[side], v, delta)
+            phi_star = np.sqrt(phi[side] ** 2 + new_volatility**2)
+            new_phi = 1.0 / np.sqrt(1.0 / phi_star**2 + 1.0 / v)
+            new_mu = mu[side] + new_phi**2 * g * (score - expected)
+
+            elo[side] = new_elo
+            mu[side] = new_mu
+            phi[side] = new_phi
+            volatility[side] = new_volatility
+            # Self-play lists a bot twice in ``side``; count both games as rate_game does.
+            np.add.at(played, side, 1)
+
+    ratings = new_ratings()
+    for bot_id, position in index.items():
+        ratings[bot_id] = PlayerRating(
+            elo=float(elo[position]),
+            rating=float(GLICKO_SCALE * mu[position] + GLICKO_INITIAL_RATING),
+            rd=float(GLICKO_SCALE * phi[position]),
+            volatility=float(volatility[position]),
+            games=int(played[position]),
+        )
+    return ratings
+
+
+def _volatility_vectorized(phi, volatility, v, delta):
+    """Array form of ``_volatility``; lanes stop iterating once they converge."""
+    a = np.log(volatility**2)
+    spread = phi**2 + v
+    excess = delta**2 - spread
+
+    def f(x):
+        ex = np.exp(x)
+        return ex * (excess - ex) / (2.0 * (spread + ex) ** 2) - (x - a) / GLICKO_TAU**2
+
+    low = a.copy()
+    wide = excess > 0
+    high = np.where(wide, np.log(np.where(wide, excess, 1.0)), a - GLICKO_TAU)
+    stepping = ~wide & (f(high) < 0)
+    while stepping.any():
+        high = np.where(stepping, high - GLICKO_TAU, high)
+        stepping &= f(high) < 0
+
+    f_low, f_high = f(low), f(high)
+    active = np.abs(high - low) > GLICKO_EPSILON
+    while active.any():
+        mid = low + (low - high) * f_low / (f_high - f_low)
+        f_mid = f(mid)
+        swap = f_mid * f_high <= 0
+        low = np.where(active & swap, high, low)
+        f_low = np.where(active, np.where(swap, f_high, f_low / 2.0), f_low)
+        high = np.where(active, mid, high)
+        f_high = np.where(active, f_mid, f_high)
+        active &= np.abs(high - low) > GLICKO_EPSILON
+    return np.exp(low / 2.0)
@@ -1,11 +1,34 @@
 """Sandbox helpers for running untrusted bot processes."""
 from __future__ import annotations
 
+import asyncio
+import atexit
+import json
 import os
+import re
 import resource
+import selectors
+import shutil
+import signal
+import socket
 import subprocess
+import sys
+import tempfile
+import threading
+import time
 from dataclasses import dataclass
-from typing import List
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from chessbot.services.monitoring import SANDBOX_SPAWN_SECONDS
+
+STDERR_TAIL_BYTES = 4096
+DEFAULT_MEMORY_BYTES = 256 * 1024 * 1024
+TEMPLATE_CPU_SECONDS = 30
+FORK_TEMPLATE = str(Path(__file__).with_name("fork_template.py"))
+PYTHON_EXECUTABLE = re.compile(r"python(\d+(\.\d+)*)?")
+# ``ru_maxrss`` is in kilobytes on Linux and in bytes on macOS.
+RSS_UNIT_BYTES = 1 if sys.platform == "darwin" else 1024
 
 
 @dataclass
@@ -16,6 +39,8 @@ class SandboxResult:
     stderr: str
     timed_out: bool
     returncode: int
+    cpu_s: Optional[float] = None
+    max_rss_bytes: Optional[int] = None
 
 
 def _apply_limits(cpu_seconds: int, memory_bytes: int) -> None:
@@ -24,35 +49,687 @@ def _apply_limits(cpu_seconds: int, memory_bytes: int) -> None:
     resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
 
 
+def _limit_template() -> None:
+    """Soft-cap a fork-server template's memory and CPU; its children set their own hard limits.
+
+    A template that spins at import time ignores its preload alarm but is still
+    stopped by ``SIGXCPU``; ``fork_server`` then starts a fresh one.
+    """
+    resource.setrlimit(resource.RLIMIT_AS, (DEFAULT_MEMORY_BYTES, resource.RLIM_INFINITY))
+    resource.setrlimit(resource.RLIMIT_CPU, (TEMPLATE_CPU_SECONDS, resource.RLIM_INFINITY))
+
+
+def _sandbox_env() -> dict:
+    """Return the minimal environment passed to bot processes."""
+    return {"PATH": os.environ.get("PATH", "")}
+
+
+def _spawn_oneshot(
+    command: List[str], cpu_seconds: int, memory_bytes: int, bot: str
+) -> Tuple[subprocess.Popen, int, int]:
+    """Start a restricted one-shot child; return it with its stdout and stderr read fds."""
+    spawn_start = time.monotonic()
+    stdout_r, stdout_w = os.pipe()
+    stderr_r, stderr_w = os.pipe()
+    try:
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=stdout_w,
+            stderr=stderr_w,
+            env=_sandbox_env(),
+            preexec_fn=lambda: _apply_limits(cpu_seconds, memory_bytes),
+        )
+    except BaseException:
+        os.close(stdout_r)
+        os.close(stderr_r)
+        raise
+    finally:
+        os.close(stdout_w)
+        os.close(stderr_w)
+    SANDBOX_SPAWN_SECONDS.labels(bot=bot, mode="oneshot").observe(time.monotonic() - spawn_start)
+    return process, stdout_r, stderr_r
+
+
+def _send_input(process: subprocess.Popen, input_text: str) -> None:
+    """Write the request to the child's stdin and close it; a child that quit is ignored."""
+    try:
+        process.stdin.write(input_text.encode())
+        process.stdin.close()
+    except OSError:
+        pass
+
+
+def _oneshot_result(
+    stdout: bytes, stderr: bytes, timed_out: bool, usage: Tuple[int, float, int]
+) -> SandboxResult:
+    """Build the result of a reaped one-shot child."""
+    returncode, cpu_s, max_rss_bytes = usage
+    return SandboxResult(
+        stdout=stdout.decode(errors="replace").strip(),
+        stderr=stderr.decode(errors="replace").strip(),
+        timed_out=timed_out,
+        returncode=-1 if timed_out else returncode,
+        cpu_s=cpu_s,
+        max_rss_bytes=max_rss_bytes,
+    )
+
+
 def run_sandboxed(
     command: List[str],
     input_text: str,
     timeout_s: float,
     cpu_seconds: int = 1,
     memory_bytes: int = 256 * 1024 * 1024,
+    bot: str = "",
 ) -> SandboxResult:
-    """Run a command in a restricted subprocess."""
-    env = {"PATH": os.environ.get("PATH", "")}
+    """Run a command in a restricted subprocess.
+
+    The child is reaped with ``wait4`` so the result carries its CPU time and peak
+    RSS, also for a child killed at the timeout. ``bot`` only labels the
+    spawn-time metric.
+    """
+    process, stdout_r, stderr_r = _spawn_oneshot(command, cpu_seconds, memory_bytes, bot)
+    deadline = time.monotonic() + timeout_s
+    try:
+        _send_input(process, input_text)
+        stdout, stderr, timed_out = _read_until_eof(stdout_r, stderr_r, deadline)
+    except BaseException:
+        process.kill()
+        _wait_with_usage(process)
+        raise
+    if timed_out:
+        process.kill()
+    return _oneshot_result(stdout, stderr, timed_out, _wait_with_usage(process))
+
+
+async def run_sandboxed_async(
+    command: List[str],
+    input_text: str,
+    timeout_s: float,
+    cpu_seconds: int = 1,
+    memory_bytes: int = 256 * 1024 * 1024,
+    bot: str = "",
+) -> SandboxResult:
+    """Async variant of ``run_sandboxed`` that does not block a thread while waiting.
+
+    The pipes are watched by the event loop and the child is reaped by
+    ``_wait_with_usage_async``, not by asyncio's child watcher, so the result keeps
+    its CPU time and peak RSS.
+    """
+    process, stdout_r, stderr_r = _spawn_oneshot(command, cpu_seconds, memory_bytes, bot)
+    try:
+        _send_input(process, input_text)
+        stdout, stderr, timed_out = await _read_until_eof_async(stdout_r, stderr_r, timeout_s)
+    except BaseException:
+        process.kill()
+        _wait_with_usage(process)
+        raise
+    if timed_out:
+        process.kill()
+    return _oneshot_result(stdout, stderr, timed_out, await _wait_with_usage_async(process))
+
+
+def _wait_with_usage(process: subprocess.Popen) -> Tuple[int, float, int]:
+    """Reap ``process`` and return its exit code, CPU seconds and peak RSS in bytes."""
+    _pid, status, usage = os.wait4(process.pid, 0)
+    return _exit_usage(process, status, usage)
+
+
+async def _wait_with_usage_async(process: subprocess.Popen) -> Tuple[int, float, int]:
+    """``_wait_with_usage`` without blocking the event loop.
+
+    The loop watches a pidfd for the exit where the platform has one; elsewhere
+    ``wait4`` is polled with ``WNOHANG`` at a growing interval.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        pidfd = os.pidfd_open(process.pid)
+    except (AttributeError, OSError):
+        pidfd = None
+    if pidfd is not None:
+        exited = loop.create_future()
+        loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+        try:
+            await exited
+        finally:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+        return _wait_with_usage(process)
+    delay = 0.001
+    while True:
+        pid, status, usage = os.wait4(process.pid, os.WNOHANG)
+        if pid:
+            return _exit_usage(process, status, usage)
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.05)
+
+
+def _exit_usage(
+    process: subprocess.Popen, status: int, usage: resource.struct_rusage
+) -> Tuple[int, float, int]:
+    """Record a reaped child's exit code; return it with its CPU seconds and peak RSS."""
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, usage.ru_utime + usage.ru_stime, usage.ru_maxrss * RSS_UNIT_BYTES
+
+
+def process_usage(pid: int) -> Optional[Tuple[float, int]]:
+    """CPU seconds used so far and peak RSS in bytes of a live process.
+
+    Read from ``/proc``, so only available on Linux; None elsewhere or once the
+    process is gone.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", encoding="ascii") as handle:
+            stat = handle.read()
+        with open(f"/proc/{pid}/status", encoding="ascii") as handle:
+            status = handle.read()
+    except OSError:
+        return None
+    # Fields after the parenthesised command name start at field 3 (state).
+    fields = stat.rsplit(")", 1)[1].split()
+    cpu_s = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    peak = re.search(r"^VmHWM:\s+(\d+) kB", status, re.MULTILINE)
+    return cpu_s, int(peak.group(1)) * 1024 if peak else 0
+
+
+class _SessionUsage:
+    """Splits a long-lived process's CPU time into per-request amounts."""
+
+    def __init__(self, pid: int) -> None:
+        self._pid = pid
+        self._cpu_s = 0.0
+
+    def sample(self) -> Tuple[Optional[float], Optional[int]]:
+        """CPU seconds since the previous sample and peak RSS so far."""
+        usage = process_usage(self._pid)
+        if usage is None:
+            return None, None
+        cpu_s, max_rss_bytes = usage
+        delta, self._cpu_s = cpu_s - self._cpu_s, cpu_s
+        return delta, max_rss_bytes
+
+
+def is_forkable(command: List[str]) -> bool:
+    """Whether ``command`` runs a Python script and can use a fork server."""
+    return (
+        len(command) >= 2
+        and PYTHON_EXECUTABLE.fullmatch(os.path.basename(command[0])) is not None
+        and command[1].endswith(".py")
+    )
+
+
+class ForkServer:
+    """Warm template process that forks ready one-shot bot processes.
+
+    The template (``fork_template.py``, run by the bot's own interpreter) imports
+    the bot script once; every move then costs a ``fork`` of that process instead
+    of an interpreter start and the bot's imports. Children get the same rlimits
+    and environment as ``run_sandboxed``; their CPU time starts from zero.
+    """
+
+    def __init__(self, command: List[str]) -> None:
+        self.command = list(command)
+        self._directory = tempfile.mkdtemp(prefix="chessbot-fork-")
+        self.address = os.path.join(self._directory, "template.sock")
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            listener.bind(self.address)
+            listener.listen(64)
+            self._process = subprocess.Popen(
+                [command[0], FORK_TEMPLATE, str(listener.fileno()), *command[1:]],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                env=_sandbox_env(),
+                pass_fds=(listener.fileno(),),
+                preexec_fn=_limit_template,
+            )
+        except BaseException:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            raise
+        finally:
+            listener.close()
+
+    @property
+    def alive(self) -> bool:
+        """Whether the template process is still running."""
+        return self._process.poll() is None
+
+    def run(
+        self,
+        input_text: str,
+        timeout_s: float,
+        cpu_seconds: int = 1,
+        memory_bytes: int = 256 * 1024 * 1024,
+        bot: str = "",
+    ) -> SandboxResult:
+        """Fork one child, feed it ``input_text`` and collect its output like ``run_sandboxed``.
+
+        Raises OSError when the template cannot be reached.
+        """
+        deadline = time.monotonic() + timeout_s
+        spawn_start = time.monotonic()
+        stdin_r, stdin_w = os.pipe()
+        stdout_r, stdout_w = os.pipe()
+        stderr_r, stderr_w = os.pipe()
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            try:
+                conn.settimeout(max(timeout_s, 1.0))
+                conn.connect(self.address)
+                limits = {"cpu_seconds": cpu_seconds, "memory_bytes": memory_bytes}
+                socket.send_fds(
+                    conn, [json.dumps(limits).encode()], [stdin_r, stdout_w, stderr_w]
+                )
+            except OSError:
+                for fd in (stdin_w, stdout_r, stderr_r):
+                    os.close(fd)
+                raise
+            finally:
+                for fd in (stdin_r, stdout_w, stderr_w):
+                    os.close(fd)
+            replies = _LineReader(conn)
+            try:
+                pid = int(replies.expect("pid"))
+            except (OSError, ValueError):
+                for fd in (stdin_w, stdout_r, stderr_r):
+                    os.close(fd)
+                raise OSError("fork server did not start the bot") from None
+            SANDBOX_SPAWN_SECONDS.labels(bot=bot, mode="forkserver").observe(
+                time.monotonic() - spawn_start
+            )
+
+            try:
+                os.write(stdin_w, input_text.encode())
+            except OSError:
+                pass
+            os.close(stdin_w)
+            stdout, stderr, timed_out = _read_until_eof(stdout_r, stderr_r, deadline)
+            if timed_out:
+                try:
+                    os.kill(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            cpu_s: Optional[float] = None
+            max_rss_bytes: Optional[int] = None
+            try:
+                conn.settimeout(0.5)
+                code, cpu, rss = replies.expect("exit").split()
+                returncode = int(code)
+                cpu_s, max_rss_bytes = float(cpu), int(rss) * RSS_UNIT_BYTES
+            except (OSError, ValueError):
+                returncode = -1
+        return SandboxResult(
+            stdout=stdout.decode(errors="replace").strip(),
+            stderr=stderr.decode(errors="replace").strip(),
+            timed_out=timed_out,
+            returncode=-1 if timed_out else returncode,
+            cpu_s=cpu_s,
+            max_rss_bytes=max_rss_bytes,
+        )
+
+    def close(self, timeout_s: float = 1.0) -> None:
+        """Stop the template; children that are still running finish on their own.
+
+        The template is killed if it has not exited ``timeout_s`` after its stdin
+        is closed.
+        """
+        if self._process.stdin and not self._process.stdin.closed:
+            self._process.stdin.close()
+        try:
+            self._process.wait(timeout=timeout_s)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        shutil.rmtree(self._directory, ignore_errors=True)
+
+
+class _LineReader:
+    """Reads the template's newline-terminated ``<kind> <value>`` replies."""
+
+    def __init__(self, conn: socket.socket) -> None:
+        self._conn = conn
+        self._buffer = b""
+
+    def expect(self, kind: str) -> str:
+        """Return the value of the next reply, which must be of ``kind``."""
+        while b"\n" not in self._buffer:
+            chunk = self._conn.recv(256)
+            if not chunk:
+                raise OSError("fork server closed the connection")
+            self._buffer += chunk
+        line, _sep, self._buffer = self._buffer.partition(b"\n")
+        name, _sep, value = line.decode().partition(" ")
+        if name != kind:
+            raise ValueError(f"unexpected fork server reply: {line!r}")
+        return value
+
+
+def _read_until_eof(
+    stdout_fd: int, stderr_fd: int, deadline: float
+) -> Tuple[bytes, bytes, bool]:
+    """Read both pipes to EOF; stop early (timed out) at ``deadline``. Closes the fds."""
+    output = {stdout_fd: b"", stderr_fd: b""}
+    with selectors.DefaultSelector() as selector:
+        for fd in output:
+            selector.register(fd, selectors.EVENT_READ)
+        try:
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return output[stdout_fd], output[stderr_fd], True
+                for key, _mask in selector.select(timeout=remaining):
+                    chunk = os.read(key.fd, 65536)
+                    if chunk:
+                        output[key.fd] += chunk
+                    else:
+                        selector.unregister(key.fd)
+        finally:
+            for fd in output:
+                os.close(fd)
+    return output[stdout_fd], output[stderr_fd], False
+
+
+async def _read_until_eof_async(
+    stdout_fd: int, stderr_fd: int, timeout_s: float
+) -> Tuple[bytes, bytes, bool]:
+    """``_read_until_eof`` on the running event loop, giving up after ``timeout_s``."""
+    loop = asyncio.get_running_loop()
+    output = {stdout_fd: b"", stderr_fd: b""}
+    reading = set(output)
+    eof = loop.create_future()
+
+    def read(fd: int) -> None:
+        chunk = os.read(fd, 65536)
+        if chunk:
+            output[fd] += chunk
+            return
+        loop.remove_reader(fd)
+        reading.discard(fd)
+        if not reading and not eof.done():
+            eof.set_result(None)
+
     try:
-        completed = subprocess.run(
+        for fd in output:
+            loop.add_reader(fd, read, fd)
+        await asyncio.wait([eof], timeout=timeout_s)
+    finally:
+        for fd in reading:
+            loop.remove_reader(fd)
+        for fd in output:
+            os.close(fd)
+    return output[stdout_fd], output[stderr_fd], not eof.done()
+
+
+_FORK_SERVERS: Dict[Tuple[str, ...], ForkServer] = {}
+_FORK_SERVERS_LOCK = threading.Lock()
+
+
+def fork_server(command: List[str]) -> ForkServer:
+    """Return the running fork server for ``command``, starting one if needed."""
+    key = tuple(command)
+    with _FORK_SERVERS_LOCK:
+        server = _FORK_SERVERS.get(key)
+        if server is None or not server.alive:
+            if server is not None:
+                server.close()
+            server = _FORK_SERVERS[key] = ForkServer(command)
+        return server
+
+
+def _drop_fork_server(command: List[str], server: ForkServer) -> None:
+    """Kill an unresponsive template so the next move starts a fresh one."""
+    with _FORK_SERVERS_LOCK:
+        if _FORK_SERVERS.get(tuple(command)) is server:
+            del _FORK_SERVERS[tuple(command)]
+    server.close(timeout_s=0)
+
+
+@atexit.register
+def close_fork_servers() -> None:
+    """Stop every fork server template."""
+    with _FORK_SERVERS_LOCK:
+        servers = list(_FORK_SERVERS.values())
+        _FORK_SERVERS.clear()
+    for server in servers:
+        server.close()
+
+
+def run_forked(
+    command: List[str],
+    input_text: str,
+    timeout_s: float,
+    cpu_seconds: int = 1,
+    memory_bytes: int = 256 * 1024 * 1024,
+    bot: str = "",
+) -> SandboxResult:
+    """``run_sandboxed`` through the command's fork server.
+
+    Commands that are not Python scripts, or whose template cannot be reached, run
+    through ``run_sandboxed`` instead; a template that does not answer is killed
+    and dropped so later moves do not wait on it again.
+    """
+    if is_forkable(command):
+        server = fork_server(command)
+        try:
+            return server.run(input_text, timeout_s, cpu_seconds, memory_bytes, bot)
+        except OSError:
+            _drop_fork_server(command, server)
+    return run_sandboxed(command, input_text, timeout_s, cpu_seconds, memory_bytes, bot)
+
+
+class SandboxSession:
+    """Long-lived restricted bot process answering one request per input line.
+
+    The process is started once under the same rlimits as ``run_sandboxed``; the
+    CPU limit therefore covers the whole session rather than a single move.
+    """
+
+    def __init__(
+        self,
+        command: List[str],
+        cpu_seconds: int = 1,
+        memory_bytes: int = 256 * 1024 * 1024,
+        bot: str = "",
+    ) -> None:
+        spawn_start = time.monotonic()
+        self._process = subprocess.Popen(
             command,
-            input=input_text,
-            text=True,
-            capture_output=True,
-            timeout=timeout_s,
-            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=_sandbox_env(),
             preexec_fn=lambda: _apply_limits(cpu_seconds, memory_bytes),
         )
+        SANDBOX_SPAWN_SECONDS.labels(bot=bot, mode="session").observe(
+            time.monotonic() - spawn_start
+        )
+        self._usage = _SessionUsage(self._process.pid)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._process.stdout, selectors.EVENT_READ)
+        self._selector.register(self._process.stderr, selectors.EVENT_READ)
+        self._stdout_buffer = b""
+        self._stderr_tail = b""
+        self._broken = False
+
+    def __enter__(self) -> "SandboxSession":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def request(self, input_text: str, timeout_s: float) -> SandboxResult:
+        """Send one request and wait up to ``timeout_s`` for a single reply line."""
+        if self._broken or self._process.poll() is not None:
+            return self._failed(timed_out=False)
+
+        try:
+            self._process.stdin.write(input_text.encode())
+            self._process.stdin.flush()
+        except (BrokenPipeError, OSError):
+            return self._failed(timed_out=False)
+
+        deadline = time.monotonic() + timeout_s
+        line = self._read_line(deadline)
+        if line is None:
+            timed_out = time.monotonic() >= deadline
+            return self._failed(timed_out=timed_out)
+
+        cpu_s, max_rss_bytes = self._usage.sample()
+        return SandboxResult(
+            stdout=line.decode(errors="replace").strip(),
+            stderr=self._stderr_tail.decode(errors="replace").strip(),
+            timed_out=False,
+            returncode=0,
+            cpu_s=cpu_s,
+            max_rss_bytes=max_rss_bytes,
+        )
+
+    def close(self) -> None:
+        """Close stdin and terminate the process if it does not exit promptly."""
+        if self._process.stdin and not self._process.stdin.closed:
+            try:
+                self._process.stdin.close()
+            except OSError:
+                pass
+        try:
+            self._process.wait(timeout=0.5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._selector.close()
+        self._process.stdout.close()
+        self._process.stderr.close()
+
+    def _read_line(self, deadline: float) -> Optional[bytes]:
+        """Read one newline-terminated line from stdout before ``deadline``."""
+        while b"\n" not in self._stdout_buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            events = self._selector.select(timeout=remaining)
+            for key, _mask in events:
+                chunk = os.read(key.fd, 65536)
+                if key.fileobj is self._process.stderr:
+                    if chunk:
+                        self._stderr_tail = (self._stderr_tail + chunk)[-STDERR_TAIL_BYTES:]
+                    else:
+                        self._selector.unregister(key.fileobj)
+                    continue
+                if not chunk:
+                    return None
+                self._stdout_buffer += chunk
+
+        line, _sep, self._stdout_buffer = self._stdout_buffer.partition(b"\n")
+        return line
+
+    def _failed(self, timed_out: bool) -> SandboxResult:
+        """Mark the session unusable and report why the last request failed."""
+        self._broken = True
+        if timed_out:
+            self._process.kill()
+        try:
+            returncode = self._process.wait(timeout=0.5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            returncode = self._process.wait()
+        return SandboxResult(
+            stdout="",
+            stderr=self._stderr_tail.decode(errors="replace").strip(),
+            timed_out=timed_out,
+            returncode=-1 if timed_out else returncode,
+        )
+
+
+class AsyncSandboxSession:
+    """Async counterpart of ``SandboxSession`` built on asyncio subprocesses."""
+
+    def __init__(self, process: asyncio.subprocess.Process) -> None:
+        self._process = process
+        self._usage = _SessionUsage(process.pid)
+        self._stderr_tail = b""
+        self._stderr_task = asyncio.create_task(self._drain_stderr())
+        self._broken = False
+
+    @classmethod
+    async def start(
+        cls,
+        command: List[str],
+        cpu_seconds: int = 1,
+        memory_bytes: int = 256 * 1024 * 1024,
+        bot: str = "",
+    ) -> "AsyncSandboxSession":
+        """Start the bot process under the sandbox limits."""
+        spawn_start = time.monotonic()
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=_sandbox_env(),
+            preexec_fn=lambda: _apply_limits(cpu_seconds, memory_bytes),
+        )
+        SANDBOX_SPAWN_SECONDS.labels(bot=bot, mode="session").observe(
+            time.monotonic() - spawn_start
+        )
+        return cls(process)
+
+    async def request(self, input_text: str, timeout_s: float) -> SandboxResult:
+        """Send one request and wait up to ``timeout_s`` for a single reply line."""
+        if self._broken or self._process.returncode is not None:
+            return await self._failed(timed_out=False)
+
+        try:
+            self._process.stdin.write(input_text.encode())
+            await self._process.stdin.drain()
+            line = await asyncio.wait_for(self._process.stdout.readline(), timeout=timeout_s)
+        except asyncio.TimeoutError:
+            return await self._failed(timed_out=True)
+        except (BrokenPipeError, ConnectionResetError, ValueError):
+            return await self._failed(timed_out=False)
+
+        if not line.endswith(b"\n"):
+            return await self._failed(timed_out=False)
+
+        cpu_s, max_rss_bytes = self._usage.sample()
         return SandboxResult(
-            stdout=completed.stdout.strip(),
-            stderr=completed.stderr.strip(),
+            stdout=line.decode(errors="replace").strip(),
+            stderr=self._stderr_tail.decode(errors="replace").strip(),
             timed_out=False,
-            returncode=completed.returncode,
+            returncode=0,
+            cpu_s=cpu_s,
+            max_rss_bytes=max_rss_bytes,
         )
-    except subprocess.TimeoutExpired as exc:
+
+    async def close(self) -> None:
+        """Close stdin and terminate the process if it does not exit promptly."""
+        if not self._process.stdin.is_closing():
+            self._process.stdin.close()
+        try:
+            await asyncio.wait_for(self._process.wait(), timeout=0.5)
+        except asyncio.TimeoutError:
+            self._process.kill()
+            await self._process.wait()
+        await self._stderr_task
+
+    async def _drain_stderr(self) -> None:
+        """Keep the tail of stderr so the pipe never fills up and blocks the bot."""
+        while chunk := await self._process.stderr.read(65536):
+            self._stderr_tail = (self._stderr_tail + chunk)[-STDERR_TAIL_BYTES:]
+
+    async def _failed(self, timed_out: bool) -> SandboxResult:
+        """Mark the session unusable and report why the last request failed."""
+        self._broken = True
+        if timed_out and self._process.returncode is None:
+            self._process.kill()
+        try:
+            returncode = await asyncio.wait_for(self._process.wait(), timeout=0.5)
+        except asyncio.TimeoutError:
+            self._process.kill()
+            returncode = await self._process.wait()
         return SandboxResult(
-            stdout=(exc.stdout or "").strip(),
-            stderr=(exc.stderr or "").strip(),
-            timed_out=True,
-            returncode=-1,
+            stdout="",
+            stderr=self._stderr_tail.decode(errors="replace").strip(),
+            timed_out=timed_out,
+            returncode=-1 if timed_out else returncode,
         )
@@ -1,8 +1,8 @@
-"""Round-robin tournament scheduler."""
+"""Round-robin and Swiss tournament schedulers."""
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
 
 @dataclass
@@ -11,6 +11,7 @@ class Pairing:
 
     white_id: str
     black_id: str
+    start_fen: Optional[str] = None
 
 
 def round_robin(bot_ids: List[str], rounds: int) -> List[Pairing]:
@@ -34,3 +35,97 @@ def round_robin(bot_ids: List[str], rounds: int) -> List[Pairing]:
         ids = [ids[0]] + [ids[-1]] + ids[1:-1]
 
     return pairings
+
+
+SWISS_SEARCH_LIMIT = 10_000
+
+
+class SwissScheduler:
+    """Pairs bots round by round by score, avoiding rematches and balancing colors.
+
+    Call ``next_round`` for a round's pairings, play them, and report each game with
+    ``record_result`` before asking for the next round. Bots keep their seeding
+    order (the order of ``bot_ids``) as the tiebreak between equal scores. With an
+    odd field the lowest-ranked bot without a bye sits out and scores a point for
+    pairing purposes.
+    """
+
+    def __init__(self, bot_ids: List[str]) -> None:
+        self.bot_ids = list(bot_ids)
+        self.scores: Dict[str, float] = {bot_id: 0.0 for bot_id in bot_ids}
+        self.color_balance: Dict[str, int] = {bot_id: 0 for bot_id in bot_ids}
+        self.last_white: Dict[str, Optional[bool]] = {bot_id: None for bot_id in bot_ids}
+        self.played: Set[FrozenSet[str]] = set()
+        self.byes: List[str] = []
+        self._seed = {bot_id: index for index, bot_id in enumerate(bot_ids)}
+
+    def next_round(self) -> List[Pairing]:
+        """Return the next round's pairings, highest score groups first."""
+        ranked = sorted(self.bot_ids, key=lambda bot_id: (-self.scores[bot_id], self._seed[bot_id]))
+        if len(ranked) % 2 == 1:
+            bye = next(
+                (bot_id for bot_id in reversed(ranked) if bot_id not in self.byes), ranked[-1]
+            )
+            ranked.remove(bye)
+            self.byes.append(bye)
+            self.scores[bye] += 1.0
+
+        pairs = _pair_avoiding(ranked, self.played)
+        if pairs is None:
+            pairs = [(ranked[i], ranked[i + 1]) for i in range(0, len(ranked), 2)]
+        return [self._orient(high, low, board) for board, (high, low) in enumerate(pairs)]
+
+    def record_result(self, pairing: Pairing, white_score: float) -> None:
+        """Apply one finished game; ``white_score`` is 1, 0.5 or 0."""
+        white, black = pairing.white_id, pairing.black_id
+        self.scores[white] += white_score
+        self.scores[black] += 1.0 - white_score
+        self.color_balance[white] += 1
+        self.color_balance[black] -= 1
+        self.last_white[white] = True
+        self.last_white[black] = False
+        self.played.add(frozenset((white, black)))
+
+    def _orient(self, high: str, low: str, board: int) -> Pairing:
+        """Give white to the bot that has had it less; ties alternate."""
+        balance_high, balance_low = self.color_balance[high], self.color_balance[low]
+        if balance_high != balance_low:
+            high_white = balance_high < balance_low
+        elif self.last_white[high] is not None:
+            high_white = not self.last_white[high]
+        else:
+            high_white = board % 2 == 0
+        if high_white:
+            return Pairing(white_id=high, black_id=low)
+        return Pairing(white_id=low, black_id=high)
+
+
+def _pair_avoiding(
+    ranked: List[str], played: Set[FrozenSet[str]]
+) -> Optional[List[Tuple[str, str]]]:
+    """Pair neighbours in ``ranked`` order without rematches, backtracking as needed.
+
+    Each bot is matched with the nearest lower-ranked bot it has not played. The
+    search is iterative and gives up (returning None) after ``SWISS_SEARCH_LIMIT``
+    steps.
+    """
+    pairs: List[Tuple[str, str]] = []
+    stack: List[Tuple[Tuple[str, ...], int]] = [(tuple(ranked), 1)]
+    for _step in range(SWISS_SEARCH_LIMIT):
+        if not stack:
+            return None
+        remaining, candidate = stack[-1]
+        if not remaining:
+            return pairs
+        first = remaining[0]
+        while candidate < len(remaining) and frozenset((first, remaining[candidate])) in played:
+            candidate += 1
+        if candidate < len(remaining):
+            stack[-1] = (remaining, candidate + 1)
+            pairs.append((first, remaining[candidate]))
+            stack.append((remaining[1:candidate] + remaining[candidate + 1 :], 1))
+            continue
+        stack.pop()
+        if stack:
+            pairs.pop()
+    return None
@@ -0,0 +1,107 @@
+"""Per-match scoring shared by the standings calculator and storage backends."""
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+from uuid import UUID
+
+from chessbot.models import MatchRecord, Standing
+
+Totals = Dict[UUID, Dict[str, float]]
+
+
+def new_totals() -> Totals:
+    """Return an empty per-bot totals mapping."""
+    return defaultdict(lambda: {"wins": 0, "losses": 0, "draws": 0, "points": 0.0})
+
+
+def match_winner_id(match: MatchRecord, white_name: Optional[str] = None) -> Optional[UUID]:
+    """Return the winning bot ID, or None for a draw.
+
+    Records saved before ``winner_id`` existed fall back to comparing the winner's
+    name with ``white_name``.
+    """
+    if match.result == "white":
+        return match.white_bot_id
+    if match.result == "black":
+        return match.black_bot_id
+    if match.result == "draw":
+        return None
+    if match.winner_id is not None:
+        return match.winner_id
+    return match.white_bot_id if match.winner == white_name else match.black_bot_id
+
+
+def white_score(match: MatchRecord, white_name: Optional[str] = None) -> float:
+    """White's score in ``match``: 1 for a win, 0.5 for a draw, 0 for a loss."""
+    winner_id = match_winner_id(match, white_name)
+    if winner_id is None:
+        return 0.5
+    return 1.0 if winner_id == match.white_bot_id else 0.0
+
+
+def legacy_white_name(match: MatchRecord, bot_name: Callable[[UUID], str]) -> Optional[str]:
+    """Return the white bot's name only when needed to resolve a legacy forfeit."""
+    if match.result == "forfeit" and match.winner_id is None:
+        return bot_name(match.white_bot_id)
+    return None
+
+
+def tally_match(
+    totals: Totals,
+    match: MatchRecord,
+    white_name: Optional[str] = None,
+    sign: int = 1,
+) -> None:
+    """Add (or with ``sign=-1`` remove) one match's result to ``totals``."""
+    white, black = totals[match.white_bot_id], totals[match.black_bot_id]
+    winner_id = match_winner_id(match, white_name)
+    if winner_id is None:
+        white["draws"] += sign
+        black["draws"] += sign
+        white["points"] += 0.5 * sign
+        black["points"] += 0.5 * sign
+        return
+
+    winner, loser = (white, black) if winner_id == match.white_bot_id else (black, white)
+    winner["wins"] += sign
+    winner["points"] += 1.0 * sign
+    loser["losses"] += sign
+
+
+def standings_from_totals(
+    totals: Mapping[UUID, Mapping[str, float]],
+    bot_name: Callable[[UUID], str],
+) -> List[Standing]:
+    """Build sorted leaderboard entries from per-bot totals."""
+    standings = [
+        Standing(
+            bot_id=bot_id,
+            name=bot_name(bot_id),
+            wins=int(stats["wins"]),
+            losses=int(stats["losses"]),
+            draws=int(stats["draws"]),
+            points=float(stats["points"]),
+        )
+        for bot_id, stats in totals.items()
+    ]
+    standings.sort(key=lambda entry: (-entry.points, entry.name))
+    return standings
+
+
+def tally_stored_match(
+    totals: Totals,
+    match: MatchRecord,
+    bot_name: Callable[[UUID], str],
+    sign: int = 1,
+) -> None:
+    """Like ``tally_match``, resolving legacy forfeit winners through ``bot_name``."""
+    tally_match(totals, match, legacy_white_name(match, bot_name), sign)
+
+
+def totals_for(matches: Iterable[MatchRecord], bot_name: Callable[[UUID], str]) -> Totals:
+    """Tally every match in ``matches`` from scratch."""
+    totals = new_totals()
+    for match in matches:
+        tally_stored_match(totals, match, bot_name)
+    return totals
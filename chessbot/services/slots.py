@@ -0,0 +1,186 @@
+"""Per-process cap on concurrently played matches, shared fairly between owners.
+
+Every match takes a slot before its bots start. Waiters are granted slots by
+priority first; within a priority the owner (a tournament, a match batch, or
+the interactive queue) with the fewest running matches goes next, and the one
+served least recently breaks ties, so concurrent tournaments split the capacity
+evenly. Each owner's own waiters are served in order. Slots can be taken from
+worker threads (``slot``) or the event loop (``slot_async``).
+
+Slots are not coordinated between processes: each web worker gets an equal
+share of ``max_concurrent_matches`` (see ``process_capacity``), so together
+they stay within it.
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Deque, Dict, Iterator
+
+from chessbot.services.monitoring import QUEUE_DEPTH, REGISTRY
+from chessbot.settings import Settings, get_settings
+
+PRIORITY_TOURNAMENT = 0
+PRIORITY_INTERACTIVE = 10
+INTERACTIVE_OWNER = "interactive"
+
+SLOT_WAIT_SECONDS = REGISTRY.histogram(
+    "chessbot_slot_wait_seconds",
+    "Time a match waited for a free slot.",
+    ("priority",),
+)
+
+
+@dataclass(eq=False)
+class _Waiter:
+    """One pending slot request."""
+
+    priority: int
+    sequence: int
+    wake: Callable[[], None]
+
+
+class SlotScheduler:
+    """Grants at most ``capacity`` concurrent slots with per-owner fair share."""
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._grants = itertools.count()
+        self._served: Dict[str, int] = {}
+        self._running: Dict[str, int] = {}
+        self._waiting: Dict[str, Deque[_Waiter]] = {}
+        self._in_use = 0
+        self._queued = QUEUE_DEPTH.labels(queue="slots")
+
+    @contextmanager
+    def slot(self, owner: str, priority: int = PRIORITY_TOURNAMENT) -> Iterator[None]:
+        """Hold one slot for the enclosed block, blocking the thread until granted."""
+        granted = threading.Event()
+        start = time.monotonic()
+        self._enqueue(owner, priority, granted.set)
+        granted.wait()
+        SLOT_WAIT_SECONDS.labels(priority=str(priority)).observe(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self.release(owner)
+
+    @asynccontextmanager
+    async def slot_async(
+        self, owner: str, priority: int = PRIORITY_INTERACTIVE
+    ) -> AsyncIterator[None]:
+        """Async counterpart of ``slot``; cancelling the wait gives up the request."""
+        loop = asyncio.get_running_loop()
+        granted = loop.create_future()
+        start = time.monotonic()
+        waiter = self._enqueue(
+            owner, priority, lambda: loop.call_soon_threadsafe(_resolve, granted)
+        )
+        try:
+            await granted
+        except asyncio.CancelledError:
+            if not self._withdraw(owner, waiter):
+                self.release(owner)
+            raise
+        SLOT_WAIT_SECONDS.labels(priority=str(priority)).observe(time.monotonic() - start)
+        try:
+            yield
+        finally:
+            self.release(owner)
+
+    def release(self, owner: str) -> None:
+        """Return a slot held by ``owner`` and hand it to the next waiter."""
+        with self._lock:
+            self._running[owner] -= 1
+            if not self._running[owner]:
+                del self._running[owner]
+                if owner not in self._waiting:
+                    self._served.pop(owner, None)
+            self._in_use -= 1
+            self._dispatch()
+
+    def snapshot(self) -> dict:
+        """Capacity, slots in use, and running/waiting counts per owner."""
+        with self._lock:
+            return {
+                "capacity": self.capacity,
+                "in_use": self._in_use,
+                "running": dict(self._running),
+                "waiting": {owner: len(queue) for owner, queue in self._waiting.items()},
+            }
+
+    def _enqueue(self, owner: str, priority: int, wake: Callable[[], None]) -> _Waiter:
+        """Queue a request; ``wake`` is called (under the lock) once it is granted."""
+        waiter = _Waiter(priority, next(self._sequence), wake)
+        with self._lock:
+            self._waiting.setdefault(owner, deque()).append(waiter)
+            self._queued.inc()
+            self._dispatch()
+        return waiter
+
+    def _withdraw(self, owner: str, waiter: _Waiter) -> bool:
+        """Drop a request that is still waiting; False if it was already granted."""
+        with self._lock:
+            queue = self._waiting.get(owner)
+            if queue is None or waiter not in queue:
+                return False
+            queue.remove(waiter)
+            if not queue:
+                del self._waiting[owner]
+                if owner not in self._running:
+                    self._served.pop(owner, None)
+            self._queued.dec()
+            return True
+
+    def _dispatch(self) -> None:
+        """Grant free slots: highest priority, fewest running, least recently served."""
+        while self._in_use < self.capacity and self._waiting:
+            owner = min(
+                self._waiting,
+                key=lambda name: (
+                    -self._waiting[name][0].priority,
+                    self._running.get(name, 0),
+                    self._served.get(name, -1),
+                    self._waiting[name][0].sequence,
+                ),
+            )
+            queue = self._waiting[owner]
+            waiter = queue.popleft()
+            if not queue:
+                del self._waiting[owner]
+            self._running[owner] = self._running.get(owner, 0) + 1
+            self._served[owner] = next(self._grants)
+            self._in_use += 1
+            self._queued.dec()
+            waiter.wake()
+
+
+def _resolve(future: asyncio.Future) -> None:
+    """Complete a slot future unless its waiter was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(None)
+
+
+def tournament_owner(tournament_id: object) -> str:
+    """Fair-share owner name for a tournament's matches."""
+    return f"tournament:{tournament_id}"
+
+
+def batch_owner(batch_id: object) -> str:
+    """Fair-share owner name for a match batch's games."""
+    return f"batch:{batch_id}"
+
+
+def process_capacity(settings: Settings) -> int:
+    """This process's share of ``max_concurrent_matches``, split across web workers."""
+    return max(1, settings.max_concurrent_matches // settings.web_workers)
+
+
+SLOTS = SlotScheduler(process_capacity(get_settings()))
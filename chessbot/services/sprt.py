@@ -0,0 +1,133 @@
+"""Sequential probability ratio test for head-to-head bot comparisons."""
+from __future__ import annotations
+
+import math
+from typing import Callable, List, Optional, Sequence
+
+from chessbot.models import MatchRecord, SprtSettings, SprtStatus
+from chessbot.services.scheduler import Pairing
+from chessbot.services.scoring import white_score
+
+PAIR_SCORES = (0.0, 0.25, 0.5, 0.75, 1.0)
+PRIOR_PAIRS = 0.5
+
+PlayRound = Callable[[List[Pairing]], List[MatchRecord]]
+OnPair = Callable[[SprtStatus], None]
+
+
+def expected_score(elo: float) -> float:
+    """Logistic expected score for a player ``elo`` points stronger."""
+    return 1.0 / (1.0 + 10.0 ** (-elo / 400.0))
+
+
+def elo_from_score(score: float) -> float:
+    """Elo difference implied by an average score, clamped away from 0 and 1."""
+    score = min(max(score, 1e-6), 1.0 - 1e-6)
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+class SprtTest:
+    """GSPRT over color-swapped game pairs (the pentanomial model).
+
+    Each pair scores 0, 0.5, 1, 1.5 or 2 points for the first bot. The log-likelihood
+    ratio uses the normal approximation
+    ``N * (s1 - s0) * (2 * mean - s0 - s1) / (2 * variance)`` over per-pair scores,
+    where ``N`` and the mean come from the pairs actually played. Only the variance
+    adds ``PRIOR_PAIRS`` pseudo-pairs to every bucket, so it never collapses to zero
+    after a handful of identical pairs without pulling the mean toward a draw.
+    """
+
+    def __init__(self, settings: SprtSettings) -> None:
+        self.settings = settings
+        self.pentanomial = [0] * len(PAIR_SCORES)
+        self.lower_bound = math.log(settings.beta / (1.0 - settings.alpha))
+        self.upper_bound = math.log((1.0 - settings.beta) / settings.alpha)
+
+    @property
+    def pairs(self) -> int:
+        """Number of completed pairs."""
+        return sum(self.pentanomial)
+
+    def add_pair(self, points: float) -> None:
+        """Record one pair in which the first bot scored ``points`` (0 to 2)."""
+        self.pentanomial[round(points * 2)] += 1
+
+    def llr(self) -> float:
+        """Log-likelihood ratio of H1 against H0 so far."""
+        if not self.pairs:
+            return 0.0
+        points = sum(count * score for count, score in zip(self.pentanomial, PAIR_SCORES))
+        mean = points / self.pairs
+        s0 = expected_score(self.settings.elo0)
+        s1 = expected_score(self.settings.elo1)
+        return self.pairs * (s1 - s0) * (2.0 * mean - s0 - s1) / (2.0 * self._variance())
+
+    def _variance(self) -> float:
+        """Per-pair score variance with ``PRIOR_PAIRS`` added to every bucket."""
+        counts = [count + PRIOR_PAIRS for count in self.pentanomial]
+        total = sum(counts)
+        mean = sum(count * score for count, score in zip(counts, PAIR_SCORES)) / total
+        return sum(count * (score - mean) ** 2 for count, score in zip(counts, PAIR_SCORES)) / total
+
+    def decision(self) -> Optional[str]:
+        """``H1`` or ``H0`` once the LLR crosses a bound, otherwise None."""
+        llr = self.llr()
+        if llr >= self.upper_bound:
+            return "H1"
+        if llr <= self.lower_bound:
+            return "H0"
+        return None
+
+    def elo(self) -> Optional[float]:
+        """Elo difference estimated from the pairs played, without the prior."""
+        if not self.pairs:
+            return None
+        points = sum(count * score for count, score in zip(self.pentanomial, PAIR_SCORES))
+        return elo_from_score(points / self.pairs)
+
+    def status(self) -> SprtStatus:
+        """Snapshot for storing on the tournament record."""
+        return SprtStatus(
+            **self.settings.model_dump(include=set(SprtSettings.model_fields)),
+            pairs=self.pairs,
+            pentanomial=list(self.pentanomial),
+            llr=self.llr(),
+            lower_bound=self.lower_bound,
+            upper_bound=self.upper_bound,
+            elo=self.elo(),
+            decision=self.decision(),
+        )
+
+
+def run_sprt(
+    first_id: str,
+    second_id: str,
+    settings: SprtSettings,
+    play_round: PlayRound,
+    on_pair: Optional[OnPair] = None,
+    openings: Sequence[str] = (),
+) -> SprtStatus:
+    """Play color-swapped pairs until the test decides or ``max_pairs`` is reached.
+
+    ``play_round`` plays the two games of a pair (first bot white, then black) and
+    returns their records in that order; ``on_pair`` receives the status after
+    every pair. Both games of pair ``k`` start from ``openings[k]`` (wrapping),
+    or from the initial position when no openings are given.
+    """
+    test = SprtTest(settings)
+    status = test.status()
+    for pair in range(settings.max_pairs):
+        start_fen = openings[pair % len(openings)] if openings else None
+        as_white, as_black = play_round(
+            [
+                Pairing(white_id=first_id, black_id=second_id, start_fen=start_fen),
+                Pairing(white_id=second_id, black_id=first_id, start_fen=start_fen),
+            ]
+        )
+        test.add_pair(white_score(as_white) + 1.0 - white_score(as_black))
+        status = test.status()
+        if on_pair is not None:
+            on_pair(status)
+        if status.decision is not None:
+            break
+    return status
@@ -0,0 +1,528 @@
+"""SQLite storage backend shared by every API worker process."""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional
+from uuid import UUID
+
+from chessbot.models import (
+    BatchRecord,
+    BotCreate,
+    BotRecord,
+    MatchJob,
+    MatchRecord,
+    MatchSummary,
+    Rating,
+    Standing,
+    TournamentRecord,
+)
+from chessbot.replay import decode_moves, encode_moves
+from chessbot.services.ratings import (
+    PlayerRating,
+    Ratings,
+    game_for,
+    new_ratings,
+    rate_stored_match,
+    ratings_from_state,
+    recompute_ratings,
+)
+from chessbot.services.scoring import (
+    Totals,
+    new_totals,
+    standings_from_totals,
+    tally_stored_match,
+    totals_for,
+)
+from chessbot.services.storage import MatchCursor, new_bot_record
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS bots (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id TEXT PRIMARY KEY,
+    white_bot_id TEXT NOT NULL,
+    black_bot_id TEXT NOT NULL,
+    tournament_id TEXT,
+    created_at REAL NOT NULL,
+    data TEXT NOT NULL,
+    summary TEXT,
+    moves BLOB
+);
+DROP INDEX IF EXISTS matches_white_bot_id;
+DROP INDEX IF EXISTS matches_black_bot_id;
+CREATE INDEX IF NOT EXISTS matches_white_created_at ON matches (white_bot_id, created_at, id);
+CREATE INDEX IF NOT EXISTS matches_black_created_at ON matches (black_bot_id, created_at, id);
+CREATE INDEX IF NOT EXISTS matches_tournament_id ON matches (tournament_id);
+DROP INDEX IF EXISTS matches_created_at;
+CREATE INDEX IF NOT EXISTS matches_created_at_id ON matches (created_at, id);
+CREATE TABLE IF NOT EXISTS standings (
+    bot_id TEXT PRIMARY KEY,
+    wins INTEGER NOT NULL DEFAULT 0,
+    losses INTEGER NOT NULL DEFAULT 0,
+    draws INTEGER NOT NULL DEFAULT 0,
+    points REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS ratings (
+    bot_id TEXT PRIMARY KEY,
+    elo REAL NOT NULL,
+    rating REAL NOT NULL,
+    rd REAL NOT NULL,
+    volatility REAL NOT NULL,
+    games INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tournaments (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tournament_games (
+    tournament_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (tournament_id, position)
+);
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS batches (
+    id TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    data TEXT NOT NULL
+);
+"""
+
+
+PACKED_FIELDS = {"moves", "fen_history", "pgn"}
+
+
+def _load_match(data: str, moves: Optional[bytes] = None) -> MatchRecord:
+    """Rebuild a match from its JSON row and packed moves.
+
+    Without ``moves`` only the header fields are meaningful; rows written before the
+    moves column existed still carry their moves in the JSON.
+    """
+    fields = json.loads(data)
+    if moves is not None:
+        fields["moves"] = decode_moves(moves)
+    fields.setdefault("moves", [])
+    return MatchRecord.model_validate(fields)
+
+
+def _load_tournament(data: str, games: List[str]) -> TournamentRecord:
+    """Rebuild a tournament from its JSON row and its schedule rows.
+
+    Checkpoints leave ``matches`` out of the JSON; it is then the played games of the
+    schedule. Rows written before the schedule had its own table carry it in the JSON.
+    """
+    fields = json.loads(data)
+    if games:
+        fields["schedule"] = [json.loads(game) for game in games]
+    fields.setdefault(
+        "matches",
+        [game["match_id"] for game in fields.get("schedule", []) if game.get("match_id")],
+    )
+    return TournamentRecord.model_validate(fields)
+
+
+class SQLiteStorage:
+    """Durable storage backend implementing the ``Storage`` methods on SQLite.
+
+    Records are stored as JSON next to indexed lookup columns. The database runs in
+    WAL mode so several uvicorn workers can read while one writes.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(SCHEMA)
+        self._migrate()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def create_bot(self, payload: BotCreate) -> BotRecord:
+        """Store a new bot record."""
+        record = new_bot_record(payload)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO bots (id, created_at, data) VALUES (?, ?, ?)",
+                (str(record.id), record.created_at.timestamp(), record.model_dump_json()),
+            )
+        return record
+
+    def list_bots(self) -> List[BotRecord]:
+        """Return all bots."""
+        rows = self._fetchall("SELECT data FROM bots ORDER BY created_at")
+        return [BotRecord.model_validate_json(row[0]) for row in rows]
+
+    def get_bot(self, bot_id: UUID) -> BotRecord:
+        """Fetch bot by ID."""
+        return BotRecord.model_validate_json(self._fetch_data("bots", bot_id))
+
+    def has_bot(self, bot_id: UUID) -> bool:
+        """Return whether a bot with this ID exists."""
+        return bool(self._fetchall("SELECT 1 FROM bots WHERE id = ?", (str(bot_id),)))
+
+    def save_match(self, record: MatchRecord) -> None:
+        """Persist a match record and update the running leaderboard totals.
+
+        Ratings are updated the first time a match is saved; re-saving a match does
+        not rate it again.
+        """
+        with self._lock, self._transaction():
+            deltas = new_totals()
+            rows = self._conn.execute(
+                "SELECT data FROM matches WHERE id = ?", (str(record.id),)
+            ).fetchall()
+            if rows:
+                previous = _load_match(rows[0][0])
+                tally_stored_match(deltas, previous, self._bot_name, sign=-1)
+            else:
+                ratings = self._load_ratings([record.white_bot_id, record.black_bot_id])
+                rate_stored_match(ratings, record, self._bot_name)
+                self._store_ratings(ratings)
+            tally_stored_match(deltas, record, self._bot_name)
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO matches "
+                "(id, white_bot_id, black_bot_id, tournament_id, created_at, data, summary, moves) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(record.id),
+                    str(record.white_bot_id),
+                    str(record.black_bot_id),
+                    str(record.tournament_id) if record.tournament_id else None,
+                    record.created_at.timestamp(),
+                    record.model_dump_json(exclude=PACKED_FIELDS),
+                    MatchSummary.from_record(record).model_dump_json(),
+                    encode_moves(record.moves),
+                ),
+            )
+            self._add_totals(deltas)
+
+    def get_match(self, match_id: UUID) -> MatchRecord:
+        """Fetch match by ID."""
+        rows = self._fetchall("SELECT data, moves FROM matches WHERE id = ?", (str(match_id),))
+        if not rows:
+            raise KeyError(match_id)
+        return _load_match(*rows[0])
+
+    def list_matches(
+        self, limit: int, offset: int = 0, after: Optional[MatchCursor] = None
+    ) -> List[MatchRecord]:
+        """Return matches newest first, starting after ``after`` when given."""
+        rows = self._page("data, moves", limit, offset, after)
+        return [_load_match(data, moves) for data, moves in rows]
+
+    def list_match_summaries(
+        self, limit: int, offset: int = 0, after: Optional[MatchCursor] = None
+    ) -> List[MatchSummary]:
+        """Like ``list_matches`` but reading only the summary column."""
+        rows = self._page("summary, CASE WHEN summary IS NULL THEN data END", limit, offset, after)
+        return [
+            MatchSummary.model_validate_json(summary)
+            if summary is not None
+            else MatchSummary.from_record(_load_match(data))
+            for summary, data in rows
+        ]
+
+    def list_bot_match_summaries(self, bot_id: UUID, limit: int) -> List[MatchSummary]:
+        """Summaries of the newest ``limit`` matches ``bot_id`` played, newest first.
+
+        Each color is one range scan of its ``(bot_id, created_at, id)`` index.
+        """
+        rows = [
+            row
+            for column in ("white_bot_id", "black_bot_id")
+            for row in self._fetchall(
+                "SELECT created_at, id, summary, CASE WHEN summary IS NULL THEN data END "
+                f"FROM matches WHERE {column} = ? ORDER BY created_at DESC, id DESC LIMIT ?",
+                (str(bot_id), limit),
+            )
+        ]
+        newest = sorted({row[:2]: row for row in rows}.values(), reverse=True)[:limit]
+        return [
+            MatchSummary.model_validate_json(summary)
+            if summary is not None
+            else MatchSummary.from_record(_load_match(data))
+            for _created_at, _id, summary, data in newest
+        ]
+
+    def match_ids(self) -> List[UUID]:
+        """Return the IDs of all stored matches."""
+        return [UUID(row[0]) for row in self._fetchall("SELECT id FROM matches")]
+
+    def leaderboard(self) -> List[Standing]:
+        """Return standings across all matches from the running totals."""
+        rows = self._fetchall("SELECT bot_id, wins, losses, draws, points FROM standings")
+        totals = {
+            UUID(bot_id): {"wins": wins, "losses": losses, "draws": draws, "points": points}
+            for bot_id, wins, losses, draws, points in rows
+        }
+        names = self._bot_names()
+        return standings_from_totals(totals, names.__getitem__)
+
+    def rebuild_leaderboard(self) -> List[Standing]:
+        """Recompute the running totals from every stored match."""
+        with self._lock, self._transaction():
+            matches = (
+                _load_match(row[0])
+                for row in self._conn.execute("SELECT data FROM matches").fetchall()
+            )
+            totals = totals_for(matches, self._bot_name)
+            self._conn.execute("DELETE FROM standings")
+            self._add_totals(totals)
+        return self.leaderboard()
+
+    def ratings(self) -> List[Rating]:
+        """Return every bot's current ratings, best first."""
+        return ratings_from_state(self._load_ratings(), self._bot_names().__getitem__)
+
+    def rebuild_ratings(self) -> List[Rating]:
+        """Recompute ratings from every stored match, oldest ``created_at`` first.
+
+        Ties are broken by match ID, as in the in-memory backend. Only the columns
+        needed to score each game are read, so no match JSON is fully parsed.
+        """
+        names = self._bot_names()
+        with self._lock, self._transaction():
+            rows = self._conn.execute(
+                "SELECT white_bot_id, black_bot_id, json_extract(data, '$.result'), "
+                "json_extract(data, '$.winner'), json_extract(data, '$.winner_id') "
+                "FROM matches ORDER BY created_at, id"
+            ).fetchall()
+            games = [
+                game_for(
+                    MatchRecord.model_construct(
+                        white_bot_id=UUID(white_id),
+                        black_bot_id=UUID(black_id),
+                        result=result,
+                        winner=winner,
+                        winner_id=UUID(winner_id) if winner_id else None,
+                    ),
+                    names.__getitem__,
+                )
+                for white_id, black_id, result, winner, winner_id in rows
+            ]
+            self._conn.execute("DELETE FROM ratings")
+            self._store_ratings(recompute_ratings(games))
+        return self.ratings()
+
+    def save_tournament(self, record: TournamentRecord) -> None:
+        """Persist a tournament record."""
+        with self._lock, self._transaction():
+            self._write_tournament(record)
+
+    def checkpoint_tournament(self, record: TournamentRecord, positions: Iterable[int]) -> None:
+        """Persist a running tournament's progress and the schedule games at ``positions``.
+
+        The rest of the schedule and the match list are left as stored, so a checkpoint
+        costs the same however many games the tournament has played.
+        """
+        with self._lock, self._transaction():
+            self._conn.execute(
+                "UPDATE tournaments SET data = ? WHERE id = ?",
+                (
+                    record.model_dump_json(exclude={"schedule", "matches"}),
+                    str(record.id),
+                ),
+            )
+            self._conn.execute(
+                "DELETE FROM tournament_games WHERE tournament_id = ? AND position >= ?",
+                (str(record.id), len(record.schedule)),
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO tournament_games (tournament_id, position, data) "
+                "VALUES (?, ?, ?)",
+                [
+                    (str(record.id), position, record.schedule[position].model_dump_json())
+                    for position in positions
+                ],
+            )
+
+    def get_tournament(self, tournament_id: UUID) -> TournamentRecord:
+        """Fetch tournament by ID."""
+        data = self._fetch_data("tournaments", tournament_id)
+        rows = self._fetchall(
+            "SELECT data FROM tournament_games WHERE tournament_id = ? ORDER BY position",
+            (str(tournament_id),),
+        )
+        return _load_tournament(data, [row[0] for row in rows])
+
+    def list_tournaments(self) -> List[TournamentRecord]:
+        """Return all tournaments."""
+        games: Dict[str, List[str]] = {}
+        for tournament_id, data in self._fetchall(
+            "SELECT tournament_id, data FROM tournament_games ORDER BY tournament_id, position"
+        ):
+            games.setdefault(tournament_id, []).append(data)
+        rows = self._fetchall("SELECT id, data FROM tournaments ORDER BY created_at")
+        return [_load_tournament(data, games.get(row_id, [])) for row_id, data in rows]
+
+    def claim_tournament(self, tournament_id: UUID, expected: Optional[str], runner: str) -> bool:
+        """Replace the runner ``expected`` with ``runner``; False if it has changed since.
+
+        The check and the write share one transaction, so of several workers
+        claiming the same tournament from the same stale runner exactly one succeeds.
+        """
+        with self._lock, self._transaction():
+            record = self.get_tournament(tournament_id)
+            if record.runner != expected:
+                return False
+            record.runner = runner
+            self._write_tournament(record)
+        return True
+
+    def save_job(self, job: MatchJob) -> None:
+        """Persist a match job."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (id, created_at, data) VALUES (?, ?, ?)",
+                (str(job.id), job.created_at.timestamp(), job.model_dump_json()),
+            )
+
+    def get_job(self, job_id: UUID) -> MatchJob:
+        """Fetch match job by ID."""
+        return MatchJob.model_validate_json(self._fetch_data("jobs", job_id))
+
+    def list_jobs(self) -> List[MatchJob]:
+        """Return all match jobs, oldest first."""
+        rows = self._fetchall("SELECT data FROM jobs ORDER BY created_at")
+        return [MatchJob.model_validate_json(row[0]) for row in rows]
+
+    def save_batch(self, batch: BatchRecord) -> None:
+        """Persist a match batch."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO batches (id, created_at, data) VALUES (?, ?, ?)",
+                (str(batch.id), batch.created_at.timestamp(), batch.model_dump_json()),
+            )
+
+    def get_batch(self, batch_id: UUID) -> BatchRecord:
+        """Fetch match batch by ID."""
+        return BatchRecord.model_validate_json(self._fetch_data("batches", batch_id))
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the enclosed statements in a single IMMEDIATE transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _write_tournament(self, record: TournamentRecord) -> None:
+        """Replace a tournament's row and schedule rows; the caller holds a transaction."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO tournaments (id, created_at, data) VALUES (?, ?, ?)",
+            (
+                str(record.id),
+                record.created_at.timestamp(),
+                record.model_dump_json(exclude={"schedule"}),
+            ),
+        )
+        self._conn.execute(
+            "DELETE FROM tournament_games WHERE tournament_id = ?", (str(record.id),)
+        )
+        self._conn.executemany(
+            "INSERT INTO tournament_games (tournament_id, position, data) VALUES (?, ?, ?)",
+            [
+                (str(record.id), position, game.model_dump_json())
+                for position, game in enumerate(record.schedule)
+            ],
+        )
+
+    def _add_totals(self, totals: Totals) -> None:
+        """Add per-bot deltas to the standings table."""
+        self._conn.executemany(
+            "INSERT INTO standings (bot_id, wins, losses, draws, points) "
+            "VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (bot_id) DO UPDATE SET "
+            "wins = wins + excluded.wins, losses = losses + excluded.losses, "
+            "draws = draws + excluded.draws, points = points + excluded.points",
+            [
+                (str(bot_id), stats["wins"], stats["losses"], stats["draws"], stats["points"])
+                for bot_id, stats in totals.items()
+            ],
+        )
+
+    def _load_ratings(self, bot_ids: Optional[List[UUID]] = None) -> Ratings:
+        """Read stored ratings, for ``bot_ids`` only when given."""
+        query = "SELECT bot_id, elo, rating, rd, volatility, games FROM ratings"
+        params: tuple = ()
+        if bot_ids is not None:
+            query += f" WHERE bot_id IN ({', '.join('?' * len(bot_ids))})"
+            params = tuple(str(bot_id) for bot_id in bot_ids)
+        ratings = new_ratings()
+        for bot_id, elo, rating, rd, volatility, games in self._fetchall(query, params):
+            ratings[UUID(bot_id)] = PlayerRating(elo, rating, rd, volatility, games)
+        return ratings
+
+    def _store_ratings(self, ratings: Ratings) -> None:
+        """Write ``ratings`` over the stored rows for the same bots."""
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO ratings (bot_id, elo, rating, rd, volatility, games) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (str(bot_id), state.elo, state.rating, state.rd, state.volatility, state.games)
+                for bot_id, state in ratings.items()
+            ],
+        )
+
+    def _bot_name(self, bot_id: UUID) -> str:
+        """Look up a bot's display name."""
+        return self.get_bot(bot_id).name
+
+    def _bot_names(self) -> Dict[UUID, str]:
+        """Return every bot's display name keyed by ID."""
+        return {bot.id: bot.name for bot in self.list_bots()}
+
+    def _migrate(self) -> None:
+        """Add columns introduced after a database was first created."""
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(matches)")}
+        if "summary" not in columns:
+            self._conn.execute("ALTER TABLE matches ADD COLUMN summary TEXT")
+        if "moves" not in columns:
+            self._conn.execute("ALTER TABLE matches ADD COLUMN moves BLOB")
+
+    def _page(
+        self, columns: str, limit: int, offset: int, after: Optional[MatchCursor]
+    ) -> list:
+        """Select ``columns`` for one newest-first page of matches."""
+        if after is not None:
+            return self._fetchall(
+                f"SELECT {columns} FROM matches WHERE (created_at, id) < (?, ?) "
+                "ORDER BY created_at DESC, id DESC LIMIT ?",
+                (after.created_at.timestamp(), str(after.match_id), limit),
+            )
+        return self._fetchall(
+            f"SELECT {columns} FROM matches ORDER BY created_at DESC, id DESC LIMIT ? OFFSET ?",
+            (limit, offset),
+        )
+
+    def _fetchall(self, query: str, params: tuple = ()) -> list:
+        """Run a read query and return all rows."""
+        with self._lock:
+            return self._conn.execute(query, params).fetchall()
+
+    def _fetch_data(self, table: str, record_id: UUID) -> str:
+        """Return the JSON payload for ``record_id``; raise KeyError when missing."""
+        rows = self._fetchall(f"SELECT data FROM {table} WHERE id = ?", (str(record_id),))
+        if not rows:
+            raise KeyError(record_id)
+        return rows[0][0]
@@ -1,12 +1,158 @@
-"""In-memory storage for bots, matches, and tournaments."""
+"""Storage backends for bots, matches, and tournaments."""
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import Dict, Iterable, List, NamedTuple, Optional, Protocol, Tuple
 from uuid import UUID, uuid4
 
-from chessbot.models import BotCreate, BotRecord, MatchRecord, TournamentRecord
+from chessbot.models import (
+    BatchRecord,
+    BotCreate,
+    BotRecord,
+    MatchJob,
+    MatchRecord,
+    MatchSummary,
+    Rating,
+    Standing,
+    TournamentRecord,
+)
+from chessbot.replay import decode_moves, encode_moves
+from chessbot.services.ratings import (
+    Ratings,
+    new_ratings,
+    rate_stored_match,
+    ratings_for,
+    ratings_from_state,
+)
+from chessbot.services.scoring import (
+    Totals,
+    new_totals,
+    standings_from_totals,
+    tally_stored_match,
+    totals_for,
+)
+from chessbot.settings import Settings, get_settings
+
+
+class MatchCursor(NamedTuple):
+    """Position in the newest-first match listing; pages continue after it."""
+
+    created_at: datetime
+    match_id: UUID
+
+    @classmethod
+    def parse(cls, text: str) -> "MatchCursor":
+        """Parse ``<created_at>,<id>``; raise ValueError when malformed."""
+        created_at, _sep, match_id = text.partition(",")
+        parsed = datetime.fromisoformat(created_at)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return cls(created_at=parsed, match_id=UUID(match_id))
+
+    @classmethod
+    def of(cls, record: MatchRecord | MatchSummary) -> "MatchCursor":
+        """Return the cursor pointing at ``record``."""
+        return cls(created_at=record.created_at, match_id=record.id)
+
+    def __str__(self) -> str:
+        created_at = self.created_at.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+        return f"{created_at},{self.match_id}"
+
+    def sort_key(self) -> Tuple[float, UUID]:
+        """Key used by every backend to order matches.
+
+        UUIDs order the same way as their canonical strings, which SQLite compares.
+        """
+        return (self.created_at.timestamp(), self.match_id)
+
+
+@dataclass(frozen=True, slots=True)
+class PackedMatch:
+    """Match record held with its moves packed to two bytes each."""
+
+    header: MatchRecord
+    moves: bytes
+
+    @classmethod
+    def pack(cls, record: MatchRecord) -> "PackedMatch":
+        """Split ``record`` into a move-less header and packed moves."""
+        return cls(header=record.model_copy(update={"moves": []}), moves=encode_moves(record.moves))
+
+    def unpack(self) -> MatchRecord:
+        """Rebuild the full match record."""
+        return self.header.model_copy(update={"moves": decode_moves(self.moves)})
+
+
+class StorageBackend(Protocol):
+    """Operations every storage backend provides."""
+
+    def create_bot(self, payload: BotCreate) -> BotRecord: ...
+
+    def list_bots(self) -> List[BotRecord]: ...
+
+    def get_bot(self, bot_id: UUID) -> BotRecord: ...
+
+    def has_bot(self, bot_id: UUID) -> bool: ...
+
+    def save_match(self, record: MatchRecord) -> None: ...
+
+    def get_match(self, match_id: UUID) -> MatchRecord: ...
+
+    def list_matches(
+        self, limit: int, offset: int = 0, after: Optional[MatchCursor] = None
+    ) -> List[MatchRecord]: ...
+
+    def list_match_summaries(
+        self, limit: int, offset: int = 0, after: Optional[MatchCursor] = None
+    ) -> List[MatchSummary]: ...
+
+    def list_bot_match_summaries(self, bot_id: UUID, limit: int) -> List[MatchSummary]: ...
+
+    def match_ids(self) -> List[UUID]: ...
+
+    def leaderboard(self) -> List[Standing]: ...
+
+    def rebuild_leaderboard(self) -> List[Standing]: ...
+
+    def ratings(self) -> List[Rating]: ...
+
+    def rebuild_ratings(self) -> List[Rating]: ...
+
+    def save_tournament(self, record: TournamentRecord) -> None: ...
+
+    def checkpoint_tournament(self, record: TournamentRecord, positions: Iterable[int]) -> None: ...
+
+    def get_tournament(self, tournament_id: UUID) -> TournamentRecord: ...
+
+    def list_tournaments(self) -> List[TournamentRecord]: ...
+
+    def claim_tournament(
+        self, tournament_id: UUID, expected: Optional[str], runner: str
+    ) -> bool: ...
+
+    def save_job(self, job: MatchJob) -> None: ...
+
+    def get_job(self, job_id: UUID) -> MatchJob: ...
+
+    def list_jobs(self) -> List[MatchJob]: ...
+
+    def save_batch(self, batch: BatchRecord) -> None: ...
+
+    def get_batch(self, batch_id: UUID) -> BatchRecord: ...
+
+
+def new_bot_record(payload: BotCreate) -> BotRecord:
+    """Build a bot record with a fresh ID and creation time."""
+    return BotRecord(
+        id=uuid4(),
+        name=payload.name,
+        command=payload.command,
+        protocol=payload.protocol,
+        send_clock=payload.send_clock,
+        created_at=datetime.now(timezone.utc),
+    )
 
 
 @dataclass
@@ -14,19 +160,20 @@ class Storage:
     """Simple in-memory storage with UUID keys."""
 
     bots: Dict[UUID, BotRecord] = field(default_factory=dict)
-    matches: Dict[UUID, MatchRecord] = field(default_factory=dict)
+    matches: Dict[UUID, PackedMatch] = field(default_factory=dict)
+    summaries: Dict[UUID, MatchSummary] = field(default_factory=dict)
     tournaments: Dict[UUID, TournamentRecord] = field(default_factory=dict)
+    jobs: Dict[UUID, MatchJob] = field(default_factory=dict)
+    batches: Dict[UUID, BatchRecord] = field(default_factory=dict)
+    totals: Totals = field(default_factory=new_totals)
+    player_ratings: Ratings = field(default_factory=new_ratings)
+    match_order: List[Tuple[float, UUID]] = field(default_factory=list)
+    bot_match_order: Dict[UUID, List[Tuple[float, UUID]]] = field(default_factory=dict)
 
     def create_bot(self, payload: BotCreate) -> BotRecord:
         """Store a new bot record."""
-        bot_id = uuid4()
-        record = BotRecord(
-            id=bot_id,
-            name=payload.name,
-            command=payload.command,
-            created_at=datetime.now(timezone.utc),
-        )
-        self.bots[bot_id] = record
+        record = new_bot_record(payload)
+        self.bots[record.id] = record
         return record
 
     def list_bots(self) -> List[BotRecord]:
@@ -37,21 +184,149 @@ class Storage:
         """Fetch bot by ID."""
         return self.bots[bot_id]
 
+    def has_bot(self, bot_id: UUID) -> bool:
+        """Return whether a bot with this ID exists."""
+        return bot_id in self.bots
+
     def save_match(self, record: MatchRecord) -> None:
-        """Persist a match record."""
-        self.matches[record.id] = record
+        """Persist a match record and update the running leaderboard totals.
+
+        Ratings are updated the first time a match is saved; re-saving a match does
+        not rate it again.
+        """
+        previous = self.matches.get(record.id)
+        if previous is not None:
+            tally_stored_match(self.totals, previous.header, self._bot_name, sign=-1)
+            key = MatchCursor.of(previous.header).sort_key()
+            self.match_order.remove(key)
+            for bot_id in {previous.header.white_bot_id, previous.header.black_bot_id}:
+                self.bot_match_order[bot_id].remove(key)
+        else:
+            rate_stored_match(self.player_ratings, record, self._bot_name)
+        self.matches[record.id] = PackedMatch.pack(record)
+        self.summaries[record.id] = MatchSummary.from_record(record)
+        key = MatchCursor.of(record).sort_key()
+        insort(self.match_order, key)
+        for bot_id in {record.white_bot_id, record.black_bot_id}:
+            insort(self.bot_match_order.setdefault(bot_id, []), key)
+        tally_stored_match(self.totals, record, self._bot_name)
 
     def get_match(self, match_id: UUID) -> MatchRecord:
         """Fetch match by ID."""
-        return self.matches[match_id]
+        return self.matches[match_id].unpack()
+
+    def list_matches(
+        self, limit: int, offset: int = 0, after: Optional[MatchCursor] = None
+    ) -> List[MatchRecord]:
+        """Return matches newest first, starting after ``after`` when given."""
+        return [self.matches[match_id].unpack() for match_id in self._page(limit, offset, after)]
+
+    def list_match_summaries(
+        self, limit: int, offset: int = 0, after: Optional[MatchCursor] = None
+    ) -> List[MatchSummary]:
+        """Like ``list_matches`` but returning lightweight summaries."""
+        return [self.summaries[match_id] for match_id in self._page(limit, offset, after)]
+
+    def list_bot_match_summaries(self, bot_id: UUID, limit: int) -> List[MatchSummary]:
+        """Summaries of the newest ``limit`` matches ``bot_id`` played, newest first."""
+        order = self.bot_match_order.get(bot_id, [])
+        return [self.summaries[match_id] for _created_at, match_id in reversed(order[-limit:])]
+
+    def match_ids(self) -> List[UUID]:
+        """Return the IDs of all stored matches."""
+        return list(self.matches.keys())
+
+    def leaderboard(self) -> List[Standing]:
+        """Return standings across all matches from the running totals."""
+        return standings_from_totals(self.totals, self._bot_name)
+
+    def rebuild_leaderboard(self) -> List[Standing]:
+        """Recompute the running totals from every stored match."""
+        headers = (packed.header for packed in self.matches.values())
+        self.totals = totals_for(headers, self._bot_name)
+        return self.leaderboard()
+
+    def ratings(self) -> List[Rating]:
+        """Return every bot's current ratings, best first."""
+        return ratings_from_state(self.player_ratings, self._bot_name)
+
+    def rebuild_ratings(self) -> List[Rating]:
+        """Recompute ratings from every stored match, oldest ``created_at`` first."""
+        headers = (self.matches[match_id].header for _created_at, match_id in self.match_order)
+        self.player_ratings = ratings_for(headers, self._bot_name)
+        return self.ratings()
 
     def save_tournament(self, record: TournamentRecord) -> None:
         """Persist a tournament record."""
         self.tournaments[record.id] = record
 
+    def checkpoint_tournament(self, record: TournamentRecord, positions: Iterable[int]) -> None:
+        """Persist a running tournament's progress and the schedule games at ``positions``."""
+        self.tournaments[record.id] = record
+
     def get_tournament(self, tournament_id: UUID) -> TournamentRecord:
         """Fetch tournament by ID."""
         return self.tournaments[tournament_id]
 
+    def list_tournaments(self) -> List[TournamentRecord]:
+        """Return all tournaments."""
+        return list(self.tournaments.values())
+
+    def claim_tournament(self, tournament_id: UUID, expected: Optional[str], runner: str) -> bool:
+        """Replace the runner ``expected`` with ``runner``; False if it has changed since."""
+        record = self.tournaments[tournament_id]
+        if record.runner != expected:
+            return False
+        record.runner = runner
+        return True
+
+    def save_job(self, job: MatchJob) -> None:
+        """Persist a match job."""
+        self.jobs[job.id] = job
+
+    def get_job(self, job_id: UUID) -> MatchJob:
+        """Fetch match job by ID."""
+        return self.jobs[job_id]
+
+    def list_jobs(self) -> List[MatchJob]:
+        """Return all match jobs."""
+        return list(self.jobs.values())
+
+    def save_batch(self, batch: BatchRecord) -> None:
+        """Persist a match batch."""
+        self.batches[batch.id] = batch
+
+    def get_batch(self, batch_id: UUID) -> BatchRecord:
+        """Fetch match batch by ID."""
+        return self.batches[batch_id]
+
+    def _bot_name(self, bot_id: UUID) -> str:
+        """Look up a bot's display name."""
+        return self.bots[bot_id].name
+
+    def _page(self, limit: int, offset: int, after: Optional[MatchCursor]) -> List[UUID]:
+        """Return match IDs for one newest-first page.
+
+        ``match_order`` is kept sorted oldest first, so a cursor page is one bisect
+        plus ``limit`` lookups.
+        """
+        if after is not None:
+            end = bisect_left(self.match_order, after.sort_key())
+        else:
+            end = len(self.match_order) - offset
+        start = max(0, end - limit)
+        if end <= start:
+            return []
+        return [match_id for _created_at, match_id in reversed(self.match_order[start:end])]
+
+
+def create_storage(settings: Settings) -> StorageBackend:
+    """Build the storage backend selected by ``settings.storage_backend``."""
+    if settings.storage_backend == "sqlite":
+        from chessbot.services.sqlite_storage import SQLiteStorage
+
+        return SQLiteStorage(settings.database_path)
+    return Storage()
+
 
-STORE = Storage()
+STORE: StorageBackend = create_storage(get_settings())
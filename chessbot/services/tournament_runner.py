@@ -0,0 +1,73 @@
+"""Parallel execution of tournament pairings."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional
+
+from chessbot.models import MatchRecord
+from chessbot.services.monitoring import QUEUE_DEPTH
+from chessbot.services.scheduler import Pairing
+
+PlayPairing = Callable[[Pairing], MatchRecord]
+OnResult = Callable[[int, MatchRecord], None]
+Estimate = Callable[[Pairing], float]
+
+
+def run_pairings(
+    pairings: List[Pairing],
+    play: PlayPairing,
+    workers: int,
+    on_result: Optional[OnResult] = None,
+    estimate: Optional[Estimate] = None,
+) -> List[MatchRecord]:
+    """Play pairings on a worker pool and return records in pairing order.
+
+    Games run in threads because the work happens in bot subprocesses.
+    ``on_result`` is called from the calling thread, in completion order, with
+    the pairing index and record of each finished game. With ``estimate``, games
+    are dispatched longest expected duration first, so the slow ones do not all
+    land at the end and leave the rest of the pool idle. If a game raises, games
+    that have not started are cancelled, games already running are waited for and
+    still passed to ``on_result``, and then the error propagates.
+    """
+    records: List[Optional[MatchRecord]] = [None] * len(pairings)
+    if not pairings:
+        return []
+
+    queued = QUEUE_DEPTH.labels(queue="tournament")
+
+    def start(pairing: Pairing) -> MatchRecord:
+        queued.dec()
+        return play(pairing)
+
+    order = range(len(pairings))
+    if estimate is not None:
+        expected = [estimate(pairing) for pairing in pairings]
+        order = sorted(order, key=lambda index: -expected[index])
+    queued.inc(len(pairings))
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="match") as pool:
+        futures = {pool.submit(start, pairings[index]): index for index in order}
+        reported = set()
+        try:
+            for future in as_completed(futures):
+                index = futures[future]
+                record = future.result()
+                records[index] = record
+                reported.add(future)
+                if on_result is not None:
+                    on_result(index, record)
+        except BaseException:
+            cancelled = sum(future.cancel() for future in futures)
+            queued.dec(cancelled)
+            running = [f for f in futures if f not in reported and not f.cancelled()]
+            for future in as_completed(running):
+                # Games that finish after the failure are still stored, so their
+                # live entries end like any other game's.
+                if future.exception() is None and on_result is not None:
+                    try:
+                        on_result(futures[future], future.result())
+                    except Exception:  # the first failure is the one to report
+                        pass
+            raise
+
+    return [record for record in records if record is not None]
@@ -0,0 +1,39 @@
+"""Runtime configuration loaded from environment variables."""
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from typing import Literal
+from uuid import uuid4
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Platform settings, overridable with ``CHESSBOT_*`` environment variables."""
+
+    model_config = SettingsConfigDict(env_prefix="CHESSBOT_")
+
+    tournament_workers: int = Field(4, ge=1)
+    storage_backend: Literal["memory", "sqlite"] = "memory"
+    database_path: str = "chessbot.db"
+    web_workers: int = Field(1, ge=1)
+    openings_dir: str = "openings"
+    fork_server: bool = False
+    max_concurrent_matches: int = Field(default_factory=lambda: os.cpu_count() or 4, ge=1)
+    match_execution: Literal["local", "remote"] = "local"
+    resume_tournaments: bool = True
+    instance_id: str = Field(default_factory=lambda: uuid4().hex)
+    boot_id: str = Field(default_factory=lambda: uuid4().hex)
+
+    @property
+    def runner(self) -> str:
+        """Names this server boot as a tournament's runner; a restart gets a new one."""
+        return f"{self.instance_id}/{self.boot_id}"
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings instance."""
+    return Settings()
@@ -251,20 +251,25 @@ function startActivityMonitoring() {
   addLog(`Loaded ${adminMatches.length} matches`);
   addLog(`Loaded ${adminTournaments.length} tournaments`);
   
-  // Periodically refresh data
-  setInterval(async () => {
-    try {
-      const newBots = await apiGet("/api/bots");
-      if (newBots.length !== adminBots.length) {
-        adminBots = newBots;
-        renderAdminBots();
-        updateAdminStats();
-        addLog(`Bot count updated: ${adminBots.length}`);
-      }
-    } catch (error) {
-      console.error("Error refreshing data:", error);
-    }
-  }, 5000);
+  // Live activity feed pushed by the server
+  subscribeEvents("/api/events", {
+    bot_registered: (bot) => {
+      if (adminBots.some((existing) => existing.id === bot.id)) return;
+      adminBots.push(bot);
+      renderAdminBots();
+      updateAdminStats();
+      addLog(`Bot registered: ${bot.name}`);
+    },
+    match_start: (match) => addLog(`Match started: ${match.white} vs ${match.black}`),
+    match_end: (match) => addLog(`Match finished: ${match.result}`),
+    tournament_progress: (progress) =>
+      addLog(`${progress.name}: ${progress.completed_matches}/${progress.total_matches} games`),
+    tournament_completed: async (progress) => {
+      addLog(`Tournament completed: ${progress.name}`);
+      await loadAdminTournaments();
+      updateAdminStats();
+    },
+  });
 }
 
 // ==================== SETTINGS ====================
@@ -255,12 +255,21 @@ async function runQuickMatch() {
   
   try {
     showLoading(form.querySelector('button[type="submit"]'));
-    const match = await apiPost("/api/matches", {
+    let job = await apiPost("/api/matches", {
       white_bot_id: whiteBotId,
       black_bot_id: blackBotId,
       move_timeout_s: moveTimeout,
       max_moves: maxMoves,
     });
+    showNotification("Match queued...", "info");
+    while (job.status === "queued" || job.status === "running") {
+      await new Promise((resolve) => setTimeout(resolve, 1000));
+      job = await apiGet(`/api/jobs/${job.id}`);
+    }
+    if (job.status === "failed") {
+      throw new Error(job.error || "match failed");
+    }
+    const match = { id: job.match_id };
     
     showNotification("Match completed! Redirecting...", "success");
     setTimeout(() => {
@@ -300,6 +309,7 @@ function renderTournaments() {
       <div class="card-header">
         🏆 ${tournament.name}
         <span class="badge badge-info">${tournament.rounds} rounds</span>
+        ${tournament.format === "swiss" ? '<span class="badge badge-info">Swiss</span>' : ""}
       </div>
       <div class="card-body">
         <div><strong>Bots:</strong> ${tournament.bot_ids.length}</div>
@@ -318,6 +328,7 @@ function renderTournaments() {
 async function createTournament() {
   const form = document.getElementById("create-tournament-form");
   const name = document.getElementById("tournament-name").value;
+  const format = document.getElementById("tournament-format").value;
   const rounds = parseInt(document.getElementById("tournament-rounds").value);
   const timeout = parseFloat(document.getElementById("tournament-timeout").value);
   
@@ -334,6 +345,7 @@ async function createTournament() {
     await apiPost("/api/tournaments", {
       name,
       bot_ids,
+      format,
       rounds,
       move_timeout_s: timeout,
       max_moves: 200,
@@ -39,10 +39,44 @@ async function loadMatch() {
   
   try {
     matchData = await apiGet(`/api/matches/${matchId}`);
-    renderMatchInfo();
   } catch (error) {
-    throw error;
+    // Not stored yet: follow the game live if it is still being played.
+    const live = await apiGet(`/api/live/${matchId}`).catch(() => null);
+    if (!live) throw error;
+    matchData = { ...live, id: matchId, result: "live", duration_s: 0, pgn: "", created_at: new Date() };
+    followLiveMatch(matchId);
   }
+  renderMatchInfo();
+}
+
+function followLiveMatch(matchId) {
+  const source = subscribeEvents(`/api/matches/${matchId}/events`, {
+    snapshot: (snapshot) => {
+      if (!snapshot.fen_history || snapshot.moves.length < matchData.moves.length) return;
+      matchData.moves = snapshot.moves;
+      matchData.fen_history = snapshot.fen_history;
+      renderMatchInfo();
+    },
+    move: (event) => {
+      // Moves already in the snapshot can be delivered again right after it.
+      if (event.ply <= matchData.moves.length) return;
+      const atEnd = currentMoveIndex === matchData.fen_history.length - 1;
+      matchData.moves.push(event.move);
+      matchData.fen_history.push(event.fen);
+      renderMatchInfo();
+      if (atEnd) lastMove();
+    },
+    end: async (event) => {
+      source.close();
+      matchData = await apiGet(`/api/matches/${event.match_id}`);
+      renderMatchInfo();
+      lastMove();
+    },
+    abort: (event) => {
+      source.close();
+      showNotification("Match stopped: " + event.error, "danger");
+    },
+  });
 }
 
 function renderMatchInfo() {
@@ -57,6 +91,9 @@ function renderMatchInfo() {
   // Result badge
   const resultEl = document.getElementById("match-result");
   resultEl.innerHTML = getResultBadge(matchData.result);
+  if (matchData.adjudicated) {
+    resultEl.innerHTML += ` <span class="badge badge-info">Adjudicated: ${matchData.termination.replace(/_/g, " ")}</span>`;
+  }
   
   // Stats
   document.getElementById("match-duration").textContent = formatDuration(matchData.duration_s);
@@ -9,6 +9,7 @@ async function initializeTournament() {
     await loadTournament();
     renderTournamentInfo();
     attachTournamentListeners();
+    if (!["completed", "failed"].includes(tournamentData.status)) followTournament();
   } catch (error) {
     console.error("Error initializing tournament:", error);
     showNotification("Error loading tournament: " + error.message, "danger");
@@ -25,17 +26,41 @@ async function loadTournament() {
   }
 }
 
+function followTournament() {
+  const finish = async () => {
+    source.close();
+    await loadTournament();
+    renderTournamentInfo();
+  };
+  const source = subscribeEvents(`/api/tournaments/${tournamentData.id}/events`, {
+    progress: (progress) => {
+      tournamentData.status = progress.status;
+      tournamentData.completed_matches = progress.completed_matches;
+      tournamentData.total_matches = progress.total_matches;
+      if (progress.sprt) tournamentData.sprt = progress.sprt;
+      renderTournamentInfo();
+    },
+    completed: finish,
+    failed: finish,
+  });
+}
+
 function renderTournamentInfo() {
   if (!tournamentData) return;
   
   document.getElementById("tournament-title").textContent = tournamentData.name;
   document.getElementById("tournament-name").textContent = tournamentData.name;
   document.getElementById("tournament-bot-count").textContent = tournamentData.bot_ids.length;
-  document.getElementById("tournament-rounds").textContent = tournamentData.rounds;
+  document.getElementById("tournament-rounds").textContent = tournamentData.sprt
+    ? formatSprt(tournamentData.sprt)
+    : tournamentData.rounds;
   document.getElementById("tournament-created").textContent = formatDate(tournamentData.created_at);
   document.getElementById("tournament-timeout").textContent = tournamentData.move_timeout_s + "s";
   document.getElementById("tournament-max-moves").textContent = tournamentData.max_moves;
-  document.getElementById("tournament-total-matches").textContent = tournamentData.matches.length;
+  document.getElementById("tournament-total-matches").textContent =
+    tournamentData.status === "running"
+      ? `${tournamentData.completed_matches} / ${tournamentData.total_matches}`
+      : tournamentData.matches.length;
   
   // Render standings
   if (tournamentData.standings && tournamentData.standings.length > 0) {
@@ -49,6 +74,12 @@ function renderTournamentInfo() {
   renderTournamentMatches();
 }
 
+function formatSprt(sprt) {
+  const verdict = sprt.decision ? ` → ${sprt.decision}` : "";
+  return `SPRT [${sprt.elo0}, ${sprt.elo1}] LLR ${sprt.llr.toFixed(2)} ` +
+    `(${sprt.lower_bound.toFixed(2)}, ${sprt.upper_bound.toFixed(2)})${verdict}`;
+}
+
 function renderStandings() {
   const tbody = document.getElementById("standings-body");
   if (!tbody) return;
@@ -155,6 +155,16 @@ async function apiPost(endpoint, data) {
   });
 }
 
+// ==================== LIVE EVENTS ====================
+function subscribeEvents(endpoint, handlers) {
+  // handlers maps event names to callbacks receiving the parsed payload.
+  const source = new EventSource(endpoint);
+  Object.entries(handlers).forEach(([name, handler]) => {
+    source.addEventListener(name, (event) => handler(JSON.parse(event.data)));
+  });
+  return source;
+}
+
 // ==================== DOM UTILITIES ====================
 function formatDate(dateString) {
   const date = new Date(dateString);
@@ -0,0 +1,47 @@
+"""Record factories shared by the test modules."""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from chessbot.models import BotRecord, MatchRecord, MatchSummary
+
+
+def bot_record(name: str, script: str = "bots/random_bot.py") -> BotRecord:
+    """A registered bot running ``script`` with a fresh ID."""
+    return BotRecord(
+        id=uuid4(),
+        name=name,
+        command=["python", script],
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def match_record(white_id: UUID, black_id: UUID, result: str = "draw", **fields) -> MatchRecord:
+    """A finished game between two bot IDs, without running bots; ``fields`` override."""
+    values = {
+        "id": uuid4(),
+        "white_bot_id": white_id,
+        "black_bot_id": black_id,
+        "result": result,
+        "winner": None,
+        "moves": [],
+        "duration_s": 0.0,
+        "created_at": datetime.now(timezone.utc),
+    }
+    return MatchRecord(**{**values, **fields})
+
+
+def match_summary(white_id: UUID, black_id: UUID, **fields) -> MatchSummary:
+    """A drawn game's list-view summary between two bot IDs; ``fields`` override."""
+    values = {
+        "id": uuid4(),
+        "white_bot_id": white_id,
+        "black_bot_id": black_id,
+        "result": "draw",
+        "winner": None,
+        "move_count": 10,
+        "duration_s": 1.0,
+        "created_at": datetime.now(timezone.utc),
+    }
+    return MatchSummary(**{**values, **fields})
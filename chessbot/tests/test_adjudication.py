@@ -0,0 +1,71 @@
+"""Tests for early game adjudication."""
+from __future__ import annotations
+
+from uuid import uuid4
+
+import chess
+
+from chessbot.models import AdjudicationSettings
+from chessbot.services.adjudication import Adjudicator, material_balance
+from chessbot.services.match_runner import BotConfig, MatchConfig, run_match
+
+
+def test_material_balance_counts_pawns() -> None:
+    """Balance is White's material minus Black's, in pawns, kings excluded."""
+    assert material_balance(chess.Board()) == 0
+    assert material_balance(chess.Board("k7/7p/8/8/8/8/8/2QQRR1K w - - 0 1")) == 27
+
+
+def test_threefold_repetition_and_fifty_moves() -> None:
+    """Both draw rules fire on the ply that completes them and can be switched off."""
+    board = chess.Board()
+    adjudicator = Adjudicator(AdjudicationSettings())
+    verdicts = []
+    for move in ["g1f3", "g8f6", "f3g1", "f6g8"] * 2:
+        board.push_uci(move)
+        verdicts.append(adjudicator.check(board))
+    assert verdicts[:-1] == [None] * 7
+    assert verdicts[-1] == ("threefold_repetition", None)
+
+    board = chess.Board("k7/8/8/8/8/8/8/R6K w - - 99 80")
+    board.push_uci("a1b1")
+    assert Adjudicator(AdjudicationSettings()).check(board) == ("fifty_moves", None)
+    rules_off = AdjudicationSettings(fifty_moves=False, threefold_repetition=False)
+    assert Adjudicator(rules_off).check(board) is None
+
+
+def test_material_rules_need_consecutive_plies() -> None:
+    """Draw and resign rules only fire after the balance holds for enough plies."""
+    board = chess.Board()
+    draw = Adjudicator(AdjudicationSettings(draw_after_plies=3, draw_plies=2))
+    verdicts = []
+    for move in ["e2e4", "e7e5", "g1f3", "b8c6"]:
+        board.push_uci(move)
+        verdicts.append(draw.check(board))
+    assert verdicts == [None, None, None, ("draw_adjudication", None)]
+
+    board = chess.Board("k7/7p/8/8/8/8/8/2QQRR1K b - - 0 1")
+    resign = Adjudicator(AdjudicationSettings(resign_material=9, resign_plies=2))
+    board.push_uci("h7h6")
+    assert resign.check(board) is None
+    board.push_uci("c1c2")
+    assert resign.check(board) == ("resign_adjudication", chess.WHITE)
+
+
+def test_run_match_records_adjudication() -> None:
+    """An adjudicated win is scored normally and its termination is kept apart."""
+    white = BotConfig(bot_id=uuid4(), name="Random", command=["python", "bots/random_bot.py"])
+    black = BotConfig(bot_id=uuid4(), name="Greedy", command=["python", "bots/greedy_bot.py"])
+    config = MatchConfig(
+        2,
+        20,
+        start_fen="k7/7p/8/8/8/8/8/2QQRR1K w - - 0 1",
+        adjudication=AdjudicationSettings(resign_material=9, resign_plies=1),
+    )
+    record = run_match(white, black, config).record
+    assert record.result == "white" and record.winner_id == white.bot_id
+    assert record.termination == "resign_adjudication" and record.adjudicated
+    assert len(record.moves) == 1
+
+    plain = run_match(white, black, MatchConfig(2, 2)).record
+    assert plain.termination == "max_moves" and not plain.adjudicated
@@ -1,7 +1,18 @@
 """API integration tests."""
+import threading
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
 from fastapi.testclient import TestClient
 
-from chessbot.web.app import APP
+from chessbot.models import BotCreate, BotMatchPerf, MatchCreate, MatchJob
+from chessbot.services.monitoring import QUEUE_DEPTH
+from chessbot.services.storage import STORE
+from chessbot.settings import get_settings
+from chessbot.tests.factories import match_record
+from chessbot.web import app as web_app
+from chessbot.web.app import APP, fail_interrupted_jobs, resume_tournaments
 
 
 client = TestClient(APP)
@@ -31,7 +42,397 @@ def test_bot_registration_and_match() -> None:
             "move_timeout_s": 2,
             "max_moves": 10,
         },
+        params={"wait": True},
     )
     assert match_response.status_code == 200
     payload = match_response.json()
     assert payload["moves"]
+
+    assert payload["white_perf"]["moves"] >= 1
+    assert payload["white_perf"]["cpu_s"] is not None
+
+    perf = client.get(f"/api/bots/{white_bot['id']}/perf").json()
+    assert perf["matches"] >= 1 and perf["max_rss_bytes"] > 0
+    unknown = "00000000-0000-0000-0000-000000000000"
+    assert client.get(f"/api/bots/{unknown}/perf").status_code == 404
+
+    metrics = client.get("/api/metrics")
+    assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'chessbot_bot_move_seconds_count{bot="Random"}' in metrics.text
+    assert 'chessbot_bot_move_cpu_seconds_count{bot="Random"}' in metrics.text
+    assert 'chessbot_sandbox_spawn_seconds_count{bot="Greedy",mode="oneshot"}' in metrics.text
+
+
+def test_match_jobs_queue_and_report_results() -> None:
+    """Matches are queued by default; the job reports status and links the result."""
+    bot_id = client.post(
+        "/api/bots",
+        json={"name": "Queued", "command": ["python", "bots/random_bot.py"]},
+    ).json()["id"]
+
+    response = client.post(
+        "/api/matches",
+        json={"white_bot_id": bot_id, "black_bot_id": bot_id, "max_moves": 4},
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert response.headers["location"] == f"/api/jobs/{job['id']}"
+
+    finished = client.get(f"/api/jobs/{job['id']}").json()
+    assert finished["status"] == "completed" and finished["finished_at"]
+    result = client.get(f"/api/jobs/{job['id']}/result").json()
+    assert result["id"] == finished["match_id"]
+    assert result["moves"]
+
+    unknown = "00000000-0000-0000-0000-000000000000"
+    assert client.get(f"/api/jobs/{unknown}").status_code == 404
+    missing_bot = client.post(
+        "/api/matches", json={"white_bot_id": bot_id, "black_bot_id": unknown}
+    )
+    assert missing_bot.status_code == 404
+
+
+def test_bot_perf_covers_games_older_than_the_history_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A bot's perf report finds its games behind newer games of other bots."""
+    monkeypatch.setattr(web_app, "PERF_HISTORY_LIMIT", 2)
+    bot, rival = (STORE.create_bot(BotCreate(name=name, command=["x"])) for name in "PQ")
+    perf = BotMatchPerf(moves=3, think_p50_s=0.1, think_p95_s=0.2, think_max_s=0.3)
+    now = datetime.now(timezone.utc)
+    for white, created_at in ((bot, datetime(2000, 1, 1, tzinfo=timezone.utc)), (rival, now)) * 2:
+        STORE.save_match(
+            match_record(
+                white.id, rival.id, created_at=created_at, white_perf=perf, black_perf=perf
+            )
+        )
+
+    report = client.get(f"/api/bots/{bot.id}/perf").json()
+    assert (report["matches"], report["moves"]) == (2, 6)
+
+
+def test_jobs_left_by_a_previous_boot_are_failed_on_startup() -> None:
+    """Unfinished jobs of an earlier boot fail; jobs of this boot's workers are kept."""
+    bot_id = client.post(
+        "/api/bots", json={"name": "Restarted", "command": ["python", "bots/random_bot.py"]}
+    ).json()["id"]
+    request = MatchCreate(white_bot_id=bot_id, black_bot_id=bot_id)
+    current, previous = "server/boot-2", "server/boot-1"
+
+    def job(runner: str, status: str = "queued") -> MatchJob:
+        created = MatchJob(
+            id=uuid4(),
+            request=request,
+            status=status,
+            created_at=datetime.now(timezone.utc),
+            runner=runner,
+        )
+        STORE.save_job(created)
+        return created
+
+    # Two workers of the current boot are playing jobs while a third one starts.
+    live = [job(current), job(current, "running"), job(current, "running")]
+    stale = [job(previous), job(previous, "running")]
+    done = job(previous, "completed")
+
+    for _worker in range(2):
+        failed = set(fail_interrupted_jobs(current))
+        assert failed.isdisjoint(item.id for item in live + [done])
+    assert all(STORE.get_job(item.id).status == "failed" for item in stale)
+    assert [STORE.get_job(item.id).status for item in live] == ["queued", "running", "running"]
+    interrupted = client.get(f"/api/jobs/{stale[1].id}").json()
+    assert "restart" in interrupted["error"]
+    assert STORE.get_job(done.id).status == "completed"
+
+    response = client.post(
+        "/api/matches", json={"white_bot_id": bot_id, "black_bot_id": bot_id, "max_moves": 2}
+    )
+    assert STORE.get_job(UUID(response.json()["id"])).runner == get_settings().runner
+
+
+def test_gauntlet_batch_aggregates_results() -> None:
+    """One request plays a gauntlet and reports per-opponent and overall scores."""
+    challenger, *opponents = [
+        client.post(
+            "/api/bots",
+            json={"name": f"Gauntlet{i}", "command": ["python", "bots/random_bot.py"]},
+        ).json()["id"]
+        for i in range(3)
+    ]
+    response = client.post(
+        "/api/batches",
+        json={
+            "gauntlet": {
+                "challenger_id": challenger,
+                "opponent_ids": opponents,
+                "games_per_opponent": 2,
+            },
+            "max_moves": 4,
+        },
+    )
+    assert response.status_code == 202
+    assert response.headers["location"] == f"/api/batches/{response.json()['id']}"
+
+    batch = client.get(response.headers["location"]).json()
+    assert batch["status"] == "completed"
+    assert batch["completed_matches"] == batch["total_matches"] == len(batch["matches"]) == 4
+    assert [score["opponent_id"] for score in batch["opponents"]] == opponents
+    assert all(score["games"] == 2 for score in batch["opponents"])
+    assert len(batch["standings"]) == 3
+
+    listed = client.post(
+        "/api/batches",
+        json={"pairings": [{"white_bot_id": opponents[0], "black_bot_id": opponents[1]}]},
+        params={"wait": True},
+    )
+    assert listed.status_code == 200
+    assert listed.json()["status"] == "completed" and not listed.json()["opponents"]
+
+    unknown = "00000000-0000-0000-0000-000000000000"
+    missing = client.post(
+        "/api/batches", json={"pairings": [{"white_bot_id": unknown, "black_bot_id": challenger}]}
+    )
+    assert missing.status_code == 404
+    assert client.get(f"/api/batches/{unknown}").status_code == 404
+
+
+def test_tournament_runs_all_pairings() -> None:
+    """A tournament records every pairing and final standings."""
+    bot_ids = [
+        client.post(
+            "/api/bots",
+            json={"name": f"Random{i}", "command": ["python", "bots/random_bot.py"]},
+        ).json()["id"]
+        for i in range(4)
+    ]
+
+    response = client.post(
+        "/api/tournaments",
+        json={"name": "Cup", "bot_ids": bot_ids, "rounds": 1, "max_moves": 4},
+    )
+    assert response.status_code == 200
+
+    tournament = client.get(f"/api/tournaments/{response.json()['id']}").json()
+    assert tournament["status"] == "completed"
+    assert tournament["completed_matches"] == tournament["total_matches"] == 2
+    assert len(tournament["matches"]) == 2
+    assert len(tournament["standings"]) == 4
+
+    response = client.post(
+        "/api/tournaments",
+        json={"name": "Open", "bot_ids": bot_ids, "format": "swiss", "max_moves": 4},
+    )
+    assert response.status_code == 200
+    swiss = client.get(f"/api/tournaments/{response.json()['id']}").json()
+    assert swiss["format"] == "swiss" and swiss["rounds"] == 2
+    assert swiss["completed_matches"] == swiss["total_matches"] == 4
+    assert len(swiss["matches"]) == 4
+
+    response = client.post(
+        "/api/tournaments",
+        json={
+            "name": "Duel",
+            "bot_ids": bot_ids[:2],
+            "format": "sprt",
+            "max_moves": 4,
+            "sprt": {"elo0": 0, "elo1": 10, "max_pairs": 2},
+        },
+    )
+    assert response.status_code == 200
+    duel = client.get(f"/api/tournaments/{response.json()['id']}").json()
+    assert duel["status"] == "completed"
+    assert 1 <= duel["sprt"]["pairs"] <= 2
+    assert len(duel["matches"]) == duel["completed_matches"] == 2 * duel["sprt"]["pairs"]
+
+
+def test_failing_pairing_marks_the_tournament_failed(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A game that raises fails the tournament and leaves no games queued."""
+    bot_ids = [
+        client.post(
+            "/api/bots",
+            json={"name": f"Broken{i}", "command": ["python", "bots/random_bot.py"]},
+        ).json()["id"]
+        for i in range(4)
+    ]
+    queued = QUEUE_DEPTH.labels(queue="tournament")
+    before = queued.value
+
+    def broken(*_args: object) -> None:
+        raise RuntimeError("bot host unreachable")
+
+    monkeypatch.setattr(web_app, "_play_pairing", broken)
+    response = client.post(
+        "/api/tournaments",
+        json={"name": "Doomed", "bot_ids": bot_ids, "rounds": 2, "max_moves": 4},
+    )
+
+    tournament = client.get(f"/api/tournaments/{response.json()['id']}").json()
+    assert tournament["status"] == "failed"
+    assert tournament["error"] == "bot host unreachable"
+    assert queued.value == before
+    assert resume_tournaments() == []
+
+
+def test_tournament_reads_match_history_once_when_games_wait(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The duration estimator is built once per tournament, and not when nothing queues."""
+    built = []
+    history_estimator = web_app.history_estimator
+    monkeypatch.setattr(
+        web_app, "history_estimator", lambda: built.append(1) or history_estimator()
+    )
+    bot_ids = [
+        client.post(
+            "/api/bots",
+            json={"name": f"History{i}", "command": ["python", "bots/random_bot.py"]},
+        ).json()["id"]
+        for i in range(4)
+    ]
+    swiss = {"name": "History", "bot_ids": bot_ids, "format": "swiss", "rounds": 2, "max_moves": 4}
+
+    assert client.post("/api/tournaments", json=swiss).status_code == 200
+    assert built == []
+
+    monkeypatch.setattr(get_settings(), "tournament_workers", 1)
+    assert client.post("/api/tournaments", json=swiss).status_code == 200
+    assert built == [1]
+
+
+def test_interrupted_tournament_resumes_from_its_checkpoint() -> None:
+    """Finished games are kept and only the unplayed rest of the schedule runs."""
+    bot_ids = [
+        client.post(
+            "/api/bots",
+            json={"name": f"Resume{i}", "command": ["python", "bots/random_bot.py"]},
+        ).json()["id"]
+        for i in range(4)
+    ]
+    response = client.post(
+        "/api/tournaments",
+        json={"name": "Before restart", "bot_ids": bot_ids, "rounds": 2, "max_moves": 4},
+    )
+    played = STORE.get_tournament(UUID(response.json()["id"]))
+    assert played.runner and [game.match_id for game in played.schedule] == played.matches
+
+    schedule = [game.model_copy() for game in played.schedule]
+    for game in schedule[2:]:
+        game.match_id = None
+    interrupted = played.model_copy(
+        update={
+            "id": uuid4(),
+            "status": "running",
+            "matches": played.matches[:2],
+            "completed_matches": 2,
+            "standings": [],
+            "schedule": schedule,
+            # Same instance ID as this server, but an earlier boot of it.
+            "runner": f"{get_settings().instance_id}/previous-boot",
+        }
+    )
+    STORE.save_tournament(interrupted)
+
+    assert resume_tournaments() == [interrupted.id]
+    assert resume_tournaments() == []
+    for thread in threading.enumerate():
+        if thread.name == f"tournament-{interrupted.id}":
+            thread.join(timeout=30)
+
+    resumed = STORE.get_tournament(interrupted.id)
+    assert resumed.status == "completed"
+    assert resumed.completed_matches == resumed.total_matches == 4
+    assert resumed.matches[:2] == played.matches[:2]
+    assert set(resumed.matches[2:]).isdisjoint(played.matches)
+    assert [game.match_id for game in resumed.schedule] == resumed.matches
+
+
+def test_opening_suites_for_matches_and_tournaments() -> None:
+    """Suite games start from suite positions and tournaments play each one twice."""
+    assert "sample.epd" in client.get("/api/openings").json()
+    bot_ids = [
+        client.post(
+            "/api/bots",
+            json={"name": f"Opener{i}", "command": ["python", "bots/random_bot.py"]},
+        ).json()["id"]
+        for i in range(2)
+    ]
+
+    match = client.post(
+        "/api/matches",
+        json={
+            "white_bot_id": bot_ids[0],
+            "black_bot_id": bot_ids[1],
+            "max_moves": 4,
+            "opening_suite": "sample.epd",
+        },
+        params={"wait": True},
+    ).json()
+    assert match["start_fen"] and match["fen_history"][0] == match["start_fen"]
+
+    response = client.post(
+        "/api/tournaments",
+        json={
+            "name": "Openings",
+            "bot_ids": bot_ids,
+            "max_moves": 4,
+            "opening_suite": "sample.epd",
+        },
+    )
+    tournament = client.get(f"/api/tournaments/{response.json()['id']}").json()
+    assert tournament["completed_matches"] == tournament["total_matches"] == 2
+    first, second = (
+        client.get(f"/api/matches/{match_id}").json() for match_id in tournament["matches"]
+    )
+    assert first["start_fen"] == second["start_fen"]
+    assert first["white_bot_id"] == second["black_bot_id"]
+
+    missing = client.post(
+        "/api/tournaments",
+        json={"name": "Missing", "bot_ids": bot_ids, "opening_suite": "nope.epd"},
+    )
+    assert missing.status_code == 404
+    both = client.post(
+        "/api/matches",
+        json={
+            "white_bot_id": bot_ids[0],
+            "black_bot_id": bot_ids[1],
+            "start_fen": match["start_fen"],
+            "opening_suite": "sample.epd",
+        },
+    )
+    assert both.status_code == 422
+
+
+def test_list_matches_summary_and_projection() -> None:
+    """List views can skip heavy match fields."""
+    bot_id = client.post(
+        "/api/bots",
+        json={"name": "Random", "command": ["python", "bots/random_bot.py"]},
+    ).json()["id"]
+    client.post(
+        "/api/matches",
+        json={"white_bot_id": bot_id, "black_bot_id": bot_id, "max_moves": 2},
+    )
+
+    full = client.get("/api/matches", params={"limit": 1}).json()
+    assert full[0]["moves"] and full[0]["pgn"]
+    assert len(full[0]["fen_history"]) == len(full[0]["moves"]) + 1
+    replayed = client.get("/api/matches", params={"fields": "id,pgn", "limit": 1}).json()
+    assert replayed[0]["pgn"] == full[0]["pgn"]
+
+    summaries = client.get("/api/matches", params={"view": "summary"}).json()
+    assert summaries
+    assert "fen_history" not in summaries[0]
+    assert summaries[0]["move_count"] >= 1
+
+    projected = client.get("/api/matches", params={"fields": "id,result", "limit": 1}).json()
+    assert set(projected[0]) == {"id", "result"}
+
+    mixed = client.get("/api/matches", params={"fields": "move_count,moves", "limit": 1}).json()
+    assert set(mixed[0]) == {"move_count", "moves"}
+    assert mixed[0]["move_count"] == len(mixed[0]["moves"])
+    response = client.get("/api/matches", params={"view": "summary", "fields": "id,moves"})
+    assert response.status_code == 400
+
+    assert client.get("/api/matches", params={"fields": "nope"}).status_code == 400
@@ -0,0 +1,61 @@
+"""Tests for batch and gauntlet pairings and their aggregated results."""
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from chessbot.models import BatchCreate
+from chessbot.services.batches import batch_pairings, gauntlet_pairings, gauntlet_scores
+from chessbot.tests.factories import match_record
+
+
+def test_gauntlet_alternates_colors_and_shares_openings_per_pair() -> None:
+    """Each opponent gets alternating colors, both games of a pair on one opening."""
+    games = gauntlet_pairings("c", ["a", "b"], 3, positions=["p0", "p1", "p2"])
+    assert [(game.white_id, game.black_id, game.start_fen) for game in games] == [
+        ("c", "a", "p0"),
+        ("a", "c", "p0"),
+        ("c", "a", "p1"),
+        ("c", "b", "p2"),
+        ("b", "c", "p2"),
+        ("c", "b", "p0"),
+    ]
+
+
+def test_batch_request_takes_pairings_or_gauntlet() -> None:
+    """A batch needs exactly one game source and stays under the game limit."""
+    white, black = uuid4(), uuid4()
+    request = BatchCreate(pairings=[{"white_bot_id": white, "black_bot_id": black}] * 2)
+    assert request.game_count == 2
+    assert [game.start_fen for game in batch_pairings(request, ["p0"])] == ["p0", "p0"]
+
+    gauntlet = {"challenger_id": white, "opponent_ids": [black]}
+    with pytest.raises(ValidationError, match="exactly one of pairings or gauntlet"):
+        BatchCreate()
+    with pytest.raises(ValidationError, match="exactly one of pairings or gauntlet"):
+        BatchCreate(pairings=request.pairings, gauntlet=gauntlet)
+    with pytest.raises(ValidationError):
+        BatchCreate(gauntlet={**gauntlet, "opponent_ids": [black] * 20, "games_per_opponent": 100})
+
+
+def test_gauntlet_scores_are_from_the_challenger_side() -> None:
+    """Per-opponent tallies count only challenger games, scored for the challenger."""
+    challenger, first, second = uuid4(), uuid4(), uuid4()
+    records = [
+        match_record(challenger, first, "white"),
+        match_record(first, challenger, "draw"),
+        match_record(challenger, second, "black"),
+        match_record(second, challenger, "white"),
+        match_record(first, second, "white"),
+    ]
+    names = {first: "First", second: "Second"}
+    scores = gauntlet_scores(challenger, records, names.__getitem__)
+
+    assert [(s.name, s.games, s.wins, s.draws, s.losses, s.points) for s in scores] == [
+        ("First", 2, 1, 1, 0, 1.5),
+        ("Second", 2, 0, 0, 2, 0.0),
+    ]
+    assert scores[0].elo == pytest.approx(190.8, abs=0.1)
+    assert scores[1].elo is None
@@ -0,0 +1,23 @@
+"""Tests for the benchmark suite's report and baseline comparison."""
+import json
+
+from chessbot.benchmarks import compare, run_benchmarks
+
+
+def test_benchmark_report_is_json_and_flags_regressions() -> None:
+    """Reports survive a JSON round trip and slower medians are reported as regressions."""
+    report = run_benchmarks(["round_robin", "standings"], sizes=(200,), repeat=2)
+    report = json.loads(json.dumps(report))
+
+    keys = [result["key"] for result in report["results"]]
+    assert keys == [
+        "round_robin[bots=100,matches=200]",
+        "standings_tally[bots=100,matches=200]",
+    ]
+    assert all(result["median"] > 0 for result in report["results"])
+    assert compare(report, report, tolerance=0.25) == []
+
+    faster = json.loads(json.dumps(report))
+    for result in faster["results"]:
+        result["median"] /= 10
+    assert len(compare(report, faster, tolerance=0.25)) == 2
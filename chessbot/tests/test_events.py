@@ -0,0 +1,67 @@
+"""Tests for live match events."""
+from __future__ import annotations
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from chessbot.services.events import EventBus, match_channel
+from chessbot.services.match_runner import BotConfig, MatchConfig, run_match
+
+
+def test_match_events_reach_subscribers_from_worker_threads() -> None:
+    """Moves played on a worker thread are streamed to an asyncio subscriber."""
+    bus = EventBus()
+    white = BotConfig(bot_id=uuid4(), name="Random", command=["python", "bots/random_bot.py"])
+    black = BotConfig(
+        bot_id=uuid4(), name="Greedy", command=["python", "bots/greedy_bot.py"], protocol="session"
+    )
+    snapshots: list = []
+
+    def observe(name: str, data: dict) -> None:
+        bus.observe_match(name, data)
+        if name == "move" and data["ply"] == 2:
+            snapshots.append(bus.live_matches())
+
+    def play_and_store() -> None:
+        record = run_match(white, black, MatchConfig(2, 6), observe).record
+        assert bus.live_match(record.id) is not None
+        bus.finish_match(record)
+
+    async def watch() -> list:
+        with bus.subscribe("activity") as activity:
+            task = asyncio.create_task(asyncio.to_thread(play_and_store))
+            start = await activity.get(timeout_s=10)
+            events = []
+            with bus.subscribe(match_channel(start.data["match_id"])) as moves:
+                while (event := await moves.get(timeout_s=10)) is not None:
+                    events.append(event)
+                    if event.name == "end":
+                        break
+            await task
+            return events
+
+    events = asyncio.run(watch())
+    assert events[-1].name == "end"
+    assert [event.data["ply"] for event in events if event.name == "move"][-1] == 6
+    assert snapshots[0][0]["moves"] and bus.live_matches() == []
+
+
+def test_match_that_fails_to_start_is_dropped_from_live_matches() -> None:
+    """A bot that cannot be launched aborts the match instead of leaving it live."""
+    bus = EventBus()
+    broken = BotConfig(
+        bot_id=uuid4(), name="Missing", command=["/nonexistent/bot"], protocol="session"
+    )
+    seen: list = []
+
+    def observe(name: str, data: dict) -> None:
+        bus.observe_match(name, data)
+        seen.append(name)
+
+    with pytest.raises(OSError):
+        run_match(broken, broken, MatchConfig(2, 4), observe)
+
+    assert seen == ["start", "abort"]
+    assert bus.live_matches() == []
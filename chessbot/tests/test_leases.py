@@ -0,0 +1,185 @@
+"""Tests for remote match leases and the worker that plays them."""
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+import uvicorn
+
+from chessbot.models import BotRecord, MatchAssignment, MatchRecord
+from chessbot.services.leases import LEASES, MAX_LEASE_ATTEMPTS, LeaseQueue, RemoteMatchError
+from chessbot.services.match_runner import MatchConfig
+from chessbot.tests.factories import bot_record, match_record
+from chessbot.web.app import APP
+from chessbot.worker import MatchWorker
+
+
+def _forfeit(white: BotRecord, black: BotRecord, **fields) -> MatchRecord:
+    """White forfeits from the start position, the only ending of an empty game."""
+    return match_record(
+        white.id,
+        black.id,
+        "forfeit",
+        termination="forfeit",
+        winner=black.name,
+        winner_id=black.id,
+        **fields,
+    )
+
+
+def test_completed_lease_resolves_the_submitted_match() -> None:
+    """A live lease accepts one record for its pairing and the submitter gets it."""
+    queue = LeaseQueue()
+    white, black = bot_record("White"), bot_record("Black")
+    future = queue.submit(white, black, MatchConfig(move_timeout_s=2, max_moves=6))
+    assert queue.snapshot()["pending"] == 1
+
+    assignment = queue.lease("w1", lease_s=30)
+    assert assignment is not None and assignment.max_moves == 6
+    assert queue.lease("w2", lease_s=30) is None
+    assert queue.snapshot() == {"pending": 0, "leased": 1, "workers": {"w1": 1}}
+
+    with pytest.raises(ValueError):
+        queue.complete(assignment.lease_id, _forfeit(black, white))
+    record = _forfeit(white, black)
+    assert queue.complete(assignment.lease_id, record)
+    assert future.result(timeout=1) == record
+    assert not queue.complete(assignment.lease_id, record)
+
+
+def test_expired_lease_is_requeued_and_late_results_are_refused() -> None:
+    """A lapsed lease goes back to the front of the queue and its worker is refused."""
+    queue = LeaseQueue()
+    white, black = bot_record("White"), bot_record("Black")
+    first = queue.submit(white, black, MatchConfig(move_timeout_s=2, max_moves=4))
+    queue.submit(black, white, MatchConfig(move_timeout_s=2, max_moves=4))
+
+    lost = queue.lease("slow", lease_s=0.05)
+    assert queue.renew(lost.lease_id, 0.05) is not None
+    time.sleep(0.1)
+    assert queue.renew(lost.lease_id, 30) is None
+
+    retry = queue.lease("fast", lease_s=30)
+    assert retry.job_id == lost.job_id and retry.lease_id != lost.lease_id
+    assert not queue.complete(lost.lease_id, _forfeit(white, black))
+    assert queue.complete(retry.lease_id, _forfeit(white, black))
+    assert first.done()
+    assert queue.snapshot()["pending"] == 1
+
+
+def test_results_are_replayed_against_the_lease() -> None:
+    """Records must replay to their result under the leased settings, or get a 422."""
+    queue = LeaseQueue()
+    white, black = bot_record("White"), bot_record("Black")
+    tournament_id = uuid4()
+    start_fen = "k7/8/1K6/8/8/8/8/7Q w - - 0 1"
+    config = MatchConfig(move_timeout_s=2, max_moves=4, start_fen=start_fen)
+    future = queue.submit(white, black, config, tournament_id)
+    lease_id = queue.lease("w1", lease_s=30).lease_id
+
+    mate = {"moves": ["h1h8"], "termination": "checkmate", "winner_id": white.id}
+    rejected = [
+        match_record(white.id, black.id, "black", **{**mate, "winner_id": black.id}),
+        match_record(white.id, black.id, "white", **{**mate, "moves": ["h1h7"]}),
+        match_record(white.id, black.id, "white", **{**mate, "moves": ["h1h8", "a8a7"]}),
+        match_record(white.id, black.id, "draw", moves=["h1g1"] * 5, termination="max_moves"),
+        match_record(white.id, black.id, "flag", termination="flag", winner_id=black.id),
+    ]
+    for record in rejected:
+        with pytest.raises(ValueError):
+            queue.complete(lease_id, record)
+
+    claimed = match_record(white.id, black.id, "white", start_fen=None, **mate)
+    assert queue.complete(lease_id, claimed)
+    stored = future.result(timeout=1)
+    assert stored.start_fen == start_fen and stored.tournament_id == tournament_id
+    assert stored.winner == "White"
+
+
+def test_failing_match_is_retried_then_given_up() -> None:
+    """Failed or expired leases re-queue the match until it runs out of attempts."""
+    queue = LeaseQueue()
+    white, black = bot_record("White"), bot_record("Black")
+    future = queue.submit(white, black, MatchConfig(move_timeout_s=2, max_moves=4))
+
+    for _attempt in range(MAX_LEASE_ATTEMPTS - 1):
+        assert queue.fail(queue.lease("w1", lease_s=30).lease_id, "no such bot") is True
+    last = queue.lease("w1", lease_s=30)
+    assert queue.fail(last.lease_id, "no such bot") is False
+    assert queue.fail(last.lease_id, "no such bot") is None
+    with pytest.raises(RemoteMatchError, match="no such bot"):
+        future.result(timeout=1)
+    assert queue.snapshot() == {"pending": 0, "leased": 0, "workers": {}}
+
+    expiring = queue.submit(white, black, MatchConfig(move_timeout_s=2, max_moves=4))
+    for _attempt in range(MAX_LEASE_ATTEMPTS):
+        assert queue.lease("gone", lease_s=0.01) is not None
+        time.sleep(0.02)
+    assert queue.lease("w1", lease_s=30) is None
+    with pytest.raises(RemoteMatchError, match="lease expired"):
+        expiring.result(timeout=1)
+
+
+def test_worker_reports_a_match_it_cannot_play(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A bot that cannot start is posted to the fail endpoint instead of killing the worker."""
+    white, black = bot_record("Missing", "bots/no_such_bot.py"), bot_record("Black")
+    white.command = ["/nonexistent/bot"]
+    assignment = MatchAssignment(
+        lease_id=uuid4(),
+        job_id=uuid4(),
+        white=white,
+        black=black,
+        move_timeout_s=2,
+        max_moves=4,
+        expires_at=datetime.now(timezone.utc),
+    )
+    posted = []
+    worker = MatchWorker("http://127.0.0.1:9", "test", lease_s=30)
+    monkeypatch.setattr(worker, "_post", lambda path, body: posted.append((path, body)) or b"")
+
+    worker.play(assignment)
+
+    assert worker.played == 0
+    [(path, body)] = posted
+    assert path == f"/api/worker/leases/{assignment.lease_id}/fail"
+    assert "/nonexistent/bot" in json.loads(body)["error"]
+
+
+def test_worker_plays_leased_matches_over_http() -> None:
+    """``MatchWorker`` leases, plays and posts matches against a live server."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(APP, host="127.0.0.1", port=port, log_level="error"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        assert time.monotonic() < deadline, "server did not start"
+        time.sleep(0.01)
+
+    try:
+        white = bot_record("Random")
+        black = bot_record("Greedy", "bots/greedy_bot.py")
+        futures = [
+            LEASES.submit(white, black, MatchConfig(move_timeout_s=2, max_moves=4)),
+            LEASES.submit(black, white, MatchConfig(move_timeout_s=2, max_moves=4)),
+        ]
+        worker = MatchWorker(f"http://127.0.0.1:{port}", "test", lease_s=5, poll_s=0.05)
+        worker.run(max_matches=2)
+        records = [future.result(timeout=10) for future in futures]
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+
+    assert worker.played == 2
+    assert [(r.white_bot_id, r.black_bot_id) for r in records] == [
+        (white.id, black.id),
+        (black.id, white.id),
+    ]
+    assert all(record.moves for record in records)
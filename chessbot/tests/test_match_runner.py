@@ -1,9 +1,10 @@
 """Tests for the match runner."""
 from __future__ import annotations
 
+import asyncio
 from uuid import uuid4
 
-from chessbot.services.match_runner import BotConfig, MatchConfig, run_match
+from chessbot.services.match_runner import BotConfig, MatchConfig, run_match, run_match_async
 
 
 def test_run_match_smoke() -> None:
@@ -21,3 +22,116 @@ def test_run_match_smoke() -> None:
     result = run_match(white, black, MatchConfig(move_timeout_s=2, max_moves=20))
     assert result.record.moves
     assert result.record.fen_history
+
+
+def test_run_match_session_protocol() -> None:
+    """Session bots are started once and answer every move over stdin/stdout."""
+    white = BotConfig(
+        bot_id=uuid4(),
+        name="Random",
+        command=["python", "bots/random_bot.py"],
+        protocol="session",
+    )
+    black = BotConfig(
+        bot_id=uuid4(),
+        name="Greedy",
+        command=["python", "bots/greedy_bot.py"],
+        protocol="session",
+    )
+    result = run_match(white, black, MatchConfig(move_timeout_s=2, max_moves=20))
+    assert result.record.result != "forfeit"
+    assert len(result.record.moves) == len(result.record.fen_history) - 1
+
+
+def test_run_match_async_both_protocols() -> None:
+    """The asyncio runner plays one-shot and session bots against each other."""
+    white = BotConfig(
+        bot_id=uuid4(),
+        name="Random",
+        command=["python", "bots/random_bot.py"],
+    )
+    black = BotConfig(
+        bot_id=uuid4(),
+        name="Greedy",
+        command=["python", "bots/greedy_bot.py"],
+        protocol="session",
+    )
+    result = asyncio.run(
+        run_match_async(white, black, MatchConfig(move_timeout_s=2, max_moves=10))
+    )
+    assert result.record.result != "forfeit"
+    assert len(result.record.moves) == 10
+
+
+def test_clocked_match_tracks_remaining_time() -> None:
+    """Clocked games record remaining time and end on a flag when a clock runs out."""
+    white = BotConfig(
+        bot_id=uuid4(),
+        name="Random",
+        command=["python", "bots/random_bot.py"],
+        protocol="session",
+    )
+    black = BotConfig(
+        bot_id=uuid4(),
+        name="Greedy",
+        command=["python", "bots/greedy_bot.py"],
+        protocol="session",
+    )
+    black.send_clock = True
+    blitz = MatchConfig(move_timeout_s=2, max_moves=10, clock_initial_s=10, clock_increment_s=0.1)
+    record = run_match(white, black, blitz).record
+    assert record.result != "flag"
+    assert 0 < record.white_clock_s <= 10.5
+
+    slow = BotConfig(
+        bot_id=uuid4(),
+        name="Slow",
+        command=["python", "-c", "import time; time.sleep(1)"],
+    )
+    record = run_match(slow, black, MatchConfig(2, 10, clock_initial_s=0.2)).record
+    assert record.result == "flag"
+    assert record.winner_id == black.bot_id
+    assert record.white_clock_s == 0
+
+
+def test_match_starts_from_given_position() -> None:
+    """Games from a start FEN replay from that position and export it to PGN."""
+    white = BotConfig(bot_id=uuid4(), name="Random", command=["python", "bots/random_bot.py"])
+    black = BotConfig(bot_id=uuid4(), name="Greedy", command=["python", "bots/greedy_bot.py"])
+    start_fen = "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2"
+    record = run_match(white, black, MatchConfig(2, 6, start_fen=start_fen)).record
+    assert record.start_fen == start_fen
+    assert record.fen_history[0] == start_fen
+    assert f'[FEN "{start_fen}"]' in record.pgn
+
+
+def test_run_match_through_fork_server() -> None:
+    """One-shot bots can be forked from warm templates in both runners."""
+    white = BotConfig(uuid4(), "Random", ["python", "bots/random_bot.py"], fork_server=True)
+    black = BotConfig(uuid4(), "Greedy", ["python", "bots/greedy_bot.py"], fork_server=True)
+    record = run_match(white, black, MatchConfig(move_timeout_s=2, max_moves=10)).record
+    assert record.result != "forfeit"
+    assert len(record.moves) == 10
+    record = asyncio.run(
+        run_match_async(white, black, MatchConfig(move_timeout_s=2, max_moves=10))
+    ).record
+    assert record.result != "forfeit"
+
+
+def test_clocked_session_sends_one_line_unless_the_bot_opts_in() -> None:
+    """A session bot that parses every line as a FEN stays in sync in clocked games."""
+    strict = (
+        "import sys, chess\n"
+        "for line in sys.stdin:\n"
+        "    board = chess.Board(line.strip())\n"
+        "    print(next(iter(board.legal_moves)).uci(), flush=True)\n"
+    )
+    white, black = (
+        BotConfig(
+            bot_id=uuid4(), name=name, command=["python", "-c", strict], protocol="session"
+        )
+        for name in ("StrictWhite", "StrictBlack")
+    )
+    record = run_match(white, black, MatchConfig(2, 6, clock_initial_s=10)).record
+    assert record.termination != "forfeit"
+    assert len(record.moves) == 6
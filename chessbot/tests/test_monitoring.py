@@ -0,0 +1,28 @@
+"""Tests for the in-process metrics registry."""
+from chessbot.services.monitoring import MetricsRegistry
+
+
+def test_registry_renders_prometheus_text() -> None:
+    """Counters, gauges and histograms render with escaped labels and cumulative buckets."""
+    registry = MetricsRegistry()
+    moves = registry.histogram("move_seconds", "Move latency.", ("bot",), buckets=(0.1, 1.0))
+    games = registry.counter("games_total", "Games played.")
+    queued = registry.gauge("queued", "Queued games.", ("queue",))
+
+    fast = moves.labels(bot='say "hi"')
+    fast.observe(0.05)
+    fast.observe(0.5)
+    fast.observe(5.0)
+    games.labels().inc()
+    with queued.labels(queue="tournament").track():
+        assert 'queued{queue="tournament"} 1.0' in registry.render()
+
+    text = registry.render()
+    assert "# TYPE move_seconds histogram" in text
+    assert 'move_seconds_bucket{bot="say \\"hi\\"",le="0.1"} 1' in text
+    assert 'move_seconds_bucket{bot="say \\"hi\\"",le="1.0"} 2' in text
+    assert 'move_seconds_bucket{bot="say \\"hi\\"",le="+Inf"} 3' in text
+    assert 'move_seconds_count{bot="say \\"hi\\""} 3' in text
+    assert "games_total 1.0" in text
+    assert 'queued{queue="tournament"} 0.0' in text
+    assert registry.counter("games_total", "Games played.") is games
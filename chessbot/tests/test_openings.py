@@ -0,0 +1,62 @@
+"""Tests for opening suites."""
+from __future__ import annotations
+
+import pytest
+
+from chessbot.services.openings import (
+    OpeningSuiteError,
+    OpeningSuiteNotFound,
+    list_suites,
+    load_suite,
+    paired_openings,
+    parse_suite,
+)
+from chessbot.services.scheduler import Pairing
+
+SICILIAN_EPD = 'rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - id "Sicilian";'
+SICILIAN_FEN = "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq c6 0 2"
+
+
+def test_parse_suite_reads_epd_and_fen_lines() -> None:
+    """EPD opcodes are dropped and FEN counters are kept."""
+    positions = parse_suite(f"# comment\n\n{SICILIAN_EPD}\n{SICILIAN_FEN}\n")
+    assert positions == [
+        "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 1",
+        "rnbqkbnr/pp1ppppp/8/2p5/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2",
+    ]
+
+
+def test_parse_suite_reports_bad_lines() -> None:
+    """Illegal positions name their line, and a suite with no positions is rejected."""
+    with pytest.raises(OpeningSuiteError, match="line 2"):
+        parse_suite(f"{SICILIAN_EPD}\n8/8/8/8/8/8/8/8 w - -\n")
+    with pytest.raises(OpeningSuiteError, match="no positions"):
+        parse_suite("# only a comment\n")
+
+
+def test_load_suite_from_directory(tmp_path) -> None:
+    """Only suite files are listed; missing names and path escapes are refused."""
+    (tmp_path / "mine.epd").write_text(SICILIAN_EPD + "\n")
+    (tmp_path / "notes.md").write_text("not a suite")
+    assert list_suites(str(tmp_path)) == ["mine.epd"]
+    assert len(load_suite(str(tmp_path), "mine.epd")) == 1
+    with pytest.raises(OpeningSuiteNotFound):
+        load_suite(str(tmp_path), "missing.epd")
+    with pytest.raises(OpeningSuiteError, match="invalid suite name"):
+        load_suite(str(tmp_path), "../mine.epd")
+
+
+def test_bundled_sample_suite_loads() -> None:
+    """The sample suite shipped in ``openings/`` parses in full."""
+    assert len(load_suite("openings", "sample.epd")) == 8
+
+
+def test_paired_openings_reverse_colors_on_the_same_position() -> None:
+    """Each pairing becomes two games on one opening; openings rotate by pairing."""
+    games = paired_openings([Pairing("a", "b"), Pairing("c", "d")], ["fen1", "fen2"], offset=1)
+    assert games == [
+        Pairing("a", "b", "fen2"),
+        Pairing("b", "a", "fen2"),
+        Pairing("c", "d", "fen1"),
+        Pairing("d", "c", "fen1"),
+    ]
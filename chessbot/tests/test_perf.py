@@ -0,0 +1,71 @@
+"""Tests for per-move performance aggregates."""
+from __future__ import annotations
+
+from uuid import uuid4
+
+from chessbot.models import BotMatchPerf
+from chessbot.services.perf import PerfTracker, bot_perf_report, percentile
+from chessbot.services.sandbox import DEFAULT_MEMORY_BYTES, SandboxResult
+from chessbot.tests.factories import match_summary
+
+
+def _reply(cpu_s=None, max_rss_bytes=None) -> SandboxResult:
+    """A successful ``e2e4`` reply with the given resource use."""
+    return SandboxResult("e2e4", "", False, 0, cpu_s=cpu_s, max_rss_bytes=max_rss_bytes)
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    """Percentiles pick the nearest-rank value, also from a single sample."""
+    values = [float(i) for i in range(1, 21)]
+    assert percentile(values, 50) == 10.0
+    assert percentile(values, 95) == 19.0
+    assert percentile([3.0], 95) == 3.0
+
+
+def test_tracker_summarizes_one_side_of_a_match() -> None:
+    """Think times cover every move; CPU and memory only the moves that report them."""
+    tracker = PerfTracker()
+    assert tracker.summary() is None
+    tracker.add(_reply(0.1, 20_000_000), 0.2)
+    tracker.add(_reply(0.3, 30_000_000), 0.4)
+    tracker.add(_reply(), 0.1)
+
+    perf = tracker.summary()
+    assert (perf.moves, perf.think_p50_s, perf.think_max_s) == (3, 0.2, 0.4)
+    assert (perf.cpu_s, perf.cpu_max_s, perf.max_rss_bytes) == (0.4, 0.3, 30_000_000)
+
+
+def test_bot_report_combines_its_recent_matches() -> None:
+    """The report covers the newest ``limit`` matches, counting self-play once."""
+    bot, other = uuid4(), uuid4()
+
+    fast = BotMatchPerf(
+        moves=2, think_p50_s=0.1, think_p95_s=0.2, think_max_s=0.2, cpu_s=0.1, cpu_max_s=0.06
+    )
+    slow = BotMatchPerf(
+        moves=2,
+        think_p50_s=0.5,
+        think_p95_s=0.9,
+        think_max_s=1.0,
+        cpu_s=0.7,
+        cpu_max_s=0.4,
+        max_rss_bytes=DEFAULT_MEMORY_BYTES // 2,
+    )
+    summaries = [
+        match_summary(bot, other, white_perf=slow, black_perf=fast),
+        match_summary(other, bot, white_perf=slow, black_perf=fast),
+        match_summary(bot, other, white_perf=slow),
+    ]
+
+    report = bot_perf_report(bot, "Bot", summaries, limit=2)
+    assert (report.matches, report.moves) == (2, 4)
+    assert (report.think_p50_s, report.think_p95_s, report.think_max_s) == (0.1, 0.9, 1.0)
+    assert (report.cpu_per_move_s, report.cpu_max_s) == (0.2, 0.4)
+    assert report.memory_limit_fraction == 0.5
+
+    empty = bot_perf_report(uuid4(), "Idle", summaries, limit=10)
+    assert empty.matches == 0 and empty.think_p50_s is None
+
+    self_play = [match_summary(bot, bot, white_perf=slow, black_perf=fast)] + summaries
+    report = bot_perf_report(bot, "Bot", self_play, limit=2)
+    assert (report.matches, report.moves) == (2, 6)
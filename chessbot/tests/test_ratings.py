@@ -0,0 +1,47 @@
+"""Tests for the Elo/Glicko-2 rating engine."""
+from __future__ import annotations
+
+import random
+from uuid import uuid4
+
+import pytest
+
+from chessbot.services import ratings as ratings_module
+from chessbot.services.ratings import new_ratings, rate_game, recompute_ratings
+
+
+def test_single_game_updates() -> None:
+    """A win between fresh bots moves Elo by K/2 and Glicko-2 by the textbook amount."""
+    winner, loser = uuid4(), uuid4()
+    ratings = new_ratings()
+    rate_game(ratings, winner, loser, 1.0)
+
+    assert ratings[winner].elo == pytest.approx(1516.0)
+    assert ratings[loser].elo == pytest.approx(1484.0)
+    assert ratings[winner].rating == pytest.approx(1662.3, abs=0.1)
+    assert ratings[loser].rating == pytest.approx(1337.7, abs=0.1)
+    assert ratings[winner].rd == pytest.approx(290.3, abs=0.1)
+    assert ratings[winner].games == ratings[loser].games == 1
+
+
+def test_bulk_recompute_matches_sequential(monkeypatch) -> None:
+    """The vectorized recompute rates games exactly as one-by-one updates do."""
+    pytest.importorskip("numpy")
+    rng = random.Random(7)
+    bots = [uuid4() for _ in range(12)]
+    games = []
+    for _ in range(500):
+        white, black = rng.sample(bots, 2)
+        games.append((white, black, rng.choice((0.0, 0.5, 1.0))))
+    games.append((bots[0], bots[0], 0.5))
+
+    vectorized = recompute_ratings(games)
+    monkeypatch.setattr(ratings_module, "np", None)
+    sequential = recompute_ratings(games)
+
+    for bot in bots:
+        assert vectorized[bot].games == sequential[bot].games
+        assert vectorized[bot].elo == pytest.approx(sequential[bot].elo)
+        assert vectorized[bot].rating == pytest.approx(sequential[bot].rating)
+        assert vectorized[bot].rd == pytest.approx(sequential[bot].rd)
+        assert vectorized[bot].volatility == pytest.approx(sequential[bot].volatility)
@@ -0,0 +1,31 @@
+"""Tests for compact move encoding and lazy replay."""
+from __future__ import annotations
+
+from uuid import uuid4
+
+import chess
+
+from chessbot.replay import decode_moves, encode_moves
+from chessbot.tests.factories import match_record
+
+
+def test_move_encoding_round_trip() -> None:
+    """Every move, including promotions, packs into two bytes and back."""
+    moves = ["e2e4", "a7a8q", "h2h1n", "e1g1", "b7c8r", "g2f1b"]
+    packed = encode_moves(moves)
+    assert len(packed) == 2 * len(moves)
+    assert decode_moves(packed) == moves
+
+
+def test_fen_history_and_pgn_are_derived_from_moves() -> None:
+    """Match records rebuild positions and PGN from their move list."""
+    record = match_record(
+        uuid4(), uuid4(), "white", winner="A", moves=["f2f3", "e7e5", "g2g4", "d8h4"]
+    )
+    board = chess.Board()
+    assert record.fen_history[0] == board.fen()
+    for move in record.moves:
+        board.push_uci(move)
+    assert record.fen_history[-1] == board.fen()
+    assert "2. g4 Qh4# 0-1" in record.pgn
+    assert "pgn" in record.model_dump()
@@ -0,0 +1,110 @@
+"""Tests for the sandbox fork server."""
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from chessbot.services import sandbox
+from chessbot.services.sandbox import (
+    SandboxSession,
+    fork_server,
+    is_forkable,
+    run_forked,
+    run_sandboxed,
+    run_sandboxed_async,
+)
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1\n"
+
+
+def test_is_forkable_only_for_python_scripts() -> None:
+    """Only ``python <script>.py`` commands, with any arguments, use a fork server."""
+    assert is_forkable(["python", "bots/random_bot.py"])
+    assert is_forkable(["/usr/bin/python3.11", "bot.py", "--depth", "2"])
+    assert not is_forkable(["python", "-c", "print('e2e4')"])
+    assert not is_forkable(["./engine"])
+
+
+def test_fork_server_answers_moves_from_warm_template() -> None:
+    """Forked children answer like fresh processes and get their own random state."""
+    server = fork_server(["python", "bots/random_bot.py"])
+    replies = [server.run(START_FEN, timeout_s=5.0) for _ in range(8)]
+    assert all(reply.returncode == 0 and not reply.timed_out for reply in replies)
+    assert len({reply.stdout for reply in replies}) > 1
+    assert fork_server(["python", "bots/random_bot.py"]) is server
+
+
+def test_fork_server_enforces_timeout_and_reports_errors(tmp_path) -> None:
+    """Slow children are killed, crashes surface on stderr and others fall back."""
+    slow = tmp_path / "slow.py"
+    slow.write_text("import sys, time\nif __name__ == '__main__':\n    time.sleep(5)\n")
+    result = run_forked(["python", str(slow)], START_FEN, timeout_s=0.2)
+    assert result.timed_out and result.returncode == -1
+
+    broken = tmp_path / "broken.py"
+    broken.write_text("if __name__ == '__main__':\n    raise RuntimeError('boom')\n")
+    result = run_forked(["python", str(broken)], START_FEN, timeout_s=5.0)
+    assert result.returncode == 1 and "boom" in result.stderr
+
+    fallback = run_forked(["python", "-c", "print('e2e4')"], START_FEN, timeout_s=5.0)
+    assert fallback.stdout == "e2e4"
+
+
+def test_results_report_cpu_time_and_peak_rss() -> None:
+    """One-shot, forked and session bots all report their resource use per move."""
+    spin = "import time\nend = time.process_time() + 0.2\nwhile time.process_time() < end: pass"
+    busy = run_sandboxed(["python", "-c", spin], "", timeout_s=5.0, cpu_seconds=5)
+    assert busy.returncode == 0 and busy.cpu_s >= 0.2
+    assert busy.max_rss_bytes > 1024 * 1024
+
+    killed = run_sandboxed(["python", "-c", "while True: pass"], "", timeout_s=0.3, cpu_seconds=5)
+    assert killed.timed_out and killed.cpu_s >= 0.2
+
+    forked = run_forked(["python", "bots/random_bot.py"], START_FEN, timeout_s=5.0)
+    assert forked.cpu_s is not None and forked.max_rss_bytes > 1024 * 1024
+
+    echo = "import sys\nfor line in sys.stdin:\n    print('e2e4', flush=True)"
+    with SandboxSession(["python", "-c", echo], cpu_seconds=5) as session:
+        reply = session.request(START_FEN, timeout_s=5.0)
+    assert reply.stdout == "e2e4" and reply.cpu_s is not None and reply.max_rss_bytes
+
+
+@pytest.mark.parametrize("pidfd", [True, False])
+def test_async_oneshot_keeps_usage_without_threads(
+    monkeypatch: pytest.MonkeyPatch, pidfd: bool
+) -> None:
+    """Async one-shot moves are reaped on the event loop and still report their usage."""
+    if not pidfd:
+        monkeypatch.delattr(os, "pidfd_open", raising=False)
+    spin = "import time\nend = time.process_time() + 0.2\nwhile time.process_time() < end: pass"
+
+    async def play() -> tuple:
+        threads = threading.active_count()
+        results = await asyncio.gather(
+            run_sandboxed_async(["python", "-c", spin + "\nprint('e2e4')"], "", 5.0, 5),
+            run_sandboxed_async(["python", "-c", "while True: pass"], "", 0.3, 5),
+        )
+        return results, threading.active_count() - threads
+
+    (busy, killed), new_threads = asyncio.run(play())
+    assert new_threads == 0
+    assert busy.stdout == "e2e4" and busy.returncode == 0 and busy.cpu_s >= 0.2
+    assert busy.max_rss_bytes > 1024 * 1024
+    assert killed.timed_out and killed.returncode == -1 and killed.cpu_s > 0
+
+
+def test_unresponsive_template_is_killed_and_dropped(tmp_path) -> None:
+    """A template stuck loading its script is replaced instead of being waited on per move."""
+    stuck = tmp_path / "stuck.py"
+    stuck.write_text(
+        "import signal, time\nsignal.signal(signal.SIGALRM, signal.SIG_IGN)\ntime.sleep(60)\n"
+    )
+    command = ["python", str(stuck)]
+    server = fork_server(command)
+    result = run_forked(command, START_FEN, timeout_s=0.2)
+    assert result.timed_out
+    assert not server.alive
+    assert tuple(command) not in sandbox._FORK_SERVERS
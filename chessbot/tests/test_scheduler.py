@@ -1,5 +1,11 @@
-"""Tests for the round-robin scheduler."""
-from chessbot.services.scheduler import round_robin
+"""Tests for the round-robin and Swiss schedulers."""
+from uuid import uuid4
+
+import pytest
+from pydantic import ValidationError
+
+from chessbot.models import TournamentCreate, swiss_rounds
+from chessbot.services.scheduler import SwissScheduler, round_robin
 
 
 def test_round_robin_pairings() -> None:
@@ -10,3 +16,34 @@ def test_round_robin_pairings() -> None:
         pairings[1].white_id,
         pairings[1].black_id,
     }
+
+
+def test_swiss_avoids_rematches_and_balances_colors() -> None:
+    """Swiss rounds pair by score without rematches and keep colors near even."""
+    bots = [f"bot{i:02d}" for i in range(15)]
+    swiss = SwissScheduler(bots)
+    assert swiss_rounds(200) == 8
+
+    seen = set()
+    for _round in range(5):
+        pairings = swiss.next_round()
+        assert len(pairings) == 7
+        for pairing in pairings:
+            pair = frozenset((pairing.white_id, pairing.black_id))
+            assert pair not in seen
+            seen.add(pair)
+            # Lower bot number is stronger and always wins.
+            swiss.record_result(pairing, 1.0 if pairing.white_id < pairing.black_id else 0.0)
+
+    assert len(set(swiss.byes)) == 5
+    assert all(abs(balance) <= 2 for balance in swiss.color_balance.values())
+    leader = max(bots, key=lambda bot: swiss.scores[bot])
+    assert leader == "bot00" and swiss.scores[leader] == 5.0
+
+
+def test_defaulted_swiss_rounds_respect_the_round_cap() -> None:
+    """More than 1024 bots would default past ten rounds, so the default is rejected."""
+    bot_ids = [uuid4() for _ in range(1025)]
+    with pytest.raises(ValidationError, match="at most 10 rounds"):
+        TournamentCreate(name="big", bot_ids=bot_ids, format="swiss")
+    assert TournamentCreate(name="big", bot_ids=bot_ids, format="swiss", rounds=10).rounds == 10
@@ -0,0 +1,79 @@
+"""Tests for the global match slot scheduler."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from chessbot.services.slots import PRIORITY_INTERACTIVE, SlotScheduler, process_capacity
+from chessbot.settings import Settings
+
+
+def _wait_for(condition, timeout_s: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout_s
+    while not condition():
+        assert time.monotonic() < deadline, "condition never became true"
+        time.sleep(0.005)
+
+
+def test_slots_are_shared_fairly_and_interactive_goes_first() -> None:
+    """Freed slots go to interactive work, then alternate between busy owners."""
+    slots = SlotScheduler(capacity=1)
+    order: list[str] = []
+    release = threading.Event()
+
+    def hold(owner: str, priority: int = 0) -> None:
+        with slots.slot(owner, priority):
+            order.append(owner)
+            if owner == "first":
+                release.wait()
+
+    threads = [threading.Thread(target=hold, args=("first",))]
+    threads[0].start()
+    _wait_for(lambda: order == ["first"])
+    for owner in ["a", "a", "a", "b", "b"]:
+        threads.append(threading.Thread(target=hold, args=(owner,)))
+        threads[-1].start()
+        time.sleep(0.01)
+    threads.append(threading.Thread(target=hold, args=("interactive", PRIORITY_INTERACTIVE)))
+    threads[-1].start()
+    _wait_for(lambda: sum(slots.snapshot()["waiting"].values()) == 6)
+
+    release.set()
+    for thread in threads:
+        thread.join(timeout=2)
+    assert order == ["first", "interactive", "a", "b", "a", "b", "a"]
+    assert slots.snapshot() == {"capacity": 1, "in_use": 0, "running": {}, "waiting": {}}
+
+
+def test_slot_async_caps_concurrency_and_survives_cancellation() -> None:
+    slots = SlotScheduler(capacity=2)
+    peak = 0
+    active = 0
+
+    async def play() -> None:
+        nonlocal peak, active
+        async with slots.slot_async("interactive"):
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def main() -> None:
+        await asyncio.gather(*(play() for _ in range(6)))
+        async with slots.slot_async("x"), slots.slot_async("x"):
+            waiting = asyncio.create_task(play())
+            await asyncio.sleep(0.01)
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+
+    asyncio.run(main())
+    assert peak == 2
+    assert slots.snapshot()["in_use"] == 0 and not slots.snapshot()["waiting"]
+
+
+def test_capacity_is_split_between_web_workers() -> None:
+    """Each web worker gets its share of the cap, and always at least one slot."""
+    assert process_capacity(Settings(max_concurrent_matches=8, web_workers=1)) == 8
+    assert process_capacity(Settings(max_concurrent_matches=8, web_workers=3)) == 2
+    assert process_capacity(Settings(max_concurrent_matches=2, web_workers=4)) == 1
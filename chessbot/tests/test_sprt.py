@@ -0,0 +1,68 @@
+"""Tests for SPRT head-to-head testing."""
+from __future__ import annotations
+
+from uuid import UUID, uuid4
+
+import pytest
+
+from chessbot.models import SprtSettings
+from chessbot.services.sprt import SprtTest, expected_score, run_sprt
+from chessbot.tests.factories import match_record
+
+
+def test_sprt_accepts_and_rejects() -> None:
+    """Lopsided pairs cross the upper bound; the reverse crosses the lower bound."""
+    settings = SprtSettings(elo0=0, elo1=50, alpha=0.05, beta=0.05)
+    test = SprtTest(settings)
+    assert test.llr() == 0.0 and test.decision() is None
+
+    stronger = SprtTest(settings)
+    weaker = SprtTest(settings)
+    for points in [2, 1.5, 1, 2, 1.5, 2, 1, 2, 1.5, 2] * 3:
+        stronger.add_pair(points)
+        weaker.add_pair(2 - points)
+    assert stronger.decision() == "H1" and stronger.elo() > 100
+    assert weaker.decision() == "H0" and weaker.elo() < -100
+
+
+def test_llr_uses_real_pairs_and_regularizes_only_the_variance() -> None:
+    """N and the mean come from the pairs played; the prior only widens the variance."""
+    settings = SprtSettings(elo0=0, elo1=50, alpha=0.05, beta=0.05)
+    test = SprtTest(settings)
+    for points in [2, 2, 1.5]:
+        test.add_pair(points)
+
+    mean = (1.0 + 1.0 + 0.75) / 3
+    buckets = list(zip([0.5, 0.5, 0.5, 1.5, 2.5], [0.0, 0.25, 0.5, 0.75, 1.0]))
+    prior_mean = sum(count * score for count, score in buckets) / 5.5
+    variance = sum(count * (score - prior_mean) ** 2 for count, score in buckets) / 5.5
+    s0, s1 = expected_score(0), expected_score(50)
+    assert test.llr() == pytest.approx(3 * (s1 - s0) * (2 * mean - s0 - s1) / (2 * variance))
+
+
+def test_run_sprt_stops_early() -> None:
+    """A clearly stronger first bot is accepted long before ``max_pairs``."""
+    first, second = str(uuid4()), str(uuid4())
+    played = []
+
+    def play_round(pairings):
+        records = []
+        for pairing in pairings:
+            played.append(pairing)
+            result = "white" if pairing.white_id == first else "black"
+            records.append(
+                match_record(
+                    UUID(pairing.white_id),
+                    UUID(pairing.black_id),
+                    result if len(played) % 5 else "draw",
+                )
+            )
+        return records
+
+    statuses = []
+    status = run_sprt(
+        first, second, SprtSettings(max_pairs=500), play_round, on_pair=statuses.append
+    )
+    assert status.decision == "H1"
+    assert status.pairs == len(statuses) == len(played) // 2 < 100
+    assert played[0].white_id == first and played[1].white_id == second
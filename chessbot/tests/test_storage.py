@@ -0,0 +1,217 @@
+"""Tests for the SQLite storage backend."""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from chessbot.models import BotCreate, ScheduledGame, Standing, TournamentRecord
+from chessbot.services.sqlite_storage import SQLiteStorage
+from chessbot.services.storage import MatchCursor, Storage
+from chessbot.tests.factories import match_record
+
+
+def test_sqlite_storage_round_trip(tmp_path) -> None:
+    """Records survive reopening the database and list newest first."""
+    path = str(tmp_path / "chessbot.db")
+    store = SQLiteStorage(path)
+    white = store.create_bot(BotCreate(name="A", command=["a"]))
+    black = store.create_bot(BotCreate(name="B", command=["b"], protocol="session"))
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    older = match_record(white.id, black.id, created_at=base, moves=["e2e4"])
+    newer = match_record(black.id, white.id, created_at=base + timedelta(seconds=1))
+    store.save_match(older)
+    store.save_match(newer)
+    tournament = TournamentRecord(
+        id=uuid4(),
+        name="Cup",
+        bot_ids=[white.id, black.id],
+        rounds=1,
+        move_timeout_s=1.0,
+        max_moves=10,
+        matches=[older.id],
+        standings=[Standing(bot_id=white.id, name="A", wins=1, losses=0, draws=0, points=1)],
+        created_at=base,
+    )
+    store.save_tournament(tournament)
+    store.close()
+
+    reopened = SQLiteStorage(path)
+    assert reopened.get_bot(black.id).protocol == "session"
+    assert reopened.has_bot(white.id)
+    assert not reopened.has_bot(uuid4())
+    assert [m.id for m in reopened.list_matches(limit=10)] == [newer.id, older.id]
+    assert [m.id for m in reopened.list_matches(limit=1, offset=1)] == [older.id]
+    assert set(reopened.match_ids()) == {older.id, newer.id}
+    assert reopened.get_tournament(tournament.id) == tournament
+    assert reopened.claim_tournament(tournament.id, None, "run-2")
+    assert not reopened.claim_tournament(tournament.id, None, "run-3")
+    assert reopened.claim_tournament(tournament.id, "run-2", "run-2")
+    assert reopened.get_tournament(tournament.id).runner == "run-2"
+    assert reopened.get_match(older.id) == older
+    with pytest.raises(KeyError):
+        reopened.get_match(uuid4())
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_tournament_checkpoints_write_only_the_changed_games(tmp_path, backend: str) -> None:
+    """Checkpoints update progress and single schedule games on top of the last save."""
+    path = str(tmp_path / "chessbot.db")
+    store = Storage() if backend == "memory" else SQLiteStorage(path)
+    white, black = uuid4(), uuid4()
+    tournament = TournamentRecord(
+        id=uuid4(),
+        name="Cup",
+        bot_ids=[white, black],
+        rounds=2,
+        move_timeout_s=1.0,
+        max_moves=10,
+        matches=[],
+        standings=[],
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        schedule=[ScheduledGame(white_id=white, black_id=black) for _game in range(3)],
+    )
+    store.save_tournament(tournament)
+
+    played = uuid4()
+    tournament.schedule[1].match_id = played
+    tournament.schedule.append(ScheduledGame(white_id=black, black_id=white))
+    tournament.matches.append(played)
+    tournament.completed_matches = 1
+    store.checkpoint_tournament(tournament, [1, 3])
+    if backend == "sqlite":
+        store.close()
+        store = SQLiteStorage(path)
+
+    stored = store.get_tournament(tournament.id)
+    assert stored.schedule == tournament.schedule
+    assert stored.matches == [played]
+    assert stored.completed_matches == 1
+    assert store.list_tournaments() == [stored]
+
+    del tournament.schedule[2:]
+    store.checkpoint_tournament(tournament, [])
+    assert [game.match_id for game in store.get_tournament(tournament.id).schedule] == [
+        None,
+        played,
+    ]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_bot_match_summaries_reach_past_other_bots_games(tmp_path, backend: str) -> None:
+    """A bot's newest matches are found however many other games came after them."""
+    store = Storage() if backend == "memory" else SQLiteStorage(str(tmp_path / "chessbot.db"))
+    bot, rival, other = (
+        store.create_bot(BotCreate(name=name, command=["x"])).id for name in ("A", "B", "C")
+    )
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    played = [
+        match_record(bot, rival, created_at=base),
+        match_record(rival, bot, created_at=base + timedelta(seconds=1)),
+        match_record(bot, bot, created_at=base + timedelta(seconds=2)),
+    ]
+    for record in played:
+        store.save_match(record)
+    for second in range(5):
+        created_at = base + timedelta(seconds=10 + second)
+        store.save_match(match_record(rival, other, created_at=created_at))
+    played[0].created_at = base + timedelta(seconds=3)
+    store.save_match(played[0])
+
+    newest = [played[0].id, played[2].id, played[1].id]
+    assert [s.id for s in store.list_bot_match_summaries(bot, limit=10)] == newest
+    assert [s.id for s in store.list_bot_match_summaries(bot, limit=2)] == newest[:2]
+    assert store.list_bot_match_summaries(uuid4(), limit=10) == []
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_leaderboard_totals_match_full_recompute(tmp_path, backend: str) -> None:
+    """Running totals agree with a rebuild, including forfeits and re-saved matches."""
+    store = Storage() if backend == "memory" else SQLiteStorage(str(tmp_path / "lb.db"))
+    a = store.create_bot(BotCreate(name="A", command=["a"]))
+    b = store.create_bot(BotCreate(name="B", command=["b"]))
+    now = datetime.now(timezone.utc)
+    matches = [
+        match_record(a.id, b.id, "white", created_at=now),
+        match_record(a.id, b.id, "draw", created_at=now),
+        match_record(b.id, a.id, "forfeit", winner_id=a.id, created_at=now),
+        match_record(b.id, a.id, "black", created_at=now),
+    ]
+    for match in matches:
+        store.save_match(match)
+    store.save_match(matches[1].model_copy(update={"result": "black"}))
+
+    standings = store.leaderboard()
+    assert [(s.name, s.wins, s.losses, s.draws, s.points) for s in standings] == [
+        ("A", 3, 1, 0, 3.0),
+        ("B", 1, 3, 0, 1.0),
+    ]
+    assert store.rebuild_leaderboard() == standings
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_cursor_pagination_walks_newest_first(tmp_path, backend: str) -> None:
+    """Following cursors visits every match once, newest first, with ties broken by ID."""
+    store = Storage() if backend == "memory" else SQLiteStorage(str(tmp_path / "page.db"))
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    matches = [
+        match_record(uuid4(), uuid4(), created_at=base + timedelta(seconds=i // 2))
+        for i in range(7)
+    ]
+    for match in reversed(matches):
+        store.save_match(match)
+    expected = sorted(matches, key=lambda m: MatchCursor.of(m).sort_key(), reverse=True)
+
+    seen = []
+    cursor = None
+    while page := store.list_matches(limit=3, after=cursor):
+        seen.extend(page)
+        cursor = MatchCursor.parse(str(MatchCursor.of(page[-1])))
+
+    assert [m.id for m in seen] == [m.id for m in expected]
+    assert [m.id for m in store.list_matches(limit=2, offset=3)] == [m.id for m in expected[3:5]]
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_incremental_ratings_match_rebuild(tmp_path, backend: str) -> None:
+    """Ratings updated per saved match agree with a full recompute.
+
+    Re-saving a match must not move it in the rebuild order, and self-play counts
+    as a game for each side.
+    """
+    store = Storage() if backend == "memory" else SQLiteStorage(str(tmp_path / "ratings.db"))
+    a, b, c = (store.create_bot(BotCreate(name=name, command=["x"])) for name in "ABC")
+    now = datetime.now(timezone.utc)
+    matches = [
+        match_record(
+            white.id,
+            black.id,
+            result,
+            winner_id=winner_id,
+            created_at=now + timedelta(seconds=index),
+        )
+        for index, (white, black, result, winner_id) in enumerate(
+            [
+                (a, b, "white", None),
+                (b, c, "draw", None),
+                (c, a, "forfeit", a.id),
+                (a, c, "black", None),
+                (b, a, "flag", b.id),
+                (c, c, "draw", None),
+            ]
+        )
+    ]
+    for match in matches:
+        store.save_match(match)
+    store.save_match(matches[0])
+
+    ratings = store.ratings()
+    assert [r.games for r in ratings] and sum(r.games for r in ratings) == 12
+    rebuilt = store.rebuild_ratings()
+    assert [r.name for r in rebuilt] == [r.name for r in ratings]
+    for incremental, full in zip(ratings, rebuilt):
+        assert full.games == incremental.games
+        assert full.elo == pytest.approx(incremental.elo)
+        assert full.rating == pytest.approx(incremental.rating)
+        assert full.rd == pytest.approx(incremental.rd)
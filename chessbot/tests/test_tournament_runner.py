@@ -0,0 +1,92 @@
+"""Tests for parallel tournament execution."""
+from __future__ import annotations
+
+import threading
+import time
+from uuid import uuid4
+
+import pytest
+
+from chessbot.models import MatchRecord
+from chessbot.services.durations import DurationEstimator
+from chessbot.services.scheduler import Pairing
+from chessbot.services.tournament_runner import run_pairings
+from chessbot.tests.factories import match_record, match_summary
+
+
+def _record(pairing: Pairing) -> MatchRecord:
+    """A finished game that carries its pairing's bot names in ``moves``."""
+    return match_record(uuid4(), uuid4(), moves=[pairing.white_id, pairing.black_id])
+
+
+def test_run_pairings_keeps_pairing_order() -> None:
+    """Records come back in pairing order even when later games finish first."""
+    pairings = [Pairing(white_id=str(i), black_id="x") for i in range(6)]
+    completed: list[int] = []
+
+    def play(pairing: Pairing) -> MatchRecord:
+        time.sleep(0.02 * (6 - int(pairing.white_id)))
+        return _record(pairing)
+
+    records = run_pairings(
+        pairings, play, workers=6, on_result=lambda index, _record: completed.append(index)
+    )
+
+    assert [record.moves[0] for record in records] == [str(i) for i in range(6)]
+    assert sorted(completed) == list(range(6))
+    assert completed != list(range(6))
+
+
+def test_run_pairings_dispatches_longest_expected_first() -> None:
+    """An estimate reorders dispatch but not the returned records."""
+    pairings = [Pairing(white_id=str(i), black_id="x") for i in range(5)]
+    expected = {"0": 1.0, "1": 5.0, "2": 3.0, "3": 5.0, "4": 0.0}
+    started: list[str] = []
+
+    def play(pairing: Pairing) -> MatchRecord:
+        started.append(pairing.white_id)
+        return _record(pairing)
+
+    records = run_pairings(
+        pairings, play, workers=1, estimate=lambda pairing: expected[pairing.white_id]
+    )
+
+    assert started == ["1", "3", "2", "0", "4"]
+    assert [record.moves[0] for record in records] == [str(i) for i in range(5)]
+
+
+def test_failure_still_reports_games_that_were_already_running() -> None:
+    """A game still running when another one fails finishes into ``on_result``."""
+    pairings = [Pairing(white_id=str(i), black_id="x") for i in range(2)]
+    running = threading.Event()
+    reported: list[int] = []
+
+    def play(pairing: Pairing) -> MatchRecord:
+        if pairing.white_id == "0":
+            assert running.wait(timeout=2)
+            raise RuntimeError("bot crashed")
+        running.set()
+        time.sleep(0.1)
+        return _record(pairing)
+
+    with pytest.raises(RuntimeError, match="bot crashed"):
+        run_pairings(pairings, play, workers=2, on_result=lambda index, _r: reported.append(index))
+    assert reported == [1]
+
+
+def test_duration_estimates_prefer_pair_history_then_bot_means() -> None:
+    """Pair history wins, then the mean of each bot's games, then the overall mean."""
+    a, b, c, d = (uuid4() for _ in range(4))
+    estimate = DurationEstimator(
+        [
+            match_summary(a, b, duration_s=10.0),
+            match_summary(b, a, duration_s=20.0),
+            match_summary(a, c, duration_s=30.0),
+        ]
+    )
+
+    assert estimate(Pairing(str(b), str(a))) == 15.0
+    assert estimate(Pairing(str(b), str(c))) == (15.0 + 30.0) / 2
+    assert estimate(Pairing(str(c), str(d))) == 30.0
+    assert estimate(Pairing(str(d), str(uuid4()))) == 20.0
+    assert DurationEstimator([])(Pairing(str(a), str(b))) == 0.0
@@ -1,38 +1,91 @@
 """FastAPI application for the chess bot platform."""
 from __future__ import annotations
 
+import dataclasses
+import functools
+import json
 import logging
+import os
+import random
+import threading
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Literal, Optional
 from uuid import UUID, uuid4
 
-from fastapi import BackgroundTasks, FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, PlainTextResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 from chessbot.models import (
+    BatchCreate,
+    BatchRecord,
     BotCreate,
+    BotPerfReport,
     BotRecord,
+    LeaseFailure,
+    LeaseRequest,
+    MatchAssignment,
     MatchCreate,
+    MatchJob,
     MatchRecord,
+    MatchSummary,
+    Rating,
+    ScheduledGame,
+    SprtStatus,
     Standing,
     TournamentCreate,
     TournamentRecord,
 )
-from chessbot.services.match_runner import BotConfig, MatchConfig, run_match
-from chessbot.services.scheduler import round_robin
+from chessbot.services.batches import batch_pairings, gauntlet_scores
+from chessbot.services.durations import history_estimator
+from chessbot.services.events import (
+    ACTIVITY_CHANNEL,
+    EVENTS,
+    Subscription,
+    match_channel,
+    tournament_channel,
+)
+from chessbot.services.leases import LEASES
+from chessbot.services.match_runner import BotConfig, MatchConfig, run_match, run_match_async
+from chessbot.services.monitoring import QUEUE_DEPTH, REGISTRY
+from chessbot.services.openings import (
+    OpeningSuiteError,
+    OpeningSuiteNotFound,
+    list_suites,
+    load_suite,
+    paired_openings,
+)
+from chessbot.services.perf import PERF_HISTORY_LIMIT, bot_perf_report
+from chessbot.services.scheduler import Pairing, SwissScheduler, round_robin
+from chessbot.services.scoring import white_score
+from chessbot.services.slots import INTERACTIVE_OWNER, SLOTS, batch_owner, tournament_owner
+from chessbot.services.sprt import run_sprt
 from chessbot.services.standings import compute_standings
-from chessbot.services.storage import STORE
+from chessbot.services.storage import STORE, MatchCursor
+from chessbot.services.tournament_runner import run_pairings
+from chessbot.settings import get_settings
 
 LOGGER = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """Clean up after a previous run of the server: fail its jobs, resume its tournaments."""
+    fail_interrupted_jobs(get_settings().runner)
+    if get_settings().resume_tournaments:
+        resume_tournaments()
+    yield
+
+
 APP = FastAPI(
     title="Chess Bot Competition Platform",
     description="A modular chess-bot tournament platform with sandboxed bot execution and web UI",
     version="1.0.0",
+    lifespan=_lifespan,
 )
 
 # Add CORS middleware for API endpoint access
@@ -45,6 +98,7 @@ APP.add_middleware(
 )
 
 STATIC_DIR = Path(__file__).resolve().parents[1] / "static"
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
 
 APP.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
@@ -79,6 +133,67 @@ def health() -> dict:
     return {"status": "ok"}
 
 
+@APP.get("/api/metrics", response_class=PlainTextResponse)
+def get_metrics() -> PlainTextResponse:
+    """Expose in-process metrics in the Prometheus text format."""
+    return PlainTextResponse(REGISTRY.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@APP.get("/api/slots")
+def get_slots() -> dict:
+    """Report match slot capacity and per-owner running and waiting counts."""
+    return SLOTS.snapshot()
+
+
+@APP.post(
+    "/api/worker/leases",
+    response_model=Optional[MatchAssignment],
+    responses={204: {"description": "No match is waiting"}},
+)
+def lease_match(payload: LeaseRequest) -> MatchAssignment | Response:
+    """Lease the next queued tournament match to a remote worker."""
+    assignment = LEASES.lease(payload.worker_id, payload.lease_s)
+    if assignment is None:
+        return Response(status_code=204)
+    return assignment
+
+
+@APP.post("/api/worker/leases/{lease_id}/renew")
+def renew_lease(lease_id: UUID, payload: LeaseRequest) -> dict:
+    """Extend a lease while its match is still being played."""
+    expires_at = LEASES.renew(lease_id, payload.lease_s)
+    if expires_at is None:
+        raise HTTPException(status_code=410, detail="Lease expired")
+    return {"lease_id": lease_id, "expires_at": expires_at}
+
+
+@APP.post("/api/worker/leases/{lease_id}/result")
+def complete_lease(lease_id: UUID, record: MatchRecord) -> dict:
+    """Accept the finished match of a live lease."""
+    try:
+        accepted = LEASES.complete(lease_id, record)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if not accepted:
+        raise HTTPException(status_code=410, detail="Lease expired")
+    return {"lease_id": lease_id, "match_id": record.id}
+
+
+@APP.post("/api/worker/leases/{lease_id}/fail")
+def fail_lease(lease_id: UUID, payload: LeaseFailure) -> dict:
+    """Give back a lease whose match the worker could not play."""
+    requeued = LEASES.fail(lease_id, payload.error)
+    if requeued is None:
+        raise HTTPException(status_code=410, detail="Lease expired")
+    return {"lease_id": lease_id, "requeued": requeued}
+
+
+@APP.get("/api/worker/leases")
+def list_leases() -> dict:
+    """Report queued remote matches and live leases per worker."""
+    return LEASES.snapshot()
+
+
 @APP.get("/api/bots", response_model=list[BotRecord])
 def list_bots() -> list[BotRecord]:
     """List all registered bots."""
@@ -88,36 +203,129 @@ def list_bots() -> list[BotRecord]:
 @APP.post("/api/bots", response_model=BotRecord)
 def create_bot(payload: BotCreate) -> BotRecord:
     """Register a new bot."""
-    return STORE.create_bot(payload)
+    record = STORE.create_bot(payload)
+    EVENTS.publish(ACTIVITY_CHANNEL, "bot_registered", record.model_dump(mode="json"))
+    return record
 
 
-@APP.post("/api/matches", response_model=MatchRecord)
-def create_match(payload: MatchCreate) -> MatchRecord:
-    """Run a single match and store the result."""
+@APP.get("/api/bots/{bot_id}/perf", response_model=BotPerfReport)
+def get_bot_perf(
+    bot_id: UUID,
+    limit: int = Query(100, ge=1, le=1000, description="Newest matches of the bot to include"),
+) -> BotPerfReport:
+    """Move-time percentiles, CPU and peak memory of a bot over its recent matches."""
     try:
-        white_bot = STORE.get_bot(payload.white_bot_id)
-        black_bot = STORE.get_bot(payload.black_bot_id)
+        bot = STORE.get_bot(bot_id)
     except KeyError as exc:
         raise HTTPException(status_code=404, detail="Bot not found") from exc
+    summaries = STORE.list_bot_match_summaries(bot.id, limit=PERF_HISTORY_LIMIT)
+    return bot_perf_report(bot.id, bot.name, summaries, limit)
 
-    result = run_match(
-        white=BotConfig(
-            bot_id=white_bot.id,
-            name=white_bot.name,
-            command=white_bot.command,
-        ),
-        black=BotConfig(
-            bot_id=black_bot.id,
-            name=black_bot.name,
-            command=black_bot.command,
-        ),
-        config=MatchConfig(
-            move_timeout_s=payload.move_timeout_s,
-            max_moves=payload.max_moves,
-        ),
+
+@APP.post(
+    "/api/matches",
+    response_model=None,
+    status_code=202,
+    responses={200: {"model": MatchRecord}, 202: {"model": MatchJob}},
+)
+async def create_match(
+    payload: MatchCreate,
+    background: BackgroundTasks,
+    response: Response,
+    wait: bool = Query(False, description="Play the match within the request"),
+) -> MatchJob | MatchRecord:
+    """Queue a single match and return its job; with ``wait=true`` play it and return it."""
+    _match_bots(payload)
+    if payload.opening_suite:
+        _opening_positions(payload.opening_suite)
+    if wait:
+        response.status_code = 200
+        async with SLOTS.slot_async(INTERACTIVE_OWNER):
+            return await _play_match(payload)
+
+    job = MatchJob(
+        id=uuid4(),
+        request=payload,
+        created_at=datetime.now(timezone.utc),
+        runner=get_settings().runner,
     )
-    STORE.save_match(result.record)
-    return result.record
+    STORE.save_job(job)
+    QUEUE_DEPTH.labels(queue="matches").inc()
+    background.add_task(_run_match_job, job.id)
+    response.headers["Location"] = f"/api/jobs/{job.id}"
+    return job
+
+
+@APP.post(
+    "/api/batches",
+    response_model=BatchRecord,
+    status_code=202,
+    responses={200: {"model": BatchRecord}},
+)
+def create_batch(
+    payload: BatchCreate,
+    background: BackgroundTasks,
+    response: Response,
+    wait: bool = Query(False, description="Play every game within the request"),
+) -> BatchRecord:
+    """Queue a list of pairings or a gauntlet as one job with aggregated results."""
+    if payload.gauntlet is not None:
+        bot_ids = [payload.gauntlet.challenger_id, *payload.gauntlet.opponent_ids]
+    else:
+        bot_ids = [
+            bot_id
+            for pairing in payload.pairings or []
+            for bot_id in (pairing.white_bot_id, pairing.black_bot_id)
+        ]
+    for bot_id in dict.fromkeys(bot_ids):
+        if not STORE.has_bot(bot_id):
+            raise HTTPException(status_code=404, detail=f"Bot {bot_id} not found")
+    if payload.opening_suite:
+        _opening_positions(payload.opening_suite)
+
+    batch = BatchRecord(
+        id=uuid4(),
+        request=payload,
+        total_matches=payload.game_count,
+        created_at=datetime.now(timezone.utc),
+    )
+    STORE.save_batch(batch)
+    if wait:
+        response.status_code = 200
+        _run_batch(batch.id)
+        return STORE.get_batch(batch.id)
+    background.add_task(_run_batch, batch.id)
+    response.headers["Location"] = f"/api/batches/{batch.id}"
+    return batch
+
+
+@APP.get("/api/batches/{batch_id}", response_model=BatchRecord)
+def get_batch(batch_id: UUID) -> BatchRecord:
+    """Return a batch's progress and, once finished, its aggregated results."""
+    try:
+        return STORE.get_batch(batch_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Batch not found") from exc
+
+
+@APP.get("/api/jobs/{job_id}", response_model=MatchJob)
+def get_job(job_id: UUID) -> MatchJob:
+    """Return the status of a queued match."""
+    try:
+        return STORE.get_job(job_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Job not found") from exc
+
+
+@APP.get("/api/jobs/{job_id}/result", response_model=MatchRecord)
+def get_job_result(job_id: UUID) -> MatchRecord:
+    """Return the match played by a completed job."""
+    job = get_job(job_id)
+    if job.status == "failed":
+        raise HTTPException(status_code=409, detail=f"Job failed: {job.error}")
+    if job.match_id is None:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    return STORE.get_match(job.match_id)
 
 
 @APP.get("/api/matches/{match_id}", response_model=MatchRecord)
@@ -131,40 +339,72 @@ def get_match(match_id: UUID) -> MatchRecord:
 
 @APP.get("/api/leaderboard", response_model=list[Standing])
 def get_leaderboard() -> list[Standing]:
-    """Return computed standings across all matches."""
-    if not STORE.matches:
-        return []
-    return compute_standings(STORE.matches.keys())
+    """Return standings across all matches from the running totals."""
+    return STORE.leaderboard()
+
+
+@APP.post("/api/leaderboard/rebuild", response_model=list[Standing])
+def rebuild_leaderboard() -> list[Standing]:
+    """Recompute the leaderboard from every stored match."""
+    return STORE.rebuild_leaderboard()
+
+
+@APP.get("/api/ratings", response_model=list[Rating])
+def get_ratings() -> list[Rating]:
+    """Return Elo and Glicko-2 ratings, best first."""
+    return STORE.ratings()
+
+
+@APP.post("/api/ratings/rebuild", response_model=list[Rating])
+def rebuild_ratings() -> list[Rating]:
+    """Recompute every rating from the full match history."""
+    return STORE.rebuild_ratings()
 
 
 @APP.post("/api/tournaments", response_model=TournamentRecord)
 def create_tournament(payload: TournamentCreate, background: BackgroundTasks) -> TournamentRecord:
     """Create a tournament and schedule matches in the background."""
     for bot_id in payload.bot_ids:
-        if bot_id not in STORE.bots:
+        if not STORE.has_bot(bot_id):
             raise HTTPException(status_code=404, detail=f"Bot {bot_id} not found")
+    if payload.opening_suite:
+        _opening_positions(payload.opening_suite)
 
     tournament_id = uuid4()
     record = TournamentRecord(
         id=tournament_id,
         name=payload.name,
         bot_ids=payload.bot_ids,
+        format=payload.format,
         rounds=payload.rounds,
         move_timeout_s=payload.move_timeout_s,
         max_moves=payload.max_moves,
+        clock_initial_s=payload.clock_initial_s,
+        clock_increment_s=payload.clock_increment_s,
+        sprt=SprtStatus(**payload.sprt.model_dump()) if payload.sprt else None,
+        opening_suite=payload.opening_suite,
+        adjudication=payload.adjudication,
+        priority=payload.priority,
         matches=[],
         standings=[],
         created_at=datetime.now(timezone.utc),
+        runner=get_settings().runner,
     )
     STORE.save_tournament(record)
     background.add_task(_run_tournament, record.id)
     return record
 
 
+@APP.get("/api/openings", response_model=list[str])
+def list_openings() -> list[str]:
+    """List the opening suites available to matches and tournaments."""
+    return list_suites(get_settings().openings_dir)
+
+
 @APP.get("/api/tournaments", response_model=list[TournamentRecord])
 def list_tournaments() -> list[TournamentRecord]:
     """List all tournaments."""
-    return list(STORE.tournaments.values())
+    return STORE.list_tournaments()
 
 
 @APP.get("/api/tournaments/{tournament_id}", response_model=TournamentRecord)
@@ -176,44 +416,559 @@ def get_tournament(tournament_id: UUID) -> TournamentRecord:
         raise HTTPException(status_code=404, detail="Tournament not found") from exc
 
 
-@APP.get("/api/matches", response_model=list[MatchRecord])
-def list_matches(limit: int = 100, offset: int = 0) -> list[MatchRecord]:
-    """List all matches with pagination."""
-    matches = list(STORE.matches.values())
-    # Sort by creation date (newest first)
-    matches.sort(key=lambda m: m.created_at, reverse=True)
-    return matches[offset : offset + limit]
+RECORD_FIELDS = set(MatchRecord.model_fields) | set(MatchRecord.model_computed_fields)
+SUMMARY_FIELDS = set(MatchSummary.model_fields)
+MATCH_FIELDS = RECORD_FIELDS | SUMMARY_FIELDS
+
+
+@APP.get(
+    "/api/matches",
+    response_model=None,
+    responses={200: {"model": list[MatchRecord] | list[MatchSummary]}},
+)
+def list_matches(
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    after: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    fields: Optional[str] = None,
+) -> list[MatchRecord] | list[MatchSummary] | list[dict]:
+    """List matches newest first.
+
+    Pass the ``X-Next-Cursor`` header of one page as ``after`` to fetch the next.
+    Full records include FEN history and PGN, rebuilt by replaying the moves;
+    ``view=summary`` drops those and the moves. ``fields=a,b`` returns only the
+    named fields and reads summaries whenever those cover the request, so no game
+    is replayed unless FEN history or PGN is asked for. Summary fields such as
+    ``move_count`` can be mixed with full-record fields, except under
+    ``view=summary``.
+    """
+    try:
+        cursor = MatchCursor.parse(after) if after else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()} if fields else set()
+    unknown = requested - MATCH_FIELDS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+
+    record_only = requested - SUMMARY_FIELDS
+    if view == "summary" and record_only:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Not in the summary view: {', '.join(sorted(record_only))}",
+        )
+
+    if view == "summary" or (requested and not record_only):
+        matches = STORE.list_match_summaries(limit=limit, offset=offset, after=cursor)
+    else:
+        matches = STORE.list_matches(limit=limit, offset=offset, after=cursor)
+
+    if len(matches) == limit:
+        response.headers["X-Next-Cursor"] = str(MatchCursor.of(matches[-1]))
+    if requested:
+        return [_project_match(match, requested) for match in matches]
+    return matches
+
+
+def _project_match(match: MatchRecord | MatchSummary, fields: set[str]) -> dict:
+    """The requested fields of a match; summary-only ones are derived from a full record."""
+    projected = match.model_dump(mode="json", include=fields)
+    derived = fields - projected.keys()
+    if derived and isinstance(match, MatchRecord):
+        summary = MatchSummary.from_record(match)
+        projected.update(summary.model_dump(mode="json", include=derived))
+    return projected
+
+
+SSE_KEEPALIVE_S = 15.0
+
+
+async def _event_stream(
+    subscription: Subscription,
+    snapshot: Optional[dict] = None,
+    until: tuple[str, ...] = (),
+    finished: bool = False,
+) -> AsyncIterator[str]:
+    """Format the events of ``subscription`` as Server-Sent Events.
+
+    The optional snapshot is sent first; the stream ends right after it when
+    ``finished`` is set, or after any event named in ``until``. Idle streams get a
+    comment line every ``SSE_KEEPALIVE_S`` seconds. Callers subscribe before taking
+    the snapshot, so no event falls between the two.
+    """
+    with subscription:
+        if snapshot is not None:
+            yield _sse("snapshot", snapshot)
+        while not finished:
+            event = await subscription.get(timeout_s=SSE_KEEPALIVE_S)
+            if event is None:
+                yield ": keepalive\n\n"
+                continue
+            yield _sse(event.name, event.data)
+            if event.name in until:
+                return
+
+
+def _sse(name: str, data: dict) -> str:
+    """Encode one Server-Sent Event."""
+    return f"event: {name}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def _sse_response(stream: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap an event stream in a non-buffered streaming response."""
+    return StreamingResponse(
+        stream,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@APP.get("/api/live")
+def list_live_matches() -> list[dict]:
+    """Snapshots of the matches currently being played."""
+    return EVENTS.live_matches()
+
+
+@APP.get("/api/live/{match_id}")
+def get_live_match(match_id: UUID) -> dict:
+    """Snapshot of one match that is still being played."""
+    snapshot = EVENTS.live_match(match_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Match not live")
+    return snapshot
+
+
+@APP.get("/api/events")
+async def activity_events() -> StreamingResponse:
+    """Stream bot registrations, match starts/ends and tournament progress."""
+    return _sse_response(_event_stream(EVENTS.subscribe(ACTIVITY_CHANNEL)))
+
+
+@APP.get("/api/matches/{match_id}/events")
+async def match_events(match_id: UUID) -> StreamingResponse:
+    """Stream each move, FEN and clock state of a live match until it ends.
+
+    For a match that already finished, a single ``snapshot`` with its summary is sent.
+    """
+    subscription = EVENTS.subscribe(match_channel(match_id))
+    snapshot = EVENTS.live_match(match_id)
+    finished = False
+    if snapshot is None:
+        try:
+            match = STORE.get_match(match_id)
+        except KeyError as exc:
+            EVENTS.unsubscribe(subscription)
+            raise HTTPException(status_code=404, detail="Match not found") from exc
+        snapshot = MatchSummary.from_record(match).model_dump(mode="json")
+        finished = True
+    stream = _event_stream(subscription, snapshot, until=("end", "abort"), finished=finished)
+    return _sse_response(stream)
+
+
+@APP.get("/api/tournaments/{tournament_id}/events")
+async def tournament_events(tournament_id: UUID) -> StreamingResponse:
+    """Stream progress events of a tournament until it completes or fails."""
+    subscription = EVENTS.subscribe(tournament_channel(tournament_id))
+    try:
+        tournament = STORE.get_tournament(tournament_id)
+    except KeyError as exc:
+        EVENTS.unsubscribe(subscription)
+        raise HTTPException(status_code=404, detail="Tournament not found") from exc
+    snapshot = tournament.model_dump(
+        mode="json", include={"id", "status", "completed_matches", "total_matches"}
+    )
+    stream = _event_stream(
+        subscription,
+        snapshot,
+        until=("completed", "failed"),
+        finished=tournament.status in ("completed", "failed"),
+    )
+    return _sse_response(stream)
+
+
+def _bot_config(bot: BotRecord) -> BotConfig:
+    """Build the match-runner config for a stored bot."""
+    return BotConfig(
+        bot_id=bot.id,
+        name=bot.name,
+        command=bot.command,
+        protocol=bot.protocol,
+        send_clock=bot.send_clock,
+        fork_server=get_settings().fork_server,
+    )
 
 
 def _run_tournament(tournament_id: UUID) -> None:
     """Background runner for tournaments."""
     tournament = STORE.get_tournament(tournament_id)
-    pairings = round_robin([str(bot_id) for bot_id in tournament.bot_ids], tournament.rounds)
-
-    for pairing in pairings:
-        white_bot = STORE.get_bot(UUID(pairing.white_id))
-        black_bot = STORE.get_bot(UUID(pairing.black_id))
-        result = run_match(
-            white=BotConfig(
-                bot_id=white_bot.id,
-                name=white_bot.name,
-                command=white_bot.command,
-            ),
-            black=BotConfig(
-                bot_id=black_bot.id,
-                name=black_bot.name,
-                command=black_bot.command,
-            ),
-            config=MatchConfig(
-                move_timeout_s=tournament.move_timeout_s,
-                max_moves=tournament.max_moves,
-            ),
+    bot_ids = [str(bot_id) for bot_id in tournament.bot_ids]
+    openings = (
+        load_suite(get_settings().openings_dir, tournament.opening_suite)
+        if tournament.opening_suite
+        else []
+    )
+    config = MatchConfig(
+        move_timeout_s=tournament.move_timeout_s,
+        max_moves=tournament.max_moves,
+        clock_initial_s=tournament.clock_initial_s,
+        clock_increment_s=tournament.clock_increment_s,
+        adjudication=tournament.adjudication,
+    )
+
+    owner = tournament_owner(tournament.id)
+    workers = get_settings().tournament_workers
+    # Match history is read once per tournament, and only if a round can use it.
+    estimator = functools.cache(history_estimator)
+
+    def play(pairing: Pairing) -> MatchRecord:
+        record = _play_pairing(pairing, config, owner, tournament.priority, tournament.id)
+        record.tournament_id = tournament.id
+        return record
+
+    finished: list[MatchRecord | None] = []
+    schedule = tournament.schedule
+    tournament.matches = []
+    tournament.completed_matches = 0
+
+    def play_round(pairings: list[Pairing]) -> list[MatchRecord]:
+        """Play a round, reusing games the checkpointed schedule already finished."""
+        offset = len(finished)
+        finished.extend([None] * len(pairings))
+        todo: list[int] = []
+        for index, pairing in enumerate(pairings, start=offset):
+            game = _scheduled_game(pairing)
+            if index < len(schedule) and schedule[index].model_dump(exclude={"match_id"}) == (
+                game.model_dump(exclude={"match_id"})
+            ):
+                record = _checkpointed_match(schedule[index].match_id)
+                if record is not None:
+                    finished[index] = record
+                    tournament.matches.append(record.id)
+                    tournament.completed_matches += 1
+                    continue
+                schedule[index].match_id = None
+            else:
+                # A different pairing invalidates the rest of the old schedule.
+                del schedule[index:]
+                schedule.append(game)
+            todo.append(index)
+        STORE.checkpoint_tournament(tournament, todo)
+
+        def on_result(position: int, record: MatchRecord) -> None:
+            _store_match(record)
+            index = todo[position]
+            finished[index] = record
+            schedule[index].match_id = record.id
+            tournament.matches.append(record.id)
+            tournament.completed_matches += 1
+            STORE.checkpoint_tournament(tournament, [index])
+            _publish_progress(tournament, "progress", match_id=str(record.id))
+            LOGGER.info(
+                "Tournament progress",
+                extra={
+                    "tournament": str(tournament.id),
+                    "completed": tournament.completed_matches,
+                    "total": tournament.total_matches,
+                },
+            )
+
+        remaining = [pairings[index - offset] for index in todo]
+        run_pairings(
+            remaining,
+            play,
+            workers=workers,
+            on_result=on_result,
+            estimate=estimator() if len(remaining) > workers else None,
         )
-        STORE.save_match(result.record)
-        tournament.matches.append(result.record.id)
+        return finished[offset:]
+
+    tournament.status = "running"
+    try:
+        if tournament.format == "swiss":
+            swiss = SwissScheduler(bot_ids)
+            games_per_pairing = 2 if openings else 1
+            tournament.total_matches = tournament.rounds * (len(bot_ids) // 2) * games_per_pairing
+            STORE.save_tournament(tournament)
+            for _round in range(tournament.rounds):
+                pairings = swiss.next_round()
+                if openings:
+                    pairings = paired_openings(pairings, openings, offset=len(finished) // 2)
+                for pairing, record in zip(pairings, play_round(pairings)):
+                    swiss.record_result(pairing, white_score(record))
+        elif tournament.format == "sprt":
+            tournament.total_matches = 2 * tournament.sprt.max_pairs
+            STORE.save_tournament(tournament)
+
+            def on_pair(status: SprtStatus) -> None:
+                tournament.sprt = status
+                if status.decision is not None:
+                    tournament.total_matches = tournament.completed_matches
+                STORE.checkpoint_tournament(tournament, [])
+                _publish_progress(tournament, "progress", sprt=status.model_dump(mode="json"))
+
+            run_sprt(bot_ids[0], bot_ids[1], tournament.sprt, play_round, on_pair, openings)
+        else:
+            pairings = round_robin(bot_ids, tournament.rounds)
+            if openings:
+                pairings = paired_openings(pairings, openings)
+            tournament.total_matches = len(pairings)
+            STORE.save_tournament(tournament)
+            play_round(pairings)
+    except Exception as exc:  # a failed tournament reports why and keeps its finished games
+        LOGGER.exception("Tournament failed", extra={"tournament": str(tournament.id)})
+        tournament.status = "failed"
+        tournament.error = str(exc)
+    else:
+        tournament.status = "completed"
 
+    tournament.matches = [record.id for record in finished if record is not None]
     tournament.standings = compute_standings(tournament.matches)
     STORE.save_tournament(tournament)
+    _publish_progress(tournament, tournament.status)
+
+
+def _play_pairing(
+    pairing: Pairing,
+    config: MatchConfig,
+    owner: str,
+    priority: int,
+    tournament_id: UUID | None = None,
+) -> MatchRecord:
+    """Play one scheduled game under a match slot, or on a remote worker."""
+    white_bot = STORE.get_bot(UUID(pairing.white_id))
+    black_bot = STORE.get_bot(UUID(pairing.black_id))
+    match_config = dataclasses.replace(config, start_fen=pairing.start_fen)
+    if get_settings().match_execution == "remote":
+        return LEASES.submit(white_bot, black_bot, match_config, tournament_id).result()
+    with SLOTS.slot(owner, priority):
+        return run_match(
+            _bot_config(white_bot),
+            _bot_config(black_bot),
+            match_config,
+            observer=EVENTS.observe_match,
+        ).record
+
+
+def _run_batch(batch_id: UUID) -> None:
+    """Background runner for a match batch: play every game, then aggregate."""
+    batch = STORE.get_batch(batch_id)
+    request = batch.request
+    config = MatchConfig(
+        move_timeout_s=request.move_timeout_s,
+        max_moves=request.max_moves,
+        clock_initial_s=request.clock_initial_s,
+        clock_increment_s=request.clock_increment_s,
+        adjudication=request.adjudication,
+    )
+    owner = batch_owner(batch.id)
+    finished: list[MatchRecord | None] = []
+
+    def on_result(index: int, record: MatchRecord) -> None:
+        _store_match(record)
+        finished[index] = record
+        batch.matches = [match.id for match in finished if match is not None]
+        batch.completed_matches += 1
+        STORE.save_batch(batch)
+
+    batch.status = "running"
+    batch.started_at = datetime.now(timezone.utc)
+    STORE.save_batch(batch)
+    try:
+        positions = (
+            load_suite(get_settings().openings_dir, request.opening_suite)
+            if request.opening_suite
+            else []
+        )
+        pairings = batch_pairings(request, positions)
+        finished.extend([None] * len(pairings))
+        workers = get_settings().tournament_workers
+        run_pairings(
+            pairings,
+            lambda pairing: _play_pairing(pairing, config, owner, request.priority),
+            workers=workers,
+            on_result=on_result,
+            # Dispatch order only matters when some games have to wait.
+            estimate=history_estimator() if len(pairings) > workers else None,
+        )
+    except Exception as exc:  # a failed batch reports why and keeps its finished games
+        LOGGER.exception("Match batch failed", extra={"batch_id": str(batch_id)})
+        batch.status = "failed"
+        batch.error = str(exc)
+    else:
+        batch.status = "completed"
+    batch.standings = compute_standings(batch.matches)
+    if request.gauntlet is not None:
+        records = [match for match in finished if match is not None]
+        batch.opponents = gauntlet_scores(
+            request.gauntlet.challenger_id, records, lambda bot_id: STORE.get_bot(bot_id).name
+        )
+    batch.finished_at = datetime.now(timezone.utc)
+    STORE.save_batch(batch)
+
+
+def _scheduled_game(pairing: Pairing) -> ScheduledGame:
+    """Checkpoint entry for a pairing that has not been played yet."""
+    return ScheduledGame(
+        white_id=UUID(pairing.white_id),
+        black_id=UUID(pairing.black_id),
+        start_fen=pairing.start_fen,
+    )
+
+
+def _checkpointed_match(match_id: UUID | None) -> MatchRecord | None:
+    """The stored match of a finished checkpointed game, if it is still there."""
+    if match_id is None:
+        return None
+    try:
+        return STORE.get_match(match_id)
+    except KeyError:
+        return None
+
+
+def resume_tournaments() -> list[UUID]:
+    """Restart unfinished tournaments from their checkpoints in background threads.
+
+    Tournaments already run by this boot are skipped. The rest are claimed with a
+    compare-and-set against the runner read here, so when several web workers
+    start together only one of them resumes each tournament.
+    """
+    resumed = []
+    runner = get_settings().runner
+    for tournament in STORE.list_tournaments():
+        if tournament.status in ("completed", "failed") or tournament.runner == runner:
+            continue
+        if not STORE.claim_tournament(tournament.id, tournament.runner, runner):
+            continue
+        LOGGER.info(
+            "Resuming tournament",
+            extra={
+                "tournament": str(tournament.id),
+                "completed": sum(game.match_id is not None for game in tournament.schedule),
+            },
+        )
+        threading.Thread(
+            target=_run_tournament,
+            args=(tournament.id,),
+            name=f"tournament-{tournament.id}",
+            daemon=True,
+        ).start()
+        resumed.append(tournament.id)
+    return resumed
+
+
+def fail_interrupted_jobs(runner: str) -> list[UUID]:
+    """Mark match jobs left queued or running by another server boot as failed.
+
+    Queued jobs live only in the process that accepted them, so after a restart
+    nothing will ever run them. Jobs stamped with ``runner`` belong to a web worker
+    of this boot and are left alone, as ``resume_tournaments`` leaves its
+    tournaments.
+    """
+    failed = []
+    for job in STORE.list_jobs():
+        if job.status not in ("queued", "running") or job.runner == runner:
+            continue
+        job.status = "failed"
+        job.error = "interrupted by a server restart"
+        job.finished_at = datetime.now(timezone.utc)
+        STORE.save_job(job)
+        failed.append(job.id)
+    if failed:
+        LOGGER.warning("Failed interrupted match jobs", extra={"jobs": len(failed)})
+    return failed
+
+
+def _match_bots(payload: MatchCreate) -> tuple[BotRecord, BotRecord]:
+    """Look up both players of a match request."""
+    try:
+        return STORE.get_bot(payload.white_bot_id), STORE.get_bot(payload.black_bot_id)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail="Bot not found") from exc
+
+
+async def _play_match(payload: MatchCreate) -> MatchRecord:
+    """Play a requested match on the event loop and store it."""
+    white_bot, black_bot = _match_bots(payload)
+    start_fen = payload.start_fen
+    if payload.opening_suite:
+        start_fen = random.choice(_opening_positions(payload.opening_suite))
+
+    result = await run_match_async(
+        white=_bot_config(white_bot),
+        black=_bot_config(black_bot),
+        config=MatchConfig(
+            move_timeout_s=payload.move_timeout_s,
+            max_moves=payload.max_moves,
+            clock_initial_s=payload.clock_initial_s,
+            clock_increment_s=payload.clock_increment_s,
+            start_fen=start_fen,
+            adjudication=payload.adjudication,
+        ),
+        observer=EVENTS.observe_match,
+    )
+    _store_match(result.record)
+    return result.record
+
+
+def _store_match(record: MatchRecord) -> None:
+    """Save a finished match, then announce its end to live viewers.
+
+    Viewers fetch the stored match on ``end``, so it is only published once the
+    save is done; it is published even if the save fails, so the match does not
+    stay live forever.
+    """
+    try:
+        STORE.save_match(record)
+    finally:
+        EVENTS.finish_match(record)
+
+
+async def _run_match_job(job_id: UUID) -> None:
+    """Background runner for a queued match."""
+    job = STORE.get_job(job_id)
+    try:
+        async with SLOTS.slot_async(INTERACTIVE_OWNER):
+            QUEUE_DEPTH.labels(queue="matches").dec()
+            job.status = "running"
+            job.started_at = datetime.now(timezone.utc)
+            STORE.save_job(job)
+            record = await _play_match(job.request)
+    except Exception as exc:  # a failed job reports why instead of vanishing
+        LOGGER.exception("Match job failed", extra={"job_id": str(job_id)})
+        job.status = "failed"
+        job.error = exc.detail if isinstance(exc, HTTPException) else str(exc)
+    else:
+        job.status = "completed"
+        job.match_id = record.id
+    job.finished_at = datetime.now(timezone.utc)
+    STORE.save_job(job)
+
+
+def _opening_positions(name: str) -> list[str]:
+    """Load an opening suite for a request, mapping problems to HTTP errors."""
+    try:
+        return load_suite(get_settings().openings_dir, name)
+    except OpeningSuiteNotFound as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except OpeningSuiteError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+
+
+def _publish_progress(tournament: TournamentRecord, name: str, **data: object) -> None:
+    """Publish a tournament progress event to its channel and the activity feed."""
+    payload = {
+        "tournament_id": str(tournament.id),
+        "name": tournament.name,
+        "status": tournament.status,
+        "completed_matches": tournament.completed_matches,
+        "total_matches": tournament.total_matches,
+        **data,
+    }
+    EVENTS.publish(tournament_channel(tournament.id), name, payload)
+    EVENTS.publish(ACTIVITY_CHANNEL, f"tournament_{name}", payload)
 
 
 def custom_openapi():
@@ -228,7 +983,7 @@ def custom_openapi():
         A robust chess-bot tournament platform API with:
         - Bot registration and management
         - Single match execution with sandboxed execution
-        - Round-robin tournament scheduling
+        - Round-robin and Swiss tournament scheduling
         - Match history and leaderboard tracking
         
         All bots are executed in isolated processes with strict resource limits.
@@ -259,8 +1014,17 @@ def main() -> None:
     LOGGER.info("Starting Chess Bot Platform")
     LOGGER.info("Visit http://localhost:8000 for the dashboard")
     LOGGER.info("API docs available at http://localhost:8000/docs")
+    # Web workers inherit one instance and boot ID, so they share tournament claims.
+    os.environ.setdefault("CHESSBOT_INSTANCE_ID", get_settings().instance_id)
+    os.environ.setdefault("CHESSBOT_BOOT_ID", get_settings().boot_id)
     
-    uvicorn.run("chessbot.web.app:APP", host="0.0.0.0", port=8000, reload=False)
+    uvicorn.run(
+        "chessbot.web.app:APP",
+        host="0.0.0.0",
+        port=8000,
+        reload=False,
+        workers=get_settings().web_workers,
+    )
 
 
 if __name__ == "__main__":
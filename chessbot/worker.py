@@ -0,0 +1,227 @@
+"""Remote match worker: leases tournament matches from a server and plays them locally.
+
+Run ``python -m chessbot.worker --server http://host:8000`` on any machine that has
+the bots' files at the same paths as the server. Each worker thread leases one
+match at a time, renews the lease while the game runs, and posts the finished
+record back, or the error when the game could not be played. If the worker dies,
+its leases run out and the server hands the matches to another worker.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import socket
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Optional, Sequence
+
+from chessbot.models import BotRecord, MatchAssignment
+from chessbot.services.match_runner import BotConfig, MatchConfig, run_match
+
+LOGGER = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT_S = 30.0
+RECORD_EXCLUDE = {"fen_history", "pgn", "adjudicated"}
+
+
+class LeaseLost(Exception):
+    """Raised when the server no longer holds the worker's lease."""
+
+
+class MatchWorker:
+    """Lease, play and report matches until stopped."""
+
+    def __init__(
+        self,
+        server: str,
+        worker_id: str,
+        lease_s: float = 60.0,
+        poll_s: float = 1.0,
+        fork_server: bool = False,
+    ) -> None:
+        self.server = server.rstrip("/")
+        self.worker_id = worker_id
+        self.lease_s = lease_s
+        self.poll_s = poll_s
+        self.fork_server = fork_server
+        self.stopped = threading.Event()
+        self.played = 0
+
+    def run(self, max_matches: Optional[int] = None) -> None:
+        """Work until ``stop`` is called or ``max_matches`` have been played."""
+        while not self.stopped.is_set():
+            if max_matches is not None and self.played >= max_matches:
+                return
+            try:
+                assignment = self.lease()
+            except (OSError, ValueError) as exc:
+                LOGGER.warning("Lease request failed: %s", exc)
+                assignment = None
+            if assignment is None:
+                self.stopped.wait(self.poll_s)
+                continue
+            self.play(assignment)
+
+    def stop(self) -> None:
+        """Finish the current match and exit ``run``."""
+        self.stopped.set()
+
+    def lease(self) -> Optional[MatchAssignment]:
+        """Ask the server for a match; None when the queue is empty."""
+        body = self._post("/api/worker/leases", self._lease_request())
+        return MatchAssignment.model_validate_json(body) if body else None
+
+    def play(self, assignment: MatchAssignment) -> None:
+        """Play a leased match, keeping the lease alive, and post the record.
+
+        A game that raises, e.g. because a bot cannot be started, is reported to
+        the server as failed so it can retry or give up on the match.
+        """
+        done = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._renew_until, args=(assignment, done), daemon=True
+        )
+        heartbeat.start()
+        error: Optional[str] = None
+        try:
+            record = run_match(
+                self._bot_config(assignment.white),
+                self._bot_config(assignment.black),
+                MatchConfig(
+                    move_timeout_s=assignment.move_timeout_s,
+                    max_moves=assignment.max_moves,
+                    clock_initial_s=assignment.clock_initial_s,
+                    clock_increment_s=assignment.clock_increment_s,
+                    start_fen=assignment.start_fen,
+                    adjudication=assignment.adjudication,
+                ),
+            ).record
+        except Exception as exc:  # the server decides whether to retry the match
+            LOGGER.exception("Leased match %s failed", assignment.lease_id)
+            error = str(exc) or type(exc).__name__
+        finally:
+            done.set()
+            heartbeat.join()
+        if error is not None:
+            self._report_failure(assignment, error)
+            return
+        try:
+            self._post(
+                f"/api/worker/leases/{assignment.lease_id}/result",
+                record.model_dump_json(exclude=RECORD_EXCLUDE).encode(),
+            )
+        except LeaseLost:
+            LOGGER.warning("Lease %s expired; result discarded", assignment.lease_id)
+            return
+        except OSError as exc:
+            LOGGER.warning("Could not post result for %s: %s", assignment.lease_id, exc)
+            return
+        self.played += 1
+
+    def _report_failure(self, assignment: MatchAssignment, error: str) -> None:
+        """Tell the server a leased match could not be played."""
+        body = json.dumps({"error": error[:2000]}).encode()
+        try:
+            self._post(f"/api/worker/leases/{assignment.lease_id}/fail", body)
+        except LeaseLost:
+            LOGGER.warning("Lease %s expired; failure discarded", assignment.lease_id)
+        except OSError as exc:
+            LOGGER.warning("Could not report failure for %s: %s", assignment.lease_id, exc)
+
+    def _renew_until(self, assignment: MatchAssignment, done: threading.Event) -> None:
+        """Renew the lease every third of its length until the match is over."""
+        while not done.wait(self.lease_s / 3):
+            try:
+                self._post(f"/api/worker/leases/{assignment.lease_id}/renew", self._lease_request())
+            except LeaseLost:
+                LOGGER.warning("Lease %s expired while playing", assignment.lease_id)
+                return
+            except OSError as exc:
+                LOGGER.warning("Lease renewal failed: %s", exc)
+
+    def _bot_config(self, bot: BotRecord) -> BotConfig:
+        """Build the match-runner config for a leased bot."""
+        return BotConfig(
+            bot_id=bot.id,
+            name=bot.name,
+            command=bot.command,
+            protocol=bot.protocol,
+            send_clock=bot.send_clock,
+            fork_server=self.fork_server,
+        )
+
+    def _lease_request(self) -> bytes:
+        """JSON body identifying this worker, shared by lease and renew requests."""
+        return json.dumps({"worker_id": self.worker_id, "lease_s": self.lease_s}).encode()
+
+    def _post(self, path: str, body: bytes) -> bytes:
+        """POST JSON and return the response body; raise LeaseLost on 410."""
+        request = urllib.request.Request(
+            self.server + path,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT_S) as response:
+                return response.read()
+        except urllib.error.HTTPError as exc:
+            if exc.code == 410:
+                raise LeaseLost(path) from exc
+            raise
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--server", required=True, help="API server URL, e.g. http://host:8000")
+    parser.add_argument(
+        "--id", dest="worker_id", default=socket.gethostname(), help="worker name (default: host)"
+    )
+    parser.add_argument("--concurrency", type=int, default=1, help="matches played at once")
+    parser.add_argument("--lease-s", type=float, default=60.0, help="lease length in seconds")
+    parser.add_argument("--poll-s", type=float, default=1.0, help="wait between empty leases")
+    parser.add_argument(
+        "--fork-server", action="store_true", help="fork one-shot Python bots from warm templates"
+    )
+    parser.add_argument("--max-matches", type=int, help="exit after this many matches per thread")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    workers = [
+        MatchWorker(
+            args.server,
+            f"{args.worker_id}/{index}",
+            lease_s=args.lease_s,
+            poll_s=args.poll_s,
+            fork_server=args.fork_server,
+        )
+        for index in range(max(1, args.concurrency))
+    ]
+    threads = [
+        threading.Thread(target=worker.run, args=(args.max_matches,), daemon=True)
+        for worker in workers
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        while any(thread.is_alive() for thread in threads):
+            time.sleep(0.5)
+    except KeyboardInterrupt:
+        LOGGER.info("Stopping after the current matches")
+        for worker in workers:
+            worker.stop()
+        for thread in threads:
+            thread.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
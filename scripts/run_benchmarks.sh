@@ -0,0 +1,10 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Usage: scripts/run_benchmarks.sh [output.json] [baseline.json]
+output="${1:-benchmarks.json}"
+if [[ $# -ge 2 ]]; then
+  python -m chessbot.benchmarks --output "$output" --baseline "$2"
+else
+  python -m chessbot.benchmarks --output "$output"
+fi